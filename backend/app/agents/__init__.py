@@ -11,26 +11,27 @@ Example:
     print(pm_config.name)  # "Alex PM"
 """
 
-from .config import (
-    AgentConfig,
-    AGENTS,
-    get_agent_config,
-    get_all_agents,
-    get_agent_ids,
-    is_valid_agent_id,
-)
-from .base import BaseAgent
-from .interfaces import (
-    Message,
-    Response,
-    ConversationContext,
-    Proposal,
-    Vote,
-    AgentState,
-)
-from .agent_manager import AgentManager
-from .message_router import MessageRouter
+import importlib
 
+# Public name -> submodule providing it; resolved lazily on first access
+_LAZY_ATTRS = {
+    "AgentConfig": ".config",
+    "AGENTS": ".config",
+    "get_agent_config": ".config",
+    "get_all_agents": ".config",
+    "get_agent_ids": ".config",
+    "is_valid_agent_id": ".config",
+    "BaseAgent": ".base",
+    "Message": ".interfaces",
+    "Response": ".interfaces",
+    "ConversationContext": ".interfaces",
+    "Proposal": ".interfaces",
+    "Vote": ".interfaces",
+    "AgentState": ".interfaces",
+    "AgentManager": ".agent_manager",
+    "AgentPool": ".agent_pool",
+    "MessageRouter": ".message_router",
+}
 
 __all__ = [
     "AgentConfig",
@@ -47,5 +48,16 @@ __all__ = [
     "Vote",
     "AgentState",
     "AgentManager",
+    "AgentPool",
     "MessageRouter",
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
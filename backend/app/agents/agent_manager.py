@@ -3,34 +3,37 @@ Agent Manager for the Multi-Agent AI Chat System.
 
 This module is responsible for creating, initializing, and managing agents.
 """
-from typing import Dict, List, Type
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from typing import Collection, ContextManager, Dict, Iterator, List, Type
 
+from app.agents.agent_pool import AgentPool
 from app.agents.base import BaseAgent
 from app.agents.config import get_all_agents, AgentConfig
 from app.services.llm_service import LLMService # Assuming llm_service is in app.services
-from app.agents.specific_agents import (
-    ProjectManagerAgent,
-    TechnicalArchitectAgent,
-    CreativeStrategistAgent,
-    QualityAssuranceAgent,
-    ResourceCoordinatorAgent,
-)
+from app.agents.specific_agents import DefaultAgent
 
-AGENT_ROLE_TO_CLASS: Dict[str, Type[BaseAgent]] = {
-    "Project Manager": ProjectManagerAgent,
-    "Technical Architect": TechnicalArchitectAgent,
-    "Creative Strategist": CreativeStrategistAgent,
-    "Quality Assurance": QualityAssuranceAgent,
-    "Resource Coordinator": ResourceCoordinatorAgent,
-}
+# Maximum number of idle agents kept per configuration for reuse
+DEFAULT_POOL_SIZE = 4
 
 
 class AgentManager:
     """Manages the lifecycle of all agents."""
 
-    def __init__(self, llm_service: LLMService):
+    # The role is carried by each config, so every agent is built from one class.
+    # Override on a subclass to plug in different agent behaviour.
+    agent_class: Type[BaseAgent] = DefaultAgent
+
+    def __init__(self, llm_service: LLMService, pool_size: int = DEFAULT_POOL_SIZE):
         self.llm_service = llm_service
         self.agents: Dict[str, BaseAgent] = self._create_agents()
+        self.pools: Dict[str, AgentPool] = {
+            agent_id: AgentPool(
+                factory=partial(self._create_agent_from_config, agent_id, config),
+                max_size=pool_size,
+            )
+            for agent_id, config in get_all_agents().items()
+        }
 
     def _create_agents(self) -> Dict[str, BaseAgent]:
         """Create all agents from the configuration."""
@@ -42,15 +45,10 @@ class AgentManager:
 
     def _create_agent_from_config(self, agent_id: str, config: AgentConfig) -> BaseAgent:
         """Creates a single agent from its configuration."""
-        agent_class = AGENT_ROLE_TO_CLASS.get(config.role)
-        if not agent_class:
-            raise ValueError(f"Unknown agent role: {config.role}")
-
-        return agent_class(
+        return self.agent_class(
             agent_id=agent_id,
             name=config.name,
             role=config.role,
-            personality_prompt=config.system_prompt, # Simplified for now
             system_prompt=config.system_prompt,
             llm_service=self.llm_service,
         )
@@ -61,6 +59,18 @@ class AgentManager:
             raise KeyError(f"Agent '{agent_id}' not found.")
         return self.agents[agent_id]
 
-    def get_all_agents(self) -> List[BaseAgent]:
-        """Get a list of all agents."""
-        return list(self.agents.values())
+    def pooled_agent(self, agent_id: str) -> ContextManager[BaseAgent]:
+        """Borrow a short-lived agent from the pool for the given agent ID."""
+        if agent_id not in self.pools:
+            raise KeyError(f"Agent '{agent_id}' not found.")
+        return self.pools[agent_id].agent()
+
+    @contextmanager
+    def pooled_agents(self) -> Iterator[List[BaseAgent]]:
+        """Borrow one pooled agent per configured agent for the duration of a ``with`` block."""
+        with ExitStack() as stack:
+            yield [stack.enter_context(self.pooled_agent(agent_id)) for agent_id in self.pools]
+
+    def get_all_agents(self) -> Collection[BaseAgent]:
+        """Get a live, read-only view of all agents."""
+        return self.agents.values()
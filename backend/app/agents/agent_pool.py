@@ -0,0 +1,46 @@
+"""
+Agent Pool for the Multi-Agent AI Chat System.
+
+This module provides a simple object pool that lets short-lived,
+per-conversation agents be reused instead of rebuilt from their
+configuration every time a conversation starts or ends.
+"""
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Iterator
+
+from app.agents.base import BaseAgent
+
+
+class AgentPool:
+    """Bounded pool of reusable agents built from a single configuration."""
+
+    def __init__(self, factory: Callable[[], BaseAgent], max_size: int):
+        self._available: Deque[BaseAgent] = deque()
+        self._factory = factory
+        self._max = max_size
+
+    def acquire(self) -> BaseAgent:
+        """Take an idle agent from the pool, creating a new one if none is available."""
+        if self._available:
+            return self._available.pop()
+        return self._factory()
+
+    def release(self, agent: BaseAgent) -> None:
+        """Reset an agent and return it to the pool, dropping it if the pool is full."""
+        agent.reset()
+        if len(self._available) < self._max:
+            self._available.append(agent)
+
+    @contextmanager
+    def agent(self) -> Iterator[BaseAgent]:
+        """Borrow an agent for the duration of a ``with`` block."""
+        agent = self.acquire()
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    def __len__(self) -> int:
+        """Number of idle agents currently held by the pool."""
+        return len(self._available)
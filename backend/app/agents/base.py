@@ -3,8 +3,9 @@ Abstract base class for all AI agents in the Multi-Agent AI Chat System.
 
 This module defines the common interface that all agents must implement.
 """
+import sys
 from abc import ABC, abstractmethod
-from typing import Optional, TYPE_CHECKING
+from typing import AsyncIterator, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.services.llm_service import LLMService
@@ -21,32 +22,62 @@ from app.agents.interfaces import (
 class BaseAgent(ABC):
     """Abstract base class for all agents."""
 
+    # Agents can be pooled in large numbers; slots drop the per-instance __dict__
+    __slots__ = (
+        "agent_id",
+        "name",
+        "role",
+        "system_prompt",
+        "llm_service",
+        "_system_prefix",
+        "_received_prefix",
+    )
+
     def __init__(
         self,
         agent_id: str,
         name: str,
         role: str,
-        personality_prompt: str,
         system_prompt: str,
         llm_service: "LLMService",
     ):
         self.agent_id = agent_id
         self.name = name
         self.role = role
-        self.personality_prompt = personality_prompt
         self.system_prompt = system_prompt
         self.llm_service = llm_service
+        self._system_prefix = sys.intern(system_prompt + "\n\n")
+        self._received_prefix = f"{name} received: "
+
+    @property
+    def personality_prompt(self) -> str:
+        """Deprecated alias; an agent's personality is defined by its system prompt."""
+        return self.system_prompt
+
+    def reset(self) -> None:
+        """Clear per-conversation state before the agent is reused from a pool."""
+        pass
 
     @abstractmethod
     async def process_message(self, message: Message) -> Response:
         """Process an incoming message and return a response."""
         pass
 
+    @abstractmethod
+    def build_prompt(self, context: ConversationContext) -> str:
+        """Build the LLM prompt for the given context without calling the LLM."""
+        pass
+
     @abstractmethod
     async def generate_response(self, context: ConversationContext) -> str:
         """Generate a response based on the conversation context."""
         pass
 
+    @abstractmethod
+    def generate_response_stream(self, context: ConversationContext) -> AsyncIterator[str]:
+        """Stream a response based on the conversation context, chunk by chunk."""
+        pass
+
     @abstractmethod
     async def vote_on_proposal(self, proposal: Proposal) -> Vote:
         """Vote on a given proposal."""
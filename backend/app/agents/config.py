@@ -4,9 +4,12 @@ Static agent configuration for Multi-Agent AI Chat System.
 This module defines the AI agents that participate in conversations,
 including their roles, personalities, and system prompts.
 """
-from typing import Dict, List
+import functools
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AgentConfig(BaseModel):
@@ -21,6 +24,8 @@ class AgentConfig(BaseModel):
         expertise_areas (List[str]): Areas of expertise for this agent
     """
     
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     name: str
     role: str
     system_prompt: str
@@ -28,12 +33,20 @@ class AgentConfig(BaseModel):
     expertise_areas: List[str]
 
 
-# Static agent configurations
-AGENTS: Dict[str, AgentConfig] = {
-    "project_manager": AgentConfig(
-        name="Alex PM",
-        role="Project Manager",
-        system_prompt="""You are Alex, a skilled Project Manager facilitating this multi-agent discussion. 
+# Static agent configurations, built lazily so importing the package stays cheap
+@functools.cache
+def _load_agents() -> Dict[str, AgentConfig]:
+    """
+    Build the static agent configurations on first use.
+    
+    The values below are developer-authored constants, so they are built
+    with ``model_construct`` and skip runtime validation.
+    """
+    agents = {
+        "project_manager": AgentConfig.model_construct(
+            name="Alex PM",
+            role="Project Manager",
+            system_prompt="""You are Alex, a skilled Project Manager facilitating this multi-agent discussion. 
 
 Your responsibilities:
 - Guide the conversation toward the goal
@@ -50,26 +63,26 @@ Communication style:
 - Use phrases like "Let me clarify..." or "Based on our discussion..."
 
 When you need user input, clearly state what information you need and why it's important for the project's success.""",
-        personality_traits=[
-            "diplomatic",
-            "organized",
-            "goal-oriented",
-            "collaborative",
-            "systematic"
-        ],
-        expertise_areas=[
-            "project_planning",
-            "stakeholder_management", 
-            "requirements_gathering",
-            "team_coordination",
-            "risk_assessment"
-        ]
-    ),
-    
-    "technical_architect": AgentConfig(
-        name="Sam Tech",
-        role="Technical Architect",
-        system_prompt="""You are Sam, an experienced Technical Architect with deep knowledge of system design and implementation.
+            personality_traits=[
+                "diplomatic",
+                "organized",
+                "goal-oriented",
+                "collaborative",
+                "systematic"
+            ],
+            expertise_areas=[
+                "project_planning",
+                "stakeholder_management", 
+                "requirements_gathering",
+                "team_coordination",
+                "risk_assessment"
+            ]
+        ),
+        
+        "technical_architect": AgentConfig.model_construct(
+            name="Sam Tech",
+            role="Technical Architect",
+            system_prompt="""You are Sam, an experienced Technical Architect with deep knowledge of system design and implementation.
 
 Your responsibilities:
 - Evaluate technical feasibility of proposals
@@ -87,26 +100,26 @@ Communication style:
 - Use phrases like "From a technical perspective..." or "The architecture should consider..."
 
 Focus on practical, implementable solutions that align with best practices and the project's constraints.""",
-        personality_traits=[
-            "analytical",
-            "detail-oriented", 
-            "innovative",
-            "practical",
-            "thorough"
-        ],
-        expertise_areas=[
-            "software_architecture",
-            "system_design",
-            "technology_selection",
-            "performance_optimization",
-            "security_design"
-        ]
-    ),
-    
-    "creative_strategist": AgentConfig(
-        name="Jordan Creative",
-        role="Creative Strategist", 
-        system_prompt="""You are Jordan, a Creative Strategist who brings innovative thinking and fresh perspectives to problem-solving.
+            personality_traits=[
+                "analytical",
+                "detail-oriented", 
+                "innovative",
+                "practical",
+                "thorough"
+            ],
+            expertise_areas=[
+                "software_architecture",
+                "system_design",
+                "technology_selection",
+                "performance_optimization",
+                "security_design"
+            ]
+        ),
+        
+        "creative_strategist": AgentConfig.model_construct(
+            name="Jordan Creative",
+            role="Creative Strategist", 
+            system_prompt="""You are Jordan, a Creative Strategist who brings innovative thinking and fresh perspectives to problem-solving.
 
 Your responsibilities:
 - Generate creative and unconventional solutions
@@ -124,26 +137,26 @@ Communication style:
 - Use phrases like "Here's a creative approach..." or "What if we reimagined..."
 
 Push the team to consider bold, user-centered solutions that could differentiate the project in meaningful ways.""",
-        personality_traits=[
-            "imaginative",
-            "optimistic",
-            "unconventional",
-            "user-focused",
-            "inspiring"
-        ],
-        expertise_areas=[
-            "design_thinking",
-            "user_experience",
-            "innovation_methods",
-            "creative_problem_solving",
-            "market_differentiation"
-        ]
-    ),
-    
-    "quality_assurance": AgentConfig(
-        name="Casey QA",
-        role="Quality Assurance",
-        system_prompt="""You are Casey, a meticulous Quality Assurance specialist focused on identifying risks, edge cases, and ensuring robust solutions.
+            personality_traits=[
+                "imaginative",
+                "optimistic",
+                "unconventional",
+                "user-focused",
+                "inspiring"
+            ],
+            expertise_areas=[
+                "design_thinking",
+                "user_experience",
+                "innovation_methods",
+                "creative_problem_solving",
+                "market_differentiation"
+            ]
+        ),
+        
+        "quality_assurance": AgentConfig.model_construct(
+            name="Casey QA",
+            role="Quality Assurance",
+            system_prompt="""You are Casey, a meticulous Quality Assurance specialist focused on identifying risks, edge cases, and ensuring robust solutions.
 
 Your responsibilities:
 - Identify potential issues and risks
@@ -161,26 +174,26 @@ Communication style:
 - Focus on "How might this fail?" scenarios
 
 Help the team build robust, reliable solutions by surfacing important considerations others might miss.""",
-        personality_traits=[
-            "cautious",
-            "thorough",
-            "analytical",
-            "detail-focused",
-            "quality-driven"
-        ],
-        expertise_areas=[
-            "quality_assurance",
-            "risk_assessment",
-            "testing_strategies",
-            "compliance",
-            "validation_methods"
-        ]
-    ),
-    
-    "resource_coordinator": AgentConfig(
-        name="Riley Resource",
-        role="Resource Coordinator",
-        system_prompt="""You are Riley, a practical Resource Coordinator focused on feasibility, constraints, and efficient resource allocation.
+            personality_traits=[
+                "cautious",
+                "thorough",
+                "analytical",
+                "detail-focused",
+                "quality-driven"
+            ],
+            expertise_areas=[
+                "quality_assurance",
+                "risk_assessment",
+                "testing_strategies",
+                "compliance",
+                "validation_methods"
+            ]
+        ),
+        
+        "resource_coordinator": AgentConfig.model_construct(
+            name="Riley Resource",
+            role="Resource Coordinator",
+            system_prompt="""You are Riley, a practical Resource Coordinator focused on feasibility, constraints, and efficient resource allocation.
 
 Your responsibilities:
 - Assess resource requirements (time, budget, people)
@@ -198,22 +211,41 @@ Communication style:
 - Keep discussions grounded in reality
 
 Help the team create solutions that are not only innovative but also practically achievable within real-world constraints.""",
-        personality_traits=[
-            "practical",
-            "realistic",
-            "efficient",
-            "constraint-aware",
-            "implementation-focused"
-        ],
-        expertise_areas=[
-            "resource_planning",
-            "budget_management",
-            "timeline_estimation",
-            "operational_efficiency",
-            "constraint_analysis"
-        ]
-    )
-}
+            personality_traits=[
+                "practical",
+                "realistic",
+                "efficient",
+                "constraint-aware",
+                "implementation-focused"
+            ],
+            expertise_areas=[
+                "resource_planning",
+                "budget_management",
+                "timeline_estimation",
+                "operational_efficiency",
+                "constraint_analysis"
+            ]
+        )
+    }
+    
+    # Agents keep references to these prompts for their whole lifetime
+    for config in agents.values():
+        object.__setattr__(config, "system_prompt", sys.intern(config.system_prompt))
+    
+    return agents
+
+
+@functools.cache
+def _agents_view() -> Mapping[str, AgentConfig]:
+    """Read-only view handed out to callers; the configs are static so no copy is needed."""
+    return MappingProxyType(_load_agents())
+
+
+def __getattr__(name: str):
+    """Expose ``AGENTS`` as a lazily built module attribute."""
+    if name == "AGENTS":
+        return _load_agents()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_agent_config(agent_id: str) -> AgentConfig:
@@ -229,22 +261,24 @@ def get_agent_config(agent_id: str) -> AgentConfig:
     Raises:
         KeyError: If agent_id is not found
     """
-    if agent_id not in AGENTS:
-        raise KeyError(f"Agent '{agent_id}' not found. Available agents: {list(AGENTS.keys())}")
+    agents = _load_agents()
+    if agent_id not in agents:
+        raise KeyError(f"Agent '{agent_id}' not found. Available agents: {list(agents.keys())}")
     
-    return AGENTS[agent_id]
+    return agents[agent_id]
 
 
-def get_all_agents() -> Dict[str, AgentConfig]:
-    """Get all available agent configurations."""
-    return AGENTS.copy()
+def get_all_agents() -> Mapping[str, AgentConfig]:
+    """Get a read-only view of all available agent configurations."""
+    return _agents_view()
 
 
-def get_agent_ids() -> List[str]:
-    """Get list of all available agent IDs."""
-    return list(AGENTS.keys())
+@functools.cache
+def get_agent_ids() -> Tuple[str, ...]:
+    """Get all available agent IDs (cached, as the configuration is static)."""
+    return tuple(_load_agents().keys())
 
 
 def is_valid_agent_id(agent_id: str) -> bool:
     """Check if an agent ID is valid."""
-    return agent_id in AGENTS
+    return agent_id in _load_agents()
@@ -1,36 +1,160 @@
 """
 Data interfaces for the Multi-Agent AI Chat System.
 
-This module defines the Pydantic models used for communication and data
+This module defines the data structures used for communication and data
 exchange between agents, the conversation manager, and other services.
+
+Messages, responses and conversation contexts are created on every agent
+turn from trusted, internally produced data, so they are plain slotted
+dataclasses rather than Pydantic models to avoid validation overhead.
 """
-from typing import List, Dict, Any, Optional
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Dict, Any, Optional, Union
 from pydantic import BaseModel, Field
-from enum import Enum
+from enum import IntEnum
 import uuid
 
-class ConversationPhase(str, Enum):
-    """Represents the different phases of a conversation."""
-    INITIALIZATION = "initialization"
-    EXPLORATION = "exploration"
-    DISCUSSION = "discussion"
-    CONSENSUS = "consensus"
-    COMPLETED = "completed"
+class ConversationPhase(IntEnum):
+    """
+    Represents the different phases of a conversation.
+
+    Phases are compared on every loop iteration, so they are integers; use
+    ``label`` where the human-readable name is needed.
+    """
+    INITIALIZATION = 0
+    EXPLORATION = 1
+    DISCUSSION = 2
+    CONSENSUS = 3
+    COMPLETED = 4
+
+    @property
+    def label(self) -> str:
+        """Lowercase phase name, e.g. ``"initialization"``."""
+        return self.name.lower()
 
 
-class Message(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Message:
     """Represents a single message in a conversation."""
     content: str
     sender: str # agent_id or 'user'
 
-class Response(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Response:
     """Represents a response from an agent."""
     content: str
 
-class ConversationContext(BaseModel):
-    """Holds the context of the conversation for an agent."""
-    conversation_history: List[Message]
+# Messages kept verbatim in a conversation's history; older ones are condensed
+HISTORY_WINDOW = 50
+# Characters of each condensed message, and of the whole condensed summary
+SUMMARY_LINE_CHARS = 200
+SUMMARY_CHARS = 4000
+
+
+def format_message(message: Message) -> str:
+    """Formats a message as a ``sender: content`` history line."""
+    return f"{message.sender}: {message.content}"
+
+
+class ConversationHistory:
+    """
+    The most recent messages of a conversation plus a summary of older ones.
+
+    At most ``window`` messages are kept verbatim. A message pushed out of
+    the window is condensed to one truncated line of ``summary``, and the
+    summary keeps only its newest ``summary_chars`` characters, so the
+    rendered history, and every prompt built from it, stays bounded however
+    long the conversation runs.
+    """
+
+    __slots__ = ("messages", "summary", "summary_chars", "total")
+
+    def __init__(self, messages: Iterable[Message] = (), window: int = HISTORY_WINDOW, summary_chars: int = SUMMARY_CHARS):
+        self.messages: Deque[Message] = deque(maxlen=window)
+        self.summary = ""
+        self.summary_chars = summary_chars
+        # Messages ever appended, including those condensed into the summary
+        self.total = 0
+        for message in messages:
+            self.append(message)
+
+    def append(self, message: Message) -> None:
+        """Adds a message, condensing the oldest one if the window is full."""
+        messages = self.messages
+        if len(messages) == messages.maxlen:
+            self._condense(messages[0])
+        messages.append(message)
+        self.total += 1
+
+    @property
+    def dropped(self) -> int:
+        """Number of messages condensed into the summary."""
+        return self.total - len(self.messages)
+
+    def _condense(self, message: Message) -> None:
+        """Folds a message leaving the window into the summary."""
+        line = format_message(message)
+        if len(line) > SUMMARY_LINE_CHARS:
+            line = line[:SUMMARY_LINE_CHARS - 1] + "…"
+        summary = f"{self.summary}\n{line}" if self.summary else line
+        if len(summary) > self.summary_chars:
+            # Keep the newest lines that fit
+            summary = summary[-self.summary_chars:]
+            summary = summary[summary.find("\n") + 1:]
+        self.summary = summary
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self.messages)
+
+    def __getitem__(self, index: int) -> Message:
+        return self.messages[index]
+
+@dataclass(slots=True)
+class ConversationContext:
+    """
+    Holds the context of the conversation for an agent.
+
+    A plain list of messages is wrapped in a ``ConversationHistory``, whose
+    summary is rendered ahead of the messages still in its window.
+    """
+    conversation_history: Union[ConversationHistory, List[Message]]
     current_goal: str
+    rendered_prefix: str = ""
+    rendered_upto: int = 0
+    rendered_dropped: int = 0
+
+    def __post_init__(self):
+        if not isinstance(self.conversation_history, ConversationHistory):
+            self.conversation_history = ConversationHistory(self.conversation_history)
+
+    def render(self) -> str:
+        """Renders the conversation history, formatting only messages added since the last call."""
+        history = self.conversation_history
+        new_count = history.total - self.rendered_upto
+        if new_count:
+            dropped = history.dropped
+            if dropped != self.rendered_dropped:
+                # Rendered messages left the window: rebuild from the summary
+                lines = [history.summary] if history.summary else []
+                lines.extend(map(format_message, history))
+                self.rendered_prefix = "\n".join(lines)
+                self.rendered_dropped = dropped
+            else:
+                new_messages = islice(history.messages, len(history) - new_count, None)
+                tail = "\n".join(map(format_message, new_messages))
+                self.rendered_prefix = f"{self.rendered_prefix}\n{tail}" if self.rendered_upto else tail
+            self.rendered_upto = history.total
+        return self.rendered_prefix
+
+    @property
+    def rendered_history(self) -> str:
+        """The rendered history, shared by every agent reading this context on a turn."""
+        return self.render()
 
 class Proposal(BaseModel):
     """Represents a proposed solution or idea."""
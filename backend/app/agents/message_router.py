@@ -4,43 +4,125 @@ Message Router for the Multi-Agent AI Chat System.
 This module is responsible for routing messages between agents and other
 components of the system.
 """
-from typing import List
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from app.agents.base import BaseAgent
+from app.agents.interfaces import ConversationContext, Message
+
+if TYPE_CHECKING:
+    from app.models.conversation import Conversation
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on in-flight agent LLM calls; keeps fan-out below provider rate limits
+DEFAULT_MAX_CONCURRENCY = 8
+# Conversations whose recipient lists are kept; the oldest entry is dropped first
+DEFAULT_MAX_CACHED_CONVERSATIONS = 256
 
-from app.agents.interfaces import Message
-from app.models.conversation import Conversation # Assuming conversation model exists
 
 class MessageRouter:
     """Routes messages to the appropriate destination."""
 
-    def __init__(self, conversation_manager: 'ConversationManager'):
+    def __init__(
+        self,
+        conversation_manager: 'ConversationManager',
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_cached_conversations: int = DEFAULT_MAX_CACHED_CONVERSATIONS,
+    ):
         self.conversation_manager = conversation_manager
+        self.max_concurrency = max_concurrency
+        self.max_cached_conversations = max_cached_conversations
+        self._sem = asyncio.Semaphore(max_concurrency)
+        # conversation_id -> (roster, sender agent_id -> agents that should receive
+        # its messages); the None key holds the full roster. Rosters change far
+        # less often than messages, and a changed roster rebuilds the lists.
+        self._recipients_by_sender: Dict[
+            Any, Tuple[Tuple[BaseAgent, ...], Dict[Optional[str], Tuple[BaseAgent, ...]]]
+        ] = {}
 
-    async def route_message(self, message: Message, conversation: Conversation):
+    async def route_message(self, message: Message, conversation: "Conversation"):
         """Routes a message to the appropriate agent or service."""
         # This is a simplified implementation. A real implementation would have
         # more complex routing logic based on the message type, conversation
         # state, and other factors.
 
-        if message.sender == 'user':
-            # If the message is from the user, it might be a response to a question
-            # from an agent, or it could be a new instruction.
-            # For now, we'll just broadcast it to all agents.
-            await self.broadcast_to_agents(message, conversation)
-        else:
-            # If the message is from an agent, it might be a response to another
-            # agent, a question to the user, or a proposal.
-            # For now, we'll just broadcast it to all other agents.
-            await self.broadcast_to_other_agents(message, conversation)
-
-    async def broadcast_to_agents(self, message: Message, conversation: Conversation):
-        """Broadcasts a message to all agents in a conversation."""
-        agents = self.conversation_manager.get_agents_in_conversation(conversation.id)
-        for agent in agents:
-            await agent.process_message(message)
-
-    async def broadcast_to_other_agents(self, message: Message, conversation: Conversation):
-        """Broadcasts a message to all agents in a conversation except the sender."""
-        agents = self.conversation_manager.get_agents_in_conversation(conversation.id)
-        for agent in agents:
-            if agent.agent_id != message.sender:
-                await agent.process_message(message)
+        # Messages from the user go to every agent, while messages from an agent
+        # go to all other agents. get_recipients only excludes senders that are
+        # agents in the conversation, so one lookup covers both cases.
+        await self._dispatch(message, self.get_recipients(conversation.id, message.sender))
+
+    async def broadcast_to_agents(self, message: Message, conversation: "Conversation"):
+        """Broadcasts a message to all agents in a conversation.
+
+        Kept for callers that need an explicit target set; prefer ``route_message``.
+        """
+        await self._dispatch(message, self.get_recipients(conversation.id))
+
+    async def broadcast_to_other_agents(self, message: Message, conversation: "Conversation"):
+        """Broadcasts a message to all agents in a conversation except the sender.
+
+        Kept for callers that need an explicit target set; prefer ``route_message``.
+        """
+        await self._dispatch(message, self.get_recipients(conversation.id, message.sender))
+
+    def get_recipients(self, conversation_id: Any, sender: Optional[str] = None) -> Tuple[BaseAgent, ...]:
+        """Returns the agents in a conversation, excluding ``sender`` if it is one of them."""
+        agents = tuple(self.conversation_manager.get_agents_in_conversation(conversation_id))
+        cached = self._recipients_by_sender.get(conversation_id)
+        if cached is None or cached[0] != agents:
+            recipients = {None: agents}
+            for agent in agents:
+                recipients[agent.agent_id] = tuple(
+                    other for other in agents if other.agent_id != agent.agent_id
+                )
+            if cached is None and len(self._recipients_by_sender) >= self.max_cached_conversations:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del self._recipients_by_sender[next(iter(self._recipients_by_sender))]
+            cached = self._recipients_by_sender[conversation_id] = (agents, recipients)
+        return cached[1].get(sender, agents)
+
+    def invalidate_recipients(self, conversation_id: Any) -> None:
+        """Drops the cached recipient lists of a conversation; call when it ends."""
+        self._recipients_by_sender.pop(conversation_id, None)
+
+    async def generate_turn(
+        self, context: ConversationContext, conversation: "Conversation"
+    ) -> List[Tuple[BaseAgent, str]]:
+        """
+        Generates one response per agent for the same turn.
+
+        All agents in a conversation share the same LLM service, so their
+        prompts go to it as one batch. Each prompt's request holds the
+        router's semaphore, so a turn never exceeds ``max_concurrency``
+        in-flight LLM calls. Use ``BaseAgent.generate_response`` for
+        out-of-turn replies.
+        """
+        agents = self.get_recipients(conversation.id)
+        if not agents:
+            return []
+
+        prompts = [agent.build_prompt(context) for agent in agents]
+        responses = await agents[0].llm_service.generate_batch(prompts, self._sem)
+        return list(zip(agents, responses))
+
+    async def _dispatch(self, message: Message, agents: Iterable[BaseAgent]):
+        """Delivers a message to the given agents concurrently."""
+        agents = list(agents)
+        # Agents are I/O bound on their LLM calls, so let them run side by side.
+        # A failing agent must not cancel delivery to the others.
+        results = await asyncio.gather(
+            *(self._process_with_limit(agent, message) for agent in agents),
+            return_exceptions=True,
+        )
+        for agent, result in zip(agents, results):
+            if isinstance(result, Exception):
+                logger.error(f"Agent {agent.agent_id} failed to process message: {result}")
+        return results
+
+    async def _process_with_limit(self, agent: BaseAgent, message: Message):
+        """Runs a single agent's processing while holding the concurrency semaphore."""
+        async with self._sem:
+            return await agent.process_message(message)
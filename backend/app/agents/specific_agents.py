@@ -1,6 +1,13 @@
 """
 Concrete implementations of the AI agents for the Multi-Agent AI Chat System.
+
+All roles currently share the same behaviour; the role and personality of an
+agent are carried by its configuration (name, role and system prompt), so a
+single concrete class serves every agent. Add a role-specific subclass of
+``DefaultAgent`` only when a role needs genuinely different logic.
 """
+from typing import AsyncIterator
+
 from app.agents.base import BaseAgent
 from app.agents.interfaces import (
     Message,
@@ -10,91 +17,35 @@ from app.agents.interfaces import (
     Vote,
     AgentState,
 )
+from app.services.response_validator import ResponseValidator
 
-class ProjectManagerAgent(BaseAgent):
-    async def process_message(self, message: Message) -> Response:
-        # Simple echo for now
-        return Response(content=f"{self.name} received: {message.content}")
-
-    async def generate_response(self, context: ConversationContext) -> str:
-        prompt = self.system_prompt + "\n\n" + "\n".join([f"{m.sender}: {m.content}" for m in context.conversation_history])
-        response = await self.llm_service.generate_response(prompt)
-        return response
-
-    async def vote_on_proposal(self, proposal: Proposal) -> Vote:
-        # Placeholder logic
-        return Vote(proposal_id=proposal.id, agent_id=self.agent_id, approve=True)
+# Stateless, so one validator serves every agent
+_response_validator = ResponseValidator()
 
-    def validate_response(self, response: str) -> bool:
-        return len(response) > 0
+class DefaultAgent(BaseAgent):
+    """Concrete agent used for every configured role."""
 
-    def get_agent_state(self) -> AgentState:
-        return AgentState(agent_id=self.agent_id, is_active=True)
-
-class TechnicalArchitectAgent(BaseAgent):
-    async def process_message(self, message: Message) -> Response:
-        return Response(content=f"{self.name} received: {message.content}")
-
-    async def generate_response(self, context: ConversationContext) -> str:
-        prompt = self.system_prompt + "\n\n" + "\n".join([f"{m.sender}: {m.content}" for m in context.conversation_history])
-        response = await self.llm_service.generate_response(prompt)
-        return response
-
-    async def vote_on_proposal(self, proposal: Proposal) -> Vote:
-        return Vote(proposal_id=proposal.id, agent_id=self.agent_id, approve=True)
-
-    def validate_response(self, response: str) -> bool:
-        return len(response) > 0
-
-    def get_agent_state(self) -> AgentState:
-        return AgentState(agent_id=self.agent_id, is_active=True)
+    __slots__ = ()
 
-class CreativeStrategistAgent(BaseAgent):
     async def process_message(self, message: Message) -> Response:
-        return Response(content=f"{self.name} received: {message.content}")
-
-    async def generate_response(self, context: ConversationContext) -> str:
-        prompt = self.system_prompt + "\n\n" + "\n".join([f"{m.sender}: {m.content}" for m in context.conversation_history])
-        response = await self.llm_service.generate_response(prompt)
-        return response
-
-    async def vote_on_proposal(self, proposal: Proposal) -> Vote:
-        return Vote(proposal_id=proposal.id, agent_id=self.agent_id, approve=True)
-
-    def validate_response(self, response: str) -> bool:
-        return len(response) > 0
-
-    def get_agent_state(self) -> AgentState:
-        return AgentState(agent_id=self.agent_id, is_active=True)
+        # Simple echo for now
+        return Response(content=self._received_prefix + message.content)
 
-class QualityAssuranceAgent(BaseAgent):
-    async def process_message(self, message: Message) -> Response:
-        return Response(content=f"{self.name} received: {message.content}")
+    def build_prompt(self, context: ConversationContext) -> str:
+        return self._system_prefix + context.rendered_history
 
     async def generate_response(self, context: ConversationContext) -> str:
-        prompt = self.system_prompt + "\n\n" + "\n".join([f"{m.sender}: {m.content}" for m in context.conversation_history])
-        response = await self.llm_service.generate_response(prompt)
-        return response
+        # Collect the stream so streamed and whole replies share one generation path
+        response = "".join([chunk async for chunk in self.generate_response_stream(context)])
+        return _response_validator.clean_and_validate(response)
 
-    async def vote_on_proposal(self, proposal: Proposal) -> Vote:
-        return Vote(proposal_id=proposal.id, agent_id=self.agent_id, approve=True)
-
-    def validate_response(self, response: str) -> bool:
-        return len(response) > 0
-
-    def get_agent_state(self) -> AgentState:
-        return AgentState(agent_id=self.agent_id, is_active=True)
-
-class ResourceCoordinatorAgent(BaseAgent):
-    async def process_message(self, message: Message) -> Response:
-        return Response(content=f"{self.name} received: {message.content}")
-
-    async def generate_response(self, context: ConversationContext) -> str:
-        prompt = self.system_prompt + "\n\n" + "\n".join([f"{m.sender}: {m.content}" for m in context.conversation_history])
-        response = await self.llm_service.generate_response(prompt)
-        return response
+    async def generate_response_stream(self, context: ConversationContext) -> AsyncIterator[str]:
+        prompt = self.build_prompt(context)
+        async for chunk in self.llm_service.generate_response_stream(prompt):
+            yield chunk
 
     async def vote_on_proposal(self, proposal: Proposal) -> Vote:
+        # Placeholder logic
         return Vote(proposal_id=proposal.id, agent_id=self.agent_id, approve=True)
 
     def validate_response(self, response: str) -> bool:
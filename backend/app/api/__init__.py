@@ -14,10 +14,19 @@ Example:
     app.include_router(websockets.router, prefix="/ws")
 """
 
-from . import conversations, agents, websockets
+import importlib
 
 __all__ = [
     "conversations",
     "agents", 
     "websockets",
 ]
+
+
+def __getattr__(name):
+    """Import route modules on first access (PEP 562) to keep package import cheap."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,44 +4,59 @@ Agents API endpoints for Multi-Agent AI Chat System.
 This module provides REST API endpoints for accessing information
 about available AI agents and their configurations.
 """
-from fastapi import APIRouter, HTTPException
+from typing import Dict
 
-from ..agents import get_agent_config, get_all_agents, get_agent_ids, is_valid_agent_id
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from ..agents import get_agent_config, get_all_agents, get_agent_ids
 from ..schemas import AgentInfo, AgentList
+from .static_response import StaticJSON
 
 
 router = APIRouter()
 
 
+def _build_agent_info(agent_id: str) -> AgentInfo:
+    """Build the public agent information for a configured agent."""
+    config = get_agent_config(agent_id)
+    
+    return AgentInfo(
+        id=agent_id,
+        name=config.name,
+        role=config.role,
+        personality_traits=config.personality_traits,
+        expertise_areas=config.expertise_areas
+    )
+
+
+# Agent configurations are static, so the responses are serialized once at import
+_CACHED_AGENT_INFOS: Dict[str, AgentInfo] = {
+    agent_id: _build_agent_info(agent_id) for agent_id in get_all_agents()
+}
+_CACHED_AGENT_RESPONSES: Dict[str, StaticJSON] = {
+    agent_id: StaticJSON(info.model_dump(mode="json")) for agent_id, info in _CACHED_AGENT_INFOS.items()
+}
+_CACHED_AGENT_LIST = StaticJSON(
+    AgentList(
+        agents=list(_CACHED_AGENT_INFOS.values()),
+        count=len(_CACHED_AGENT_INFOS)
+    ).model_dump(mode="json")
+)
+
+
 @router.get("/agents", response_model=AgentList)
-async def list_agents() -> AgentList:
+async def list_agents(request: Request) -> Response:
     """
     List all available AI agents.
     
     Returns:
         List of all configured agents with their information
     """
-    all_agents = get_all_agents()
-    
-    agent_infos = [
-        AgentInfo(
-            id=agent_id,
-            name=config.name,
-            role=config.role,
-            personality_traits=config.personality_traits,
-            expertise_areas=config.expertise_areas
-        )
-        for agent_id, config in all_agents.items()
-    ]
-    
-    return AgentList(
-        agents=agent_infos,
-        count=len(agent_infos)
-    )
+    return _CACHED_AGENT_LIST.response(request)
 
 
 @router.get("/agents/{agent_id}", response_model=AgentInfo)
-async def get_agent_details(agent_id: str) -> AgentInfo:
+async def get_agent_details(agent_id: str, request: Request) -> Response:
     """
     Get detailed information about a specific agent.
     
@@ -54,19 +69,13 @@ async def get_agent_details(agent_id: str) -> AgentInfo:
     Raises:
         HTTPException: If agent is not found
     """
-    if not is_valid_agent_id(agent_id):
-        available_agents = get_agent_ids()
+    agent_response = _CACHED_AGENT_RESPONSES.get(agent_id)
+    
+    if agent_response is None:
+        available_agents = list(get_agent_ids())
         raise HTTPException(
             status_code=404,
             detail=f"Agent '{agent_id}' not found. Available agents: {available_agents}"
         )
     
-    config = get_agent_config(agent_id)
-    
-    return AgentInfo(
-        id=agent_id,
-        name=config.name,
-        role=config.role,
-        personality_traits=config.personality_traits,
-        expertise_areas=config.expertise_areas
-    )
+    return agent_response.response(request)
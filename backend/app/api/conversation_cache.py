@@ -0,0 +1,54 @@
+"""
+Conversation existence cache for Multi-Agent AI Chat System.
+
+Endpoints that only need to know that a conversation exists consult this
+in-process cache before querying the database. Only positive lookups are
+cached, so deleting a conversation must discard its entry.
+"""
+import time
+import uuid
+from typing import Dict
+
+
+class ConversationCache:
+    """
+    Time-bounded set of conversation IDs known to exist.
+
+    Entries expire after ``ttl`` seconds so deletions made by other
+    processes are picked up; the cache is cleared once it reaches
+    ``max_size`` entries.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        # conversation_id -> monotonic expiry time
+        self._expiry: Dict[uuid.UUID, float] = {}
+
+    def contains(self, conversation_id: uuid.UUID) -> bool:
+        """Check whether a conversation was recently confirmed to exist."""
+        expires = self._expiry.get(conversation_id)
+        if expires is None:
+            return False
+        if expires <= time.monotonic():
+            del self._expiry[conversation_id]
+            return False
+        return True
+
+    def add(self, conversation_id: uuid.UUID) -> None:
+        """Record that a conversation exists."""
+        if len(self._expiry) >= self.max_size:
+            self._expiry.clear()
+        self._expiry[conversation_id] = time.monotonic() + self.ttl
+
+    def discard(self, conversation_id: uuid.UUID) -> None:
+        """Forget a conversation, e.g. after it has been deleted."""
+        self._expiry.pop(conversation_id, None)
+
+    def clear(self) -> None:
+        """Forget all conversations."""
+        self._expiry.clear()
+
+
+# Global conversation cache instance
+conversation_cache = ConversationCache()
@@ -4,13 +4,20 @@ Conversation API endpoints for Multi-Agent AI Chat System.
 This module provides REST API endpoints for managing conversations,
 including creating, reading, updating, and managing conversation messages.
 """
+import asyncio
+import logging
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel
+from sqlalchemy import Select, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from ..db import get_db
+from ..db.queries import MESSAGE_COUNT, select_conversation_with_count
+from .conversation_cache import conversation_cache
 from ..models import Conversation, ConversationStatus, Message, MessageType, SenderType
 from ..schemas import (
     ConversationCreate,
@@ -24,14 +31,91 @@ from ..schemas import (
 )
 
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Discussions started through the API; referenced here so they are not
+# garbage collected while running
+_running_discussions: Set[asyncio.Task] = set()
+
+
+def _discussion_done(task: asyncio.Task) -> None:
+    """Forget a finished discussion task and log it if it failed."""
+    _running_discussions.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Conversation discussion failed: {task.exception()}")
+
+
+def _json_response(schema: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize a response schema straight to JSON bytes.
+    
+    Returning a response directly skips FastAPI's second validation and
+    jsonable_encoder pass. The schema's serializer is built on first use
+    (the schemas set ``defer_build``) and reused after that; it writes the
+    JSON in pydantic-core without an intermediate dict.
+    
+    Args:
+        schema: Validated response schema
+        status_code: HTTP status code of the response
+        
+    Returns:
+        JSON response for the schema
+    """
+    return Response(content=schema.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
+async def _page_total(db: AsyncSession, rows: list, skip: int, count_query: Select) -> int:
+    """
+    Get the filtered total for a page of rows selected with a window count.
+    
+    Every returned row carries the total, so the count query only runs for
+    an empty page past the end of the results.
+    
+    Args:
+        db: Database session
+        rows: Page rows, each with a ``total`` column
+        skip: Number of rows skipped before the page
+        count_query: COUNT(*) over the same filters, without pagination
+        
+    Returns:
+        Total number of rows matching the filters
+    """
+    if rows:
+        return rows[0].total
+    if not skip:
+        return 0
+    return await db.scalar(count_query)
+
+
+async def _ensure_conversation_exists(db: AsyncSession, conversation_id: uuid.UUID) -> None:
+    """
+    Verify that a conversation exists, skipping the query on a recent hit.
+    
+    Args:
+        db: Database session
+        conversation_id: Unique conversation identifier
+        
+    Raises:
+        HTTPException: If conversation is not found
+    """
+    if conversation_cache.contains(conversation_id):
+        return
+    
+    found = await db.scalar(
+        select(select(literal(1)).where(Conversation.id == conversation_id).exists())
+    )
+    if not found:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    
+    conversation_cache.add(conversation_id)
+
 
 @router.post("/conversations", response_model=ConversationResponse, status_code=201)
 async def create_conversation(
     conversation_data: ConversationCreate,
-    db: Session = Depends(get_db)
-) -> ConversationResponse:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Create a new conversation.
     
@@ -42,26 +126,21 @@ async def create_conversation(
     Returns:
         Created conversation information
     """
-    # Create new conversation
+    # Create new conversation; starting with an empty, loaded messages
+    # collection lets message_count be read without a lazy load
     conversation = Conversation(
         goal_description=conversation_data.goal_description,
-        status=ConversationStatus.ACTIVE
+        status=ConversationStatus.ACTIVE,
+        messages=[]
     )
     
+    # Generated columns come back via INSERT ... RETURNING and stay loaded
+    # after commit, so no refresh is needed
     db.add(conversation)
-    db.commit()
-    db.refresh(conversation)
-    
-    return ConversationResponse(
-        id=conversation.id,
-        goal_description=conversation.goal_description,
-        status=conversation.status,
-        final_summary=conversation.final_summary,
-        created_at=conversation.created_at,
-        updated_at=conversation.updated_at,
-        message_count=conversation.message_count,
-        is_waiting_for_user=conversation.is_waiting_for_user
-    )
+    await db.commit()
+    conversation_cache.add(conversation.id)
+    
+    return _json_response(ConversationResponse.from_orm_fast(conversation), status_code=201)
 
 
 @router.get("/conversations", response_model=ConversationList)
@@ -69,8 +148,8 @@ async def list_conversations(
     skip: int = Query(0, ge=0, description="Number of conversations to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of conversations to return"),
     status: Optional[ConversationStatus] = Query(None, description="Filter by conversation status"),
-    db: Session = Depends(get_db)
-) -> ConversationList:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     List conversations with optional filtering and pagination.
     
@@ -83,45 +162,37 @@ async def list_conversations(
     Returns:
         List of conversations
     """
-    # Build query
-    query = db.query(Conversation)
-    
-    if status:
-        query = query.filter(Conversation.status == status)
-    
-    # Get total count
-    total_count = query.count()
+    # Build query; the window count returns the filtered total on every row,
+    # and the correlated subquery counts messages without loading them
+    filters = [Conversation.status == status] if status else []
+    query = select(Conversation, MESSAGE_COUNT, func.count().over().label("total")).where(*filters)
     
     # Apply pagination and ordering
-    conversations = query.order_by(Conversation.updated_at.desc()).offset(skip).limit(limit).all()
-    
-    # Convert to response format
-    conversation_responses = [
-        ConversationResponse(
-            id=conv.id,
-            goal_description=conv.goal_description,
-            status=conv.status,
-            final_summary=conv.final_summary,
-            created_at=conv.created_at,
-            updated_at=conv.updated_at,
-            message_count=conv.message_count,
-            is_waiting_for_user=conv.is_waiting_for_user
-        )
-        for conv in conversations
+    result = await db.execute(
+        query.order_by(Conversation.updated_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = result.all()
+    conversations = [
+        ConversationResponse.from_orm_fast(row.Conversation, row.message_count) for row in rows
     ]
+    total_count = await _page_total(
+        db, rows, skip, select(func.count()).select_from(Conversation).where(*filters)
+    )
     
-    return ConversationList(
-        conversations=conversation_responses,
+    return _json_response(ConversationList.model_construct(
+        conversations=conversations,
         count=total_count
-    )
+    ))
 
 
 @router.get("/conversations/{conversation_id}", response_model=ConversationDetail)
 async def get_conversation(
     conversation_id: uuid.UUID,
     include_messages: bool = Query(True, description="Whether to include messages"),
-    db: Session = Depends(get_db)
-) -> ConversationDetail:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Get detailed information about a specific conversation.
     
@@ -136,51 +207,31 @@ async def get_conversation(
     Raises:
         HTTPException: If conversation is not found
     """
-    # Find conversation
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    # Find conversation, loading its messages in one extra query instead of
+    # lazily; without messages only their count is needed
+    if include_messages:
+        conversation = await db.get(
+            Conversation, conversation_id, options=[selectinload(Conversation.messages)]
+        )
+        message_count = None
+    else:
+        row = (await db.execute(select_conversation_with_count(conversation_id))).first()
+        conversation, message_count = row if row else (None, None)
     
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
-    # Convert messages to response format
-    message_responses = []
-    if include_messages:
-        for msg in conversation.messages:
-            message_responses.append(MessageResponse(
-                id=msg.id,
-                conversation_id=msg.conversation_id,
-                sender_type=msg.sender_type,
-                sender_id=msg.sender_id,
-                content=msg.content,
-                message_type=msg.message_type,
-                parent_message_id=msg.parent_message_id,
-                requires_user_response=msg.requires_user_response,
-                created_at=msg.created_at,
-                agent_name=msg.agent_name,
-                is_from_agent=msg.is_from_agent,
-                is_from_user=msg.is_from_user,
-                is_question_for_user=msg.is_question_for_user
-            ))
-    
-    return ConversationDetail(
-        id=conversation.id,
-        goal_description=conversation.goal_description,
-        status=conversation.status,
-        final_summary=conversation.final_summary,
-        created_at=conversation.created_at,
-        updated_at=conversation.updated_at,
-        message_count=conversation.message_count,
-        is_waiting_for_user=conversation.is_waiting_for_user,
-        messages=message_responses
-    )
+    return _json_response(ConversationDetail.from_orm_fast(
+        conversation, include_messages=include_messages, message_count=message_count
+    ))
 
 
 @router.put("/conversations/{conversation_id}", response_model=ConversationResponse)
 async def update_conversation(
     conversation_id: uuid.UUID,
     update_data: ConversationUpdate,
-    db: Session = Depends(get_db)
-) -> ConversationResponse:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Update conversation status or summary.
     
@@ -195,11 +246,12 @@ async def update_conversation(
     Raises:
         HTTPException: If conversation is not found
     """
-    # Find conversation
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    # Find conversation and count its messages
+    row = (await db.execute(select_conversation_with_count(conversation_id))).first()
     
-    if not conversation:
+    if not row:
         raise HTTPException(status_code=404, detail="Conversation not found")
+    conversation, message_count = row
     
     # Update fields
     if update_data.status is not None:
@@ -208,25 +260,18 @@ async def update_conversation(
     if update_data.final_summary is not None:
         conversation.final_summary = update_data.final_summary
     
-    db.commit()
-    db.refresh(conversation)
-    
-    return ConversationResponse(
-        id=conversation.id,
-        goal_description=conversation.goal_description,
-        status=conversation.status,
-        final_summary=conversation.final_summary,
-        created_at=conversation.created_at,
-        updated_at=conversation.updated_at,
-        message_count=conversation.message_count,
-        is_waiting_for_user=conversation.is_waiting_for_user
-    )
+    await db.commit()
+    # updated_at is set by the database on update and expired by the flush;
+    # an AsyncSession cannot lazy-load it, so reload just that column
+    await db.refresh(conversation, ["updated_at"])
+    
+    return _json_response(ConversationResponse.from_orm_fast(conversation, message_count))
 
 
 @router.delete("/conversations/{conversation_id}", status_code=204)
 async def delete_conversation(
     conversation_id: uuid.UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> None:
     """
     Delete a conversation and all its messages.
@@ -239,79 +284,74 @@ async def delete_conversation(
         HTTPException: If conversation is not found
     """
     # Find conversation
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    conversation = await db.get(Conversation, conversation_id)
     
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
     # Delete conversation (cascade will delete messages)
-    db.delete(conversation)
-    db.commit()
+    await db.delete(conversation)
+    await db.commit()
+    conversation_cache.discard(conversation_id)
 
 
-@router.post("/conversations/{conversation_id}/start", response_model=ConversationResponse)
+@router.post("/conversations/{conversation_id}/start", response_model=ConversationResponse, status_code=202)
 async def start_conversation_discussion(
     conversation_id: uuid.UUID,
-    db: Session = Depends(get_db)
-) -> ConversationResponse:
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Start the multi-agent discussion for a given conversation.
     
+    The discussion runs in the background; progress is pushed to the
+    conversation's WebSocket connections rather than this response.
+    
     Args:
         conversation_id: Unique conversation identifier
+        request: Incoming request, giving access to the shared agent manager
         db: Database session
         
     Returns:
-        Updated conversation information
+        Conversation information as of the start of the discussion
         
     Raises:
         HTTPException: If conversation is not found
     """
     # Verify conversation exists
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    row = (await db.execute(select_conversation_with_count(conversation_id))).first()
     
-    if not conversation:
+    if not row:
         raise HTTPException(status_code=404, detail="Conversation not found")
+    conversation, message_count = row
     
-    # Initialize LLMServiceFactory and AgentManager
-    # Assuming settings are accessible globally or via dependency injection
-    from backend.config import get_settings
-    from app.services.llm_service import LLMServiceFactory
-    from app.agents.agent_manager import AgentManager
     from app.services.conversation_manager import ConversationManager as ServiceConversationManager
-    
-    settings = get_settings()
-    llm_service_factory = LLMServiceFactory(config=settings.llm.model_dump())
-    agent_manager = AgentManager(llm_service=llm_service_factory)
+    from .websockets import manager
     
     # Create a service-level ConversationManager and start the discussion
+    # without holding the request (or its database session) open; messages
+    # and phase changes are pushed to the conversation's WebSocket clients
     service_conversation_manager = ServiceConversationManager(
-        agent_manager=agent_manager,
-        conversation=conversation
-    )
-    await service_conversation_manager.start()
-    
-    # Refresh conversation status after discussion
-    db.refresh(conversation)
-    
-    return ConversationResponse(
-        id=conversation.id,
-        goal_description=conversation.goal_description,
-        status=conversation.status,
-        final_summary=conversation.final_summary,
-        created_at=conversation.created_at,
-        updated_at=conversation.updated_at,
-        message_count=conversation.message_count,
-        is_waiting_for_user=conversation.is_waiting_for_user
+        agent_manager=request.app.state.agent_manager,
+        conversation=conversation,
+        connection_manager=manager
     )
+    response = ConversationResponse.from_orm_fast(conversation, message_count)
+    await db.close()
+    
+    task = asyncio.create_task(service_conversation_manager.start())
+    _running_discussions.add(task)
+    task.add_done_callback(_discussion_done)
+    
+    return _json_response(response, status_code=202)
 
 
 @router.post("/conversations/{conversation_id}/messages", response_model=MessageResponse, status_code=201)
 async def create_message(
     conversation_id: uuid.UUID,
     message_data: MessageCreate,
-    db: Session = Depends(get_db)
-) -> MessageResponse:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Create a new message in a conversation.
     
@@ -326,20 +366,29 @@ async def create_message(
     Raises:
         HTTPException: If conversation is not found or validation fails
     """
-    # Verify conversation exists
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    # Questions pause the conversation and user responses may resume it; only
+    # then is the conversation row itself needed
+    pauses = message_data.message_type == MessageType.QUESTION_TO_USER and message_data.requires_user_response
+    may_resume = message_data.message_type == MessageType.USER_RESPONSE
     
-    if not conversation:
-        raise HTTPException(status_code=404, detail="Conversation not found")
+    # Verify conversation exists
+    conversation = None
+    if pauses or may_resume:
+        conversation = await db.get(Conversation, conversation_id)
+        
+        if not conversation:
+            raise HTTPException(status_code=404, detail="Conversation not found")
+    else:
+        await _ensure_conversation_exists(db, conversation_id)
     
     # Validate parent message if specified
     if message_data.parent_message_id:
-        parent_message = db.query(Message).filter(
+        parent_exists = await db.scalar(select(select(literal(1)).where(
             Message.id == message_data.parent_message_id,
             Message.conversation_id == conversation_id
-        ).first()
+        ).exists()))
         
-        if not parent_message:
+        if not parent_exists:
             raise HTTPException(status_code=400, detail="Parent message not found in this conversation")
     
     # Create new message
@@ -356,29 +405,16 @@ async def create_message(
     db.add(message)
     
     # Update conversation status based on message type
-    if message_data.message_type == MessageType.QUESTION_TO_USER and message_data.requires_user_response:
+    if pauses:
         conversation.pause_for_user_input()
-    elif message_data.message_type == MessageType.USER_RESPONSE and conversation.status == ConversationStatus.PAUSED:
+    elif may_resume and conversation.status == ConversationStatus.PAUSED:
         conversation.resume()
     
-    db.commit()
-    db.refresh(message)
-    
-    return MessageResponse(
-        id=message.id,
-        conversation_id=message.conversation_id,
-        sender_type=message.sender_type,
-        sender_id=message.sender_id,
-        content=message.content,
-        message_type=message.message_type,
-        parent_message_id=message.parent_message_id,
-        requires_user_response=message.requires_user_response,
-        created_at=message.created_at,
-        agent_name=message.agent_name,
-        is_from_agent=message.is_from_agent,
-        is_from_user=message.is_from_user,
-        is_question_for_user=message.is_question_for_user
-    )
+    # Generated columns come back via INSERT ... RETURNING and stay loaded
+    # after commit, so no refresh is needed
+    await db.commit()
+    
+    return _json_response(MessageResponse.from_orm_fast(message), status_code=201)
 
 
 @router.get("/conversations/{conversation_id}/messages", response_model=MessageList)
@@ -388,8 +424,8 @@ async def get_conversation_messages(
     limit: int = Query(100, ge=1, le=500, description="Maximum number of messages to return"),
     message_type: Optional[MessageType] = Query(None, description="Filter by message type"),
     sender_type: Optional[SenderType] = Query(None, description="Filter by sender type"),
-    db: Session = Depends(get_db)
-) -> MessageList:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Get messages from a conversation with optional filtering and pagination.
     
@@ -408,58 +444,39 @@ async def get_conversation_messages(
         HTTPException: If conversation is not found
     """
     # Verify conversation exists
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-    
-    if not conversation:
-        raise HTTPException(status_code=404, detail="Conversation not found")
+    await _ensure_conversation_exists(db, conversation_id)
     
-    # Build query
-    query = db.query(Message).filter(Message.conversation_id == conversation_id)
+    # Build query; the window count returns the filtered total on every row
+    filters = [Message.conversation_id == conversation_id]
     
     if message_type:
-        query = query.filter(Message.message_type == message_type)
+        filters.append(Message.message_type == message_type)
     
     if sender_type:
-        query = query.filter(Message.sender_type == sender_type)
+        filters.append(Message.sender_type == sender_type)
     
-    # Get total count
-    total_count = query.count()
+    query = select(Message, func.count().over().label("total")).where(*filters)
     
     # Apply pagination and ordering
-    messages = query.order_by(Message.created_at.asc()).offset(skip).limit(limit).all()
-    
-    # Convert to response format
-    message_responses = [
-        MessageResponse(
-            id=msg.id,
-            conversation_id=msg.conversation_id,
-            sender_type=msg.sender_type,
-            sender_id=msg.sender_id,
-            content=msg.content,
-            message_type=msg.message_type,
-            parent_message_id=msg.parent_message_id,
-            requires_user_response=msg.requires_user_response,
-            created_at=msg.created_at,
-            agent_name=msg.agent_name,
-            is_from_agent=msg.is_from_agent,
-            is_from_user=msg.is_from_user,
-            is_question_for_user=msg.is_question_for_user
-        )
-        for msg in messages
-    ]
+    result = await db.execute(query.order_by(Message.created_at.asc()).offset(skip).limit(limit))
+    rows = result.all()
+    messages = [MessageResponse.from_orm_fast(row.Message) for row in rows]
+    total_count = await _page_total(
+        db, rows, skip, select(func.count()).select_from(Message).where(*filters)
+    )
     
-    return MessageList(
-        messages=message_responses,
+    return _json_response(MessageList.model_construct(
+        messages=messages,
         count=total_count,
         conversation_id=conversation_id
-    )
+    ))
 
 
 @router.get("/conversations/{conversation_id}/messages/pending", response_model=MessageList)
 async def get_pending_user_messages(
     conversation_id: uuid.UUID,
-    db: Session = Depends(get_db)
-) -> MessageList:
+    db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     Get messages that require user response.
     
@@ -474,39 +491,17 @@ async def get_pending_user_messages(
         HTTPException: If conversation is not found
     """
     # Verify conversation exists
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-    
-    if not conversation:
-        raise HTTPException(status_code=404, detail="Conversation not found")
+    await _ensure_conversation_exists(db, conversation_id)
     
     # Get pending messages
-    messages = db.query(Message).filter(
+    result = await db.execute(select(Message).where(
         Message.conversation_id == conversation_id,
         Message.requires_user_response == True
-    ).order_by(Message.created_at.asc()).all()
-    
-    # Convert to response format
-    message_responses = [
-        MessageResponse(
-            id=msg.id,
-            conversation_id=msg.conversation_id,
-            sender_type=msg.sender_type,
-            sender_id=msg.sender_id,
-            content=msg.content,
-            message_type=msg.message_type,
-            parent_message_id=msg.parent_message_id,
-            requires_user_response=msg.requires_user_response,
-            created_at=msg.created_at,
-            agent_name=msg.agent_name,
-            is_from_agent=msg.is_from_agent,
-            is_from_user=msg.is_from_user,
-            is_question_for_user=msg.is_question_for_user
-        )
-        for msg in messages
-    ]
+    ).order_by(Message.created_at.asc()))
+    messages = [MessageResponse.from_orm_fast(message) for message in result.scalars().all()]
     
-    return MessageList(
-        messages=message_responses,
-        count=len(message_responses),
+    return _json_response(MessageList.model_construct(
+        messages=messages,
+        count=len(messages),
         conversation_id=conversation_id
-    )
+    ))
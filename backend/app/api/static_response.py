@@ -0,0 +1,52 @@
+"""
+Pre-serialized JSON responses for Multi-Agent AI Chat System.
+
+Endpoints whose payload only changes on redeploy serialize it once and
+answer repeat requests with a strong ETag, so pollers that send
+If-None-Match get an empty 304 instead of the full body.
+"""
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+
+class StaticJSON:
+    """
+    JSON payload serialized once, served with ETag and Cache-Control headers.
+
+    Args:
+        content: JSON-serializable payload
+        cache_control: Cache-Control header value sent with the payload
+    """
+
+    def __init__(self, content: Any, cache_control: str = "public, max-age=60"):
+        self.body = orjson.dumps(content)
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=16).hexdigest()}"'
+        self.headers = {"ETag": self.etag, "Cache-Control": cache_control}
+
+    def matches(self, request: Request) -> bool:
+        """Check whether the request's If-None-Match already names this payload."""
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        # If-None-Match uses weak comparison, so a W/ prefix still matches
+        return any(
+            tag.strip().removeprefix("W/") in (self.etag, "*")
+            for tag in if_none_match.split(",")
+        )
+
+    def response(self, request: Request) -> Response:
+        """
+        Build the response for a request.
+
+        Args:
+            request: Incoming request, checked for a matching If-None-Match
+
+        Returns:
+            304 Not Modified if the client's copy is current, otherwise the payload
+        """
+        if self.matches(request):
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
@@ -4,22 +4,59 @@ WebSocket API endpoints for Multi-Agent AI Chat System.
 This module provides WebSocket endpoints for real-time communication
 during conversations, including live message updates and status changes.
 """
-import json
+import asyncio
+import functools
 import logging
 import uuid
-from typing import Dict, List
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Set
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import SessionLocal
+from ..db import AsyncSessionLocal
+from ..db.queries import select_conversation_with_count
 from ..models import Conversation
+from .conversation_cache import conversation_cache
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Fixed error replies, encoded once
+_INVALID_JSON_PAYLOAD = orjson.dumps({
+    "type": "error",
+    "message": "Invalid JSON format"
+}).decode()
+_PROCESSING_ERROR_PAYLOAD = orjson.dumps({
+    "type": "error",
+    "message": "Error processing message"
+}).decode()
+
+
+# Broadcast envelopes; the %b slots take orjson-encoded values
+_BATCH_PREFIX = b'{"type":"batch","items":['
+_BATCH_SUFFIX = b']}'
+_NEW_MESSAGE_TEMPLATE = b'{"type":"new_message","conversation_id":%b,"data":%b}'
+_STATUS_CHANGE_TEMPLATE = b'{"type":"status_change","conversation_id":%b,"new_status":%b}'
+_AGENT_ACTIVITY_TEMPLATE = b'{"type":"agent_activity","conversation_id":%b,"agent_id":%b,"activity":%b}'
+_RESPONSE_CHUNK_TEMPLATE = b'{"type":"agent_response_chunk","conversation_id":%b,"agent_id":%b,"content":%b}'
+_RESPONSE_COMPLETE_TEMPLATE = b'{"type":"agent_response_complete","conversation_id":%b,"agent_id":%b,"content":%b}'
+_RESPONSE_FAILED_TEMPLATE = b'{"type":"agent_response_failed","conversation_id":%b,"agent_id":%b}'
+
+
+@functools.lru_cache(maxsize=1024)
+def _welcome_payload(conversation_id: str) -> str:
+    """Render the connection_established message once per conversation."""
+    return orjson.dumps({
+        "type": "connection_established",
+        "conversation_id": conversation_id,
+        "message": "Connected to conversation"
+    }).decode()
+
+
 class ConnectionManager:
     """
     WebSocket connection manager.
@@ -27,11 +64,21 @@ class ConnectionManager:
     Manages active WebSocket connections for real-time communication
     during conversations, supporting broadcasting messages to specific
     conversation participants.
+    
+    Messages queued with ``enqueue`` are coalesced: everything queued
+    for a conversation before its flush task runs goes out as a single
+    ``batch`` frame of up to ``max_batch_size`` items.
     """
     
+    max_batch_size = 32
+    
     def __init__(self):
-        # Dictionary: conversation_id -> List of WebSocket connections
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # Dictionary: conversation_id -> Set of WebSocket connections
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # Dictionary: conversation_id -> encoded messages waiting for the next flush
+        self._pending: Dict[str, Deque[bytes]] = {}
+        # Dictionary: conversation_id -> task draining the pending messages
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
     
     async def connect(self, websocket: WebSocket, conversation_id: str) -> None:
         """
@@ -43,18 +90,11 @@ class ConnectionManager:
         """
         await websocket.accept()
         
-        if conversation_id not in self.active_connections:
-            self.active_connections[conversation_id] = []
-        
-        self.active_connections[conversation_id].append(websocket)
+        self.active_connections.setdefault(conversation_id, set()).add(websocket)
         logger.info(f"WebSocket connected to conversation {conversation_id}")
         
         # Send welcome message
-        await websocket.send_text(json.dumps({
-            "type": "connection_established",
-            "conversation_id": conversation_id,
-            "message": "Connected to conversation"
-        }))
+        await websocket.send_text(_welcome_payload(conversation_id))
     
     def disconnect(self, websocket: WebSocket, conversation_id: str) -> None:
         """
@@ -64,13 +104,14 @@ class ConnectionManager:
             websocket: WebSocket connection to remove
             conversation_id: Conversation the connection was associated with
         """
-        if conversation_id in self.active_connections:
-            if websocket in self.active_connections[conversation_id]:
-                self.active_connections[conversation_id].remove(websocket)
+        connections = self.active_connections.get(conversation_id)
+        if connections is not None:
+            if websocket in connections:
+                connections.discard(websocket)
                 logger.info(f"WebSocket disconnected from conversation {conversation_id}")
             
-            # Clean up empty conversation lists
-            if not self.active_connections[conversation_id]:
+            # Clean up empty conversation sets
+            if not connections:
                 del self.active_connections[conversation_id]
     
     async def send_personal_message(self, message: dict, websocket: WebSocket) -> None:
@@ -82,7 +123,7 @@ class ConnectionManager:
             websocket: Target WebSocket connection
         """
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
     
@@ -94,23 +135,131 @@ class ConnectionManager:
             message: Message data to broadcast
             conversation_id: Target conversation ID
         """
-        if conversation_id not in self.active_connections:
+        # orjson handles UUID, datetime and enum values natively
+        await self.broadcast_encoded(orjson.dumps(message), conversation_id)
+    
+    async def broadcast_encoded(self, payload: bytes, conversation_id: str) -> None:
+        """
+        Broadcast an already JSON-encoded message to all connections in a conversation.
+        
+        Args:
+            payload: Encoded message, sent to every connection as one text frame
+            conversation_id: Target conversation ID
+        """
+        connections = self.active_connections.get(conversation_id)
+        if not connections:
             return
         
-        # Create list copy to avoid modification during iteration
-        connections = self.active_connections[conversation_id].copy()
+        # Decode once and send to every connection concurrently
+        text = payload.decode()
+        failed: List[WebSocket] = []
         
-        for websocket in connections:
+        async def send(websocket: WebSocket) -> None:
             try:
-                await websocket.send_text(json.dumps(message))
+                await websocket.send_text(text)
             except Exception as e:
                 logger.error(f"Error broadcasting to conversation {conversation_id}: {e}")
-                # Remove failed connection
-                self.disconnect(websocket, conversation_id)
+                failed.append(websocket)
+        
+        # gather() consumes the generator before any send runs, so the set
+        # is never iterated while connect/disconnect can change it
+        await asyncio.gather(*(send(websocket) for websocket in connections))
+        
+        if failed:
+            # Remove failed connections
+            connections.difference_update(failed)
+            if not connections and self.active_connections.get(conversation_id) is connections:
+                del self.active_connections[conversation_id]
+    
+    def enqueue(self, message: dict, conversation_id: str) -> None:
+        """
+        Queue a message for the next batched broadcast to a conversation.
+        
+        Args:
+            message: Message data to broadcast
+            conversation_id: Target conversation ID
+        """
+        if conversation_id in self.active_connections:
+            self.enqueue_encoded(orjson.dumps(message), conversation_id)
+    
+    def enqueue_encoded(self, payload: bytes, conversation_id: str) -> None:
+        """
+        Queue an already JSON-encoded message for the next batched broadcast.
+        
+        Args:
+            payload: Encoded message
+            conversation_id: Target conversation ID
+        """
+        if conversation_id not in self.active_connections:
+            return
+        
+        self._pending.setdefault(conversation_id, deque()).append(payload)
+        
+        task = self._flush_tasks.get(conversation_id)
+        if task is None or task.done():
+            self._flush_tasks[conversation_id] = asyncio.create_task(self._flush(conversation_id))
+    
+    async def _flush(self, conversation_id: str) -> None:
+        """Broadcast queued messages for a conversation until none remain."""
+        pending = self._pending[conversation_id]
+        try:
+            while pending:
+                batch = [pending.popleft() for _ in range(min(len(pending), self.max_batch_size))]
+                # A lone message goes out unwrapped; a batch splices the
+                # encoded items into the envelope without re-encoding them
+                payload = batch[0] if len(batch) == 1 else _BATCH_PREFIX + b",".join(batch) + _BATCH_SUFFIX
+                await self.broadcast_encoded(payload, conversation_id)
+        finally:
+            if not pending:
+                self._pending.pop(conversation_id, None)
+                self._flush_tasks.pop(conversation_id, None)
+    
+    async def stream_response(
+        self,
+        conversation_id: str,
+        agent_id: str,
+        chunks: AsyncIterator[str],
+        validate: Optional[Callable[[str], str]] = None
+    ) -> str:
+        """
+        Relay an agent's streamed response to a conversation as it is generated.
+        
+        Chunks are forwarded raw as they arrive. The complete frame carries
+        the assembled response after ``validate`` has checked and cleaned it;
+        if validation fails, clients get a failure frame instead.
+        
+        Args:
+            conversation_id: Target conversation ID
+            agent_id: Agent producing the response
+            chunks: Response chunks, e.g. from ``agent.generate_response_stream(context)``
+            validate: Returns the cleaned response, raising ValueError if it is invalid
+            
+        Returns:
+            The complete, validated response text
+            
+        Raises:
+            ValueError: If the assembled response fails validation
+        """
+        encoded_id = orjson.dumps(conversation_id)
+        encoded_agent = orjson.dumps(agent_id)
+        parts = []
+        async for chunk in chunks:
+            parts.append(chunk)
+            self.enqueue_encoded(_RESPONSE_CHUNK_TEMPLATE % (encoded_id, encoded_agent, orjson.dumps(chunk)), conversation_id)
+        
+        content = "".join(parts)
+        if validate is not None:
+            try:
+                content = validate(content)
+            except ValueError:
+                self.enqueue_encoded(_RESPONSE_FAILED_TEMPLATE % (encoded_id, encoded_agent), conversation_id)
+                raise
+        self.enqueue_encoded(_RESPONSE_COMPLETE_TEMPLATE % (encoded_id, encoded_agent, orjson.dumps(content)), conversation_id)
+        return content
     
     def get_connection_count(self, conversation_id: str) -> int:
         """Get number of active connections for a conversation."""
-        return len(self.active_connections.get(conversation_id, []))
+        return len(self.active_connections.get(conversation_id, ()))
 
 
 # Global connection manager instance
@@ -132,56 +281,63 @@ async def websocket_conversation(websocket: WebSocket, conversation_id: str):
     - Agent typing indicators
     - System notifications
     """
-    # Validate conversation exists
-    db = SessionLocal()
+    # Parse the ID once; handlers read it back from the connection state
     try:
-        conversation = db.query(Conversation).filter(
-            Conversation.id == uuid.UUID(conversation_id)
-        ).first()
-        
-        if not conversation:
-            await websocket.close(code=4004, reason="Conversation not found")
-            return
-            
+        conversation_uuid = uuid.UUID(conversation_id)
     except ValueError:
         await websocket.close(code=4000, reason="Invalid conversation ID format")
         return
-    except Exception as e:
-        logger.error(f"Error validating conversation: {e}")
-        await websocket.close(code=4003, reason="Server error")
-        return
-    finally:
-        db.close()
-    
-    # Accept connection
-    await manager.connect(websocket, conversation_id)
+    websocket.state.conversation_uuid = conversation_uuid
     
-    try:
-        while True:
-            # Wait for messages from client
-            data = await websocket.receive_text()
-            
+    # One session serves the whole connection; each use ends its transaction
+    # so the pooled connection is only held while a query runs
+    async with AsyncSessionLocal() as db:
+        # Validate conversation exists, skipping the database on a recent hit
+        if not conversation_cache.contains(conversation_uuid):
             try:
-                message = json.loads(data)
-                await handle_websocket_message(message, conversation_id, websocket)
-            except json.JSONDecodeError:
-                await websocket.send_text(json.dumps({
-                    "type": "error",
-                    "message": "Invalid JSON format"
-                }))
+                conversation = await db.get(Conversation, conversation_uuid)
+                
+                if not conversation:
+                    await websocket.close(code=4004, reason="Conversation not found")
+                    return
+                
+                conversation_cache.add(conversation_uuid)
+                    
             except Exception as e:
-                logger.error(f"Error handling WebSocket message: {e}")
-                await websocket.send_text(json.dumps({
-                    "type": "error", 
-                    "message": "Error processing message"
-                }))
+                logger.error(f"Error validating conversation: {e}")
+                await websocket.close(code=4003, reason="Server error")
+                return
+            finally:
+                await db.rollback()
+        
+        # Accept connection
+        await manager.connect(websocket, conversation_id)
+        
+        try:
+            while True:
+                # Wait for messages from client
+                data = await websocket.receive_text()
                 
-    except WebSocketDisconnect:
-        manager.disconnect(websocket, conversation_id)
-        logger.info(f"Client disconnected from conversation {conversation_id}")
+                try:
+                    message = orjson.loads(data)
+                    await handle_websocket_message(message, conversation_id, websocket, db)
+                except orjson.JSONDecodeError:
+                    await websocket.send_text(_INVALID_JSON_PAYLOAD)
+                except Exception as e:
+                    logger.error(f"Error handling WebSocket message: {e}")
+                    await websocket.send_text(_PROCESSING_ERROR_PAYLOAD)
+                    
+        except WebSocketDisconnect:
+            manager.disconnect(websocket, conversation_id)
+            logger.info(f"Client disconnected from conversation {conversation_id}")
 
 
-async def handle_websocket_message(message: dict, conversation_id: str, websocket: WebSocket) -> None:
+async def handle_websocket_message(
+    message: dict,
+    conversation_id: str,
+    websocket: WebSocket,
+    db: AsyncSession
+) -> None:
     """
     Handle incoming WebSocket messages.
     
@@ -189,48 +345,51 @@ async def handle_websocket_message(message: dict, conversation_id: str, websocke
         message: Parsed message data from client
         conversation_id: Associated conversation ID
         websocket: Source WebSocket connection
+        db: Database session shared by the connection
     """
     message_type = message.get("type", "unknown")
     
     if message_type == "ping":
         # Heartbeat/ping message
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(orjson.dumps({
             "type": "pong",
             "timestamp": message.get("timestamp")
-        }))
+        }).decode())
     
     elif message_type == "subscribe_to_updates":
         # Client wants to receive all conversation updates
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(orjson.dumps({
             "type": "subscription_confirmed",
             "conversation_id": conversation_id,
             "updates": ["messages", "status_changes", "agent_activity"]
-        }))
+        }).decode())
     
     elif message_type == "get_status":
-        # Client requests current conversation status
-        db = SessionLocal()
+        # Client requests current conversation status; populate_existing
+        # reloads the identity-map copy so the status is never stale
         try:
-            conversation = db.query(Conversation).filter(
-                Conversation.id == uuid.UUID(conversation_id)
-            ).first()
+            row = (await db.execute(
+                select_conversation_with_count(websocket.state.conversation_uuid),
+                execution_options={"populate_existing": True}
+            )).first()
             
-            if conversation:
-                await websocket.send_text(json.dumps({
+            if row:
+                conversation, message_count = row
+                await websocket.send_text(orjson.dumps({
                     "type": "status_update",
                     "conversation_id": conversation_id,
                     "status": conversation.status.value,
-                    "message_count": conversation.message_count,
+                    "message_count": message_count,
                     "is_waiting_for_user": conversation.is_waiting_for_user
-                }))
+                }).decode())
         finally:
-            db.close()
+            await db.rollback()
     
     else:
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(orjson.dumps({
             "type": "error",
             "message": f"Unknown message type: {message_type}"
-        }))
+        }).decode())
 
 
 # Utility functions for broadcasting from other parts of the application
@@ -242,11 +401,10 @@ async def broadcast_new_message(conversation_id: str, message_data: dict) -> Non
         conversation_id: Target conversation ID
         message_data: Message information to broadcast
     """
-    await manager.broadcast_to_conversation({
-        "type": "new_message",
-        "conversation_id": conversation_id,
-        "data": message_data
-    }, conversation_id)
+    manager.enqueue_encoded(
+        _NEW_MESSAGE_TEMPLATE % (orjson.dumps(conversation_id), orjson.dumps(message_data)),
+        conversation_id
+    )
 
 
 async def broadcast_status_change(conversation_id: str, new_status: str, additional_data: dict = None) -> None:
@@ -258,16 +416,21 @@ async def broadcast_status_change(conversation_id: str, new_status: str, additio
         new_status: New conversation status
         additional_data: Additional status information
     """
+    if not additional_data:
+        manager.enqueue_encoded(
+            _STATUS_CHANGE_TEMPLATE % (orjson.dumps(conversation_id), orjson.dumps(new_status)),
+            conversation_id
+        )
+        return
+    
     message = {
         "type": "status_change",
         "conversation_id": conversation_id,
         "new_status": new_status
     }
+    message.update(additional_data)
     
-    if additional_data:
-        message.update(additional_data)
-    
-    await manager.broadcast_to_conversation(message, conversation_id)
+    manager.enqueue(message, conversation_id)
 
 
 async def broadcast_agent_activity(conversation_id: str, agent_id: str, activity: str) -> None:
@@ -279,9 +442,28 @@ async def broadcast_agent_activity(conversation_id: str, agent_id: str, activity
         agent_id: Agent performing the activity
         activity: Type of activity (typing, thinking, etc.)
     """
-    await manager.broadcast_to_conversation({
-        "type": "agent_activity",
-        "conversation_id": conversation_id,
-        "agent_id": agent_id,
-        "activity": activity
-    }, conversation_id)
+    manager.enqueue_encoded(
+        _AGENT_ACTIVITY_TEMPLATE % (orjson.dumps(conversation_id), orjson.dumps(agent_id), orjson.dumps(activity)),
+        conversation_id
+    )
+
+
+async def stream_agent_response(
+    conversation_id: str,
+    agent_id: str,
+    chunks: AsyncIterator[str],
+    validate: Optional[Callable[[str], str]] = None
+) -> str:
+    """
+    Relay an agent's streamed response to all connections as it is generated.
+    
+    Args:
+        conversation_id: Target conversation ID
+        agent_id: Agent producing the response
+        chunks: Response chunks, e.g. from ``agent.generate_response_stream(context)``
+        validate: Returns the cleaned response, raising ValueError if it is invalid
+        
+    Returns:
+        The complete, validated response text
+    """
+    return await manager.stream_response(conversation_id, agent_id, chunks, validate)
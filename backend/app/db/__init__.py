@@ -11,8 +11,9 @@ Example:
     init_database()
     
     # Use in FastAPI dependency
-    def get_conversations(db: Session = Depends(get_db)):
-        return db.query(Conversation).all()
+    async def get_conversations(db: AsyncSession = Depends(get_db)):
+        result = await db.execute(select(Conversation))
+        return result.scalars().all()
         
     # Use context manager
     with DatabaseSession() as db:
@@ -29,6 +30,10 @@ from .database import (
     engine,
     SessionLocal,
     DATABASE_URL,
+    async_engine,
+    AsyncSessionLocal,
+    ASYNC_DATABASE_URL,
+    get_async_database_url,
 )
 
 __all__ = [
@@ -41,4 +46,8 @@ __all__ = [
     "engine",
     "SessionLocal", 
     "DATABASE_URL",
+    "async_engine",
+    "AsyncSessionLocal",
+    "ASYNC_DATABASE_URL",
+    "get_async_database_url",
 ]
@@ -2,17 +2,23 @@
 Database configuration and session management for Multi-Agent AI Chat System.
 
 This module provides database connection, session management, and initialization
-functionality using SQLAlchemy with SQLite.
+functionality using SQLAlchemy with SQLite. Request handlers use an AsyncSession
+on an async driver; table management and scripts keep the synchronous engine.
 """
+import hashlib
+import logging
 import os
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHING_DISABLED, NO_CACHE_KEY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
-from ..models.base import Base
+logger = logging.getLogger(__name__)
 
 
 # Database configuration
@@ -36,32 +42,179 @@ def get_database_url() -> str:
     return f"sqlite:///{db_path}"
 
 
+# Sync URL scheme -> async driver scheme
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Map a database URL onto its async driver.
+    
+    URLs that already name a driver (e.g. ``sqlite+aiosqlite://``) are
+    returned unchanged.
+    
+    Args:
+        database_url: Database connection URL
+        
+    Returns:
+        Database connection URL for the async engine
+    """
+    scheme, sep, rest = database_url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+# Connection pool sizing for file-backed and server databases: keep roughly
+# one warm connection per core, with a small overflow for bursts
+POOL_OPTIONS = {
+    "pool_size": max(4, os.cpu_count() or 1),
+    "max_overflow": 8,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
+# Per-connection SQLite settings. WAL lets readers run alongside the writer,
+# and synchronous=NORMAL stays durable in WAL mode while skipping most fsyncs.
+# busy_timeout makes a writer wait for the lock instead of failing at once.
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+SQLITE_PRAGMA_SCRIPT = "".join(f"{pragma};" for pragma in SQLITE_PRAGMAS)
+
+# Compiled-statement cache entries per engine (SQLAlchemy's default is 500)
+QUERY_CACHE_SIZE = 1200
+
+# Echo SQL queries and report uncached statements in development
+SQL_DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
 # Create database engine
 DATABASE_URL = get_database_url()
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+# An in-memory database only lives as long as its connection, so it must be
+# served from a single shared connection
+IN_MEMORY_DATABASE = IS_SQLITE and (
+    ":memory:" in DATABASE_URL or "mode=memory" in DATABASE_URL or DATABASE_URL.rstrip("/") == "sqlite:"
+)
+# Each connection to a plain :memory: URL opens its own empty database, so the
+# sync and async engines both attach to one named shared-cache database instead
+SHARED_MEMORY_DATABASE_URL = "sqlite:///file:chattybots?mode=memory&cache=shared&uri=true"
+if IN_MEMORY_DATABASE and "cache=shared" not in DATABASE_URL:
+    DATABASE_URL = SHARED_MEMORY_DATABASE_URL
+# Pooled SQLite connections are handed between threads; in-memory databases
+# also accept URI filenames such as file:name?mode=memory&cache=shared
+SQLITE_CONNECT_ARGS = {"check_same_thread": False, **({"uri": True} if IN_MEMORY_DATABASE else {})}
 engine = create_engine(
     DATABASE_URL,
     # SQLite specific configuration
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    connect_args=SQLITE_CONNECT_ARGS if IS_SQLITE else {},
     # Echo SQL queries in development
-    echo=os.getenv("DEBUG", "false").lower() == "true"
+    echo=SQL_DEBUG,
+    query_cache_size=QUERY_CACHE_SIZE,
+    **({"poolclass": StaticPool} if IN_MEMORY_DATABASE else {"poolclass": QueuePool, **POOL_OPTIONS})
+)
+
+# Async engine for request handlers. In-memory SQLite keeps the dialect's
+# default single-connection pool; everything else uses the asyncio-aware queue
+# pool (a plain QueuePool can deadlock under the event loop).
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+if IS_SQLITE:
+    ASYNC_CONNECT_ARGS = SQLITE_CONNECT_ARGS
+elif "asyncpg" in ASYNC_DATABASE_URL:
+    # asyncpg: keep more prepared statements per connection than its default 100
+    ASYNC_CONNECT_ARGS = {"statement_cache_size": 1024}
+else:
+    ASYNC_CONNECT_ARGS = {}
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=SQL_DEBUG,
+    query_cache_size=QUERY_CACHE_SIZE,
+    connect_args=ASYNC_CONNECT_ARGS,
+    **({} if IN_MEMORY_DATABASE else {"poolclass": AsyncAdaptedQueuePool, **POOL_OPTIONS})
 )
 
 
-# Enable foreign key constraints for SQLite
-@event.listens_for(Engine, "connect")
+# Configure SQLite connections
 def set_sqlite_pragma(dbapi_connection, connection_record):
-    """Enable foreign key constraints for SQLite connections."""
-    if "sqlite" in str(dbapi_connection):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+    """Enable foreign key constraints and WAL tuning for SQLite connections."""
+    dbapi_connection.executescript(SQLITE_PRAGMA_SCRIPT)
+
+
+def set_async_sqlite_pragma(dbapi_connection, connection_record):
+    """Enable foreign key constraints and WAL tuning for aiosqlite connections."""
+    # The adapted connection has no executescript; run it on the driver connection
+    dbapi_connection.run_async(lambda connection: connection.executescript(SQLITE_PRAGMA_SCRIPT))
+
+
+# Only the SQLite engines get the listeners, so connecting needs no driver check
+if IS_SQLITE:
+    event.listen(engine, "connect", set_sqlite_pragma)
+    event.listen(async_engine.sync_engine, "connect", set_async_sqlite_pragma)
+
+
+def dispose_inherited_connections() -> None:
+    """Drop pooled connections inherited from the parent process after a fork."""
+    # close=False leaves the parent's connections open for the parent
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+
+
+# Forked server workers must not share the parent's SQLite file handles. An
+# in-memory database cannot be shared across processes, so it is left alone.
+if hasattr(os, "register_at_fork") and not IN_MEMORY_DATABASE:
+    os.register_at_fork(after_in_child=dispose_inherited_connections)
+
+
+def log_uncached_statement(conn, cursor, statement, parameters, context, executemany):
+    """Log compiled statements that bypassed the compiled-statement cache."""
+    # Raw driver SQL and DDL are never cached, so only compiled statements count
+    if context.compiled is None or context.isddl:
+        return
+    if context.cache_hit in (NO_CACHE_KEY, CACHING_DISABLED):
+        logger.debug(f"Statement not cached ({context.cache_hit.name}): {statement}")
+
+
+if SQL_DEBUG:
+    event.listen(Engine, "after_cursor_execute", log_uncached_statement)
 
 
 # Create session factory
 SessionLocal = sessionmaker(
     bind=engine,
     autocommit=False,
-    autoflush=False
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+# DatabaseSession commits only when the session wrote something. Flushes
+# cover ORM changes; non-SELECT statements cover bulk and raw SQL writes.
+@event.listens_for(SessionLocal, "after_flush")
+def mark_flush_write(session, flush_context):
+    """Record that a session flushed changes to the database."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def mark_statement_write(orm_execute_state):
+    """Record that a session executed a statement that may write."""
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+# Async session factory. Attributes stay loaded after commit because an
+# AsyncSession cannot lazily reload expired attributes.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
 )
 
 
@@ -70,9 +223,14 @@ def create_tables() -> None:
     Create all database tables.
     
     This function creates all tables defined in the models.
-    Safe to call multiple times - will only create missing tables.
+    Safe to call multiple times - will only create missing tables
+    and indexes.
     """
+    from ..models.base import Base
+    from .indexes import create_indexes
+    
     Base.metadata.create_all(bind=engine)
+    create_indexes(engine)
 
 
 def drop_tables() -> None:
@@ -82,33 +240,67 @@ def drop_tables() -> None:
     WARNING: This will delete all data in the database.
     Use only for testing or development reset.
     """
+    from ..models.base import Base
+    
     Base.metadata.drop_all(bind=engine)
+    if IS_SQLITE:
+        set_schema_version(0)
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_schema_version() -> int:
     """
-    Get database session for dependency injection.
+    Fingerprint the table and index definitions.
+    
+    Returns:
+        Positive 31-bit schema fingerprint, stored in SQLite's user_version
+    """
+    from ..models.base import Base
+    from .indexes import INDEXES
+    
+    tables = sorted(
+        (table.name, [(column.name, str(column.type)) for column in table.columns])
+        for table in Base.metadata.tables.values()
+    )
+    indexes = sorted(index.name for index in INDEXES)
+    digest = hashlib.blake2b(repr((tables, indexes)).encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "big") & 0x7FFFFFFF
+
+
+def get_stored_schema_version() -> int:
+    """Read the schema fingerprint recorded in the SQLite database."""
+    with engine.connect() as connection:
+        return connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def set_schema_version(version: int) -> None:
+    """Record a schema fingerprint in the SQLite database."""
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session for dependency injection.
     
     This function provides a database session that automatically
     handles cleanup and error handling.
     
     Yields:
-        Database session
+        Async database session
         
     Example:
         from fastapi import Depends
         
-        def get_conversations(db: Session = Depends(get_db)):
-            return db.query(Conversation).all()
+        async def get_conversations(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(Conversation))
+            return result.scalars().all()
     """
-    db = SessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        db.rollback()
-        raise e
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            await db.rollback()
+            raise e
 
 
 def init_database() -> None:
@@ -116,10 +308,18 @@ def init_database() -> None:
     Initialize database with tables and any required data.
     
     This function should be called when the application starts
-    to ensure the database is properly set up.
+    to ensure the database is properly set up. SQLite databases record
+    a schema fingerprint, so restarts against an up-to-date database
+    skip the per-table existence checks.
     """
     # Create tables
-    create_tables()
+    if not IS_SQLITE:
+        create_tables()
+    else:
+        schema_version = get_schema_version()
+        if get_stored_schema_version() != schema_version:
+            create_tables()
+            set_schema_version(schema_version)
     
     # Add any initial data here if needed
     # For example, default agent configurations could be stored
@@ -147,7 +347,9 @@ class DatabaseSession:
     Context manager for database sessions.
     
     Provides automatic session management with proper cleanup
-    and error handling.
+    and error handling. The transaction is committed on exit only if the
+    block wrote something; read-only blocks are rolled back, which ends
+    the read transaction without a commit.
     
     Example:
         with DatabaseSession() as db:
@@ -168,9 +370,12 @@ class DatabaseSession:
         if exc_type is not None:
             # Exception occurred, rollback transaction
             self.db.rollback()
-        else:
+        elif self.db.info.get("has_writes") or self.db.new or self.db.dirty or self.db.deleted:
             # No exception, commit transaction
             self.db.commit()
+        else:
+            # Nothing was written, release the read transaction
+            self.db.rollback()
         
         # Always close the session
         self.db.close()
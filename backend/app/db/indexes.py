@@ -0,0 +1,53 @@
+"""
+Composite indexes for the hot conversation and message queries.
+
+The indexes are declared against the mapped tables, so ``create_tables``
+emits them for new databases and adds any that are missing on existing ones.
+"""
+from typing import Tuple
+
+from sqlalchemy import Index, text
+from sqlalchemy.engine import Engine
+
+from ..models import Conversation, Message
+
+
+# Message listing: filter by conversation, order by creation time
+MESSAGE_CONVERSATION_CREATED = Index(
+    "ix_msg_conv_created",
+    Message.conversation_id,
+    Message.created_at,
+)
+
+# Pending user messages: partial index over the few rows awaiting a response
+MESSAGE_CONVERSATION_PENDING = Index(
+    "ix_msg_conv_pending",
+    Message.conversation_id,
+    Message.created_at,
+    postgresql_where=text("requires_user_response = true"),
+    sqlite_where=text("requires_user_response = 1"),
+)
+
+# Conversation listing: optional status filter, newest first
+CONVERSATION_STATUS_UPDATED = Index(
+    "ix_conv_status_updated",
+    Conversation.status,
+    Conversation.updated_at,
+)
+
+INDEXES: Tuple[Index, ...] = (
+    MESSAGE_CONVERSATION_CREATED,
+    MESSAGE_CONVERSATION_PENDING,
+    CONVERSATION_STATUS_UPDATED,
+)
+
+
+def create_indexes(bind: Engine) -> None:
+    """
+    Create any of the composite indexes that do not exist yet.
+    
+    Args:
+        bind: Engine to create the indexes on
+    """
+    for index in INDEXES:
+        index.create(bind=bind, checkfirst=True)
@@ -0,0 +1,35 @@
+"""
+Shared query fragments for the conversation endpoints.
+
+Listing and status endpoints only need the number of messages in a
+conversation, so they count them in the database instead of loading the
+message rows into the session.
+"""
+import uuid
+
+from sqlalchemy import Select, func, select
+
+from ..models import Conversation, Message
+
+
+# Correlated per-conversation message count, selected alongside Conversation
+MESSAGE_COUNT = (
+    select(func.count(Message.id))
+    .where(Message.conversation_id == Conversation.id)
+    .correlate(Conversation)
+    .scalar_subquery()
+    .label("message_count")
+)
+
+
+def select_conversation_with_count(conversation_id: uuid.UUID) -> Select:
+    """
+    Build a query for one conversation and its message count.
+    
+    Args:
+        conversation_id: Unique conversation identifier
+        
+    Returns:
+        Select yielding ``(Conversation, message_count)`` rows
+    """
+    return select(Conversation, MESSAGE_COUNT).where(Conversation.id == conversation_id)
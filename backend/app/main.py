@@ -4,26 +4,80 @@ Main FastAPI application for Multi-Agent AI Chat System.
 This module creates and configures the FastAPI application with all necessary
 middleware, error handling, and API routes using the comprehensive configuration system.
 """
+import asyncio
 import logging
+import queue
 import time
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Tuple
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
+from fastapi.responses import ORJSONResponse
 
 from backend.config import get_settings
-from .db import init_database
+from .agents import get_agent_ids
+from .db import async_engine, init_database
 from .api import conversations, agents, websockets
+from .api.static_response import StaticJSON
 from .middleware.logging import LoggingMiddleware
 from .middleware.error_handler import ErrorHandlerMiddleware
-from .services.llm_service import LLMServiceFactory
+
+logger = logging.getLogger(__name__)
 
 # Get application settings
 settings = get_settings()
 
+# Seconds to reuse an LLM provider health probe result
+LLM_HEALTH_TTL = 30.0
+
+
+def configure_logging() -> Tuple[QueueHandler, QueueListener]:
+    """
+    Configure logging based on settings.
+    
+    Records are queued by the root logger and written by a background
+    thread, so console and file output never block the event loop.
+    
+    Returns:
+        Queue handler installed on the root logger, and the started
+        listener owning the console and file handlers
+    """
+    handlers = []
+    if settings.logging.console_output:
+        handlers.append(logging.StreamHandler())
+    if settings.logging.file_path:
+        handlers.append(RotatingFileHandler(
+            settings.logging.file_path,
+            maxBytes=settings.logging.max_file_size_mb * 1024 * 1024,
+            backupCount=settings.logging.backup_count,
+            delay=True
+        ))
+    
+    # JSON formatting would be handled by a JSON formatter
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s' if not settings.logging.json_format else None
+    )
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # The queue only carries the message; the listener's handlers format it
+    queue_handler.setFormatter(logging.Formatter())
+    # Installed directly rather than through basicConfig, which is a no-op
+    # once the root logger has a handler; shutdown removes it again so a
+    # restarted app never leaves a handler feeding a stopped listener
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, settings.logging.level.value))
+    root_logger.addHandler(queue_handler)
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return queue_handler, listener
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -33,18 +87,8 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events for the FastAPI application,
     including database initialization and cleanup using new configuration system.
     """
-    # Configure logging based on settings
-    logging.basicConfig(
-        level=getattr(logging, settings.logging.level.value),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s' if not settings.logging.json_format
-        else None,  # JSON formatting would be handled by a JSON formatter
-        handlers=[
-            logging.StreamHandler() if settings.logging.console_output else logging.NullHandler(),
-            logging.FileHandler(settings.logging.file_path) if settings.logging.file_path else logging.NullHandler()
-        ]
-    )
+    app.state.log_handler, app.state.log_listener = configure_logging()
     
-    logger = logging.getLogger(__name__)
     logger.info(f"Starting {settings.app_name} v{settings.version}")
     logger.info(f"Environment: {settings.environment.value}")
     logger.info(f"Debug mode: {settings.debug}")
@@ -60,6 +104,24 @@ async def lifespan(app: FastAPI):
         # Initialize database
         init_database()
         logger.info("Database initialized successfully")
+        
+        # Build the LLM service once for all requests; conversations borrow
+        # pooled agents from one shared agent manager
+        from .agents.agent_manager import AgentManager
+        from .services.llm_service import LLMServiceFactory
+        app.state.llm_factory = LLMServiceFactory(config=settings.llm.model_dump())
+        app.state.agent_manager = AgentManager(llm_service=app.state.llm_factory)
+        app.state.llm_health = False
+        app.state.llm_health_expires = 0.0
+        app.state.llm_health_lock = asyncio.Lock()
+        
+        # Informational payloads only change on redeploy, so serialize them once
+        app.state.root_response = StaticJSON(build_root_info())
+        app.state.config_response = StaticJSON(build_config_info())
+        app.state.status_responses = {
+            healthy: StaticJSON(build_status_info(healthy), cache_control="no-cache")
+            for healthy in (True, False)
+        }
         yield
     except Exception as e:
         logger.error(f"Failed to start application: {e}")
@@ -67,6 +129,31 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info(f"Shutting down {settings.app_name}")
+        await async_engine.dispose()
+        from .services.http_client import close_http_client
+        await close_http_client()
+        logging.getLogger().removeHandler(app.state.log_handler)
+        app.state.log_listener.stop()
+
+
+async def get_llm_health(app: FastAPI) -> bool:
+    """
+    Get the LLM provider health, probing the provider at most once per TTL.
+    
+    Args:
+        app: Application holding the LLM service factory
+        
+    Returns:
+        True if the provider reported healthy on the last probe
+    """
+    state = app.state
+    if time.monotonic() >= state.llm_health_expires:
+        async with state.llm_health_lock:
+            # Another request may have refreshed the result while we waited
+            if time.monotonic() >= state.llm_health_expires:
+                state.llm_health = await state.llm_factory.provider.health_check()
+                state.llm_health_expires = time.monotonic() + LLM_HEALTH_TTL
+    return state.llm_health
 
 
 # Create FastAPI application with new configuration
@@ -76,6 +163,7 @@ app = FastAPI(
     version=settings.version,
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if not settings.is_production else None,
     redoc_url="/redoc" if not settings.is_production else None,
     openapi_url="/openapi.json" if not settings.is_production else None,
@@ -91,16 +179,15 @@ app.add_middleware(
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(ErrorHandlerMiddleware)
 
-# Include API routes
+# Include API routes; the route modules import services and provider
+# clients inside their handlers, so including them here stays cheap
 app.include_router(conversations.router, prefix="/api", tags=["Conversations"])
 app.include_router(agents.router, prefix="/api", tags=["Agents"])
 app.include_router(websockets.router, prefix="/ws", tags=["WebSocket"])
 
-
-@app.get("/", response_model=dict)
-async def root():
+def build_root_info() -> dict:
     """
-    Root endpoint providing API information.
+    Build the API information served by the root endpoint.
     
     Returns:
         Basic information about the API
@@ -116,32 +203,9 @@ async def root():
     }
 
 
-@app.get("/health", response_model=dict)
-async def health_check():
-    """
-    Health check endpoint for monitoring.
-    
-    Returns:
-        System health status with timestamp
-    """
-    try:
-        return {
-            "status": "healthy",
-            "service": "multi-agent-chat-system",
-            "version": settings.version,
-            "environment": settings.environment.value,
-            "timestamp": time.time(),
-            "database": "connected",
-            "llm_provider": settings.llm.provider.value
-        }
-    except Exception as e:
-        raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
-
-
-@app.get("/api/config", response_model=dict)
-async def get_config_info():
+def build_config_info() -> dict:
     """
-    Get public configuration information.
+    Build the public configuration served by the config endpoint.
     
     Returns:
         Non-sensitive configuration details
@@ -162,19 +226,18 @@ async def get_config_info():
     }
 
 
-@app.get("/api/status", response_model=dict)
-async def system_status():
+def build_status_info(llm_health: bool) -> dict:
     """
-    System status endpoint with detailed information.
+    Build the system status served by the status endpoint.
     
+    Args:
+        llm_health: Whether the LLM provider reported healthy
+        
     Returns:
         Detailed system status including database and agent information
     """
-    from .agents import get_agent_ids
+    agent_ids = get_agent_ids()
     
-    llm_service_factory = LLMServiceFactory(config=settings.llm.model_dump())
-    llm_health = await llm_service_factory.provider.health_check()
-
     return {
         "status": "operational",
         "environment": settings.environment.value,
@@ -191,8 +254,8 @@ async def system_status():
             "health_status": "healthy" if llm_health else "unhealthy"
         },
         "agents": {
-            "count": len(get_agent_ids()),
-            "available": get_agent_ids(),
+            "count": len(agent_ids),
+            "available": agent_ids,
             "max_rounds": settings.agents.max_conversation_rounds,
             "consensus_threshold": settings.agents.consensus_threshold,
             "response_timeout": settings.agents.response_timeout
@@ -207,11 +270,68 @@ async def system_status():
     }
 
 
+@app.get("/", response_model=dict)
+async def root(request: Request):
+    """
+    Root endpoint providing API information.
+    
+    Returns:
+        Basic information about the API
+    """
+    return request.app.state.root_response.response(request)
+
+
+@app.get("/health")
+async def health_check() -> ORJSONResponse:
+    """
+    Health check endpoint for monitoring.
+    
+    Returns:
+        System health status with timestamp
+    """
+    try:
+        # Returned as a response so FastAPI skips its response-model pass
+        return ORJSONResponse({
+            "status": "healthy",
+            "service": "multi-agent-chat-system",
+            "version": settings.version,
+            "environment": settings.environment.value,
+            "timestamp": time.time(),
+            "database": "connected",
+            "llm_provider": settings.llm.provider.value
+        })
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
+
+
+@app.get("/api/config", response_model=dict)
+async def get_config_info(request: Request):
+    """
+    Get public configuration information.
+    
+    Returns:
+        Non-sensitive configuration details
+    """
+    return request.app.state.config_response.response(request)
+
+
+@app.get("/api/status", response_model=dict)
+async def system_status(request: Request):
+    """
+    System status endpoint with detailed information.
+    
+    Returns:
+        Detailed system status including database and agent information
+    """
+    llm_health = await get_llm_health(request.app)
+    return request.app.state.status_responses[llm_health].response(request)
+
+
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """Handle 404 errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "Not Found",
@@ -224,14 +344,13 @@ async def not_found_handler(request, exc):
 @app.exception_handler(500)
 async def internal_server_error_handler(request, exc):
     """Handle 500 errors."""
-    logger = logging.getLogger(__name__)
     logger.error(
         f"Unhandled exception: {exc}",
         exc_info=True
     )
     
     if settings.is_production:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error", 
@@ -239,7 +358,7 @@ async def internal_server_error_handler(request, exc):
             }
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error", 
@@ -251,6 +370,8 @@ async def internal_server_error_handler(request, exc):
 
 if __name__ == "__main__":
     # Run application with configuration
+    import uvicorn
+    
     uvicorn.run(
         "backend.app.main:app",
         host=settings.server.host,
@@ -3,141 +3,149 @@ Error handling middleware for Multi-Agent AI Chat System.
 
 This middleware provides centralized error handling and user-friendly error responses.
 """
+import functools
 import logging
-from typing import Callable
+from typing import Dict, NamedTuple
 
-from fastapi import Request, Response, HTTPException
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+import orjson
+from fastapi import Response, HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from sqlalchemy.exc import SQLAlchemyError
 
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+class ErrorKind(NamedTuple):
+    """How an exception type is logged and reported to the client."""
+    
+    status_code: int
+    error: str
+    # Formatted with the exception as ``error``
+    message: str
+    error_type: str
+    log_level: int
+    log_label: str
+
+
+# Exception type -> error kind; subclasses resolve to their nearest listed base
+ERROR_KINDS = {
+    SQLAlchemyError: ErrorKind(
+        500, "Database Error", "A database error occurred. Please try again later.",
+        "database_error", logging.ERROR, "Database error"
+    ),
+    ValueError: ErrorKind(
+        400, "Validation Error", "{error}",
+        "validation_error", logging.WARNING, "Validation error"
+    ),
+    KeyError: ErrorKind(
+        400, "Missing Data", "Required data is missing: {error}",
+        "missing_data_error", logging.WARNING, "Key error"
+    ),
+    PermissionError: ErrorKind(
+        403, "Permission Denied", "You don't have permission to perform this action.",
+        "permission_error", logging.WARNING, "Permission error"
+    ),
+}
+
+UNEXPECTED_ERROR = ErrorKind(
+    500, "Internal Server Error", "An unexpected error occurred. Please try again later.",
+    "internal_server_error", logging.ERROR, "Unexpected error"
+)
+
+
+def encode_error_body(kind: ErrorKind, message: str) -> bytes:
+    """Serialize the client-facing error body for an error kind."""
+    return orjson.dumps({"error": kind.error, "message": message, "type": kind.error_type})
+
+
+# Bodies for error kinds whose message does not include the exception
+STATIC_ERROR_BODIES: Dict[ErrorKind, bytes] = {
+    kind: encode_error_body(kind, kind.message)
+    for kind in (*ERROR_KINDS.values(), UNEXPECTED_ERROR)
+    if "{error}" not in kind.message
+}
+
+
+@functools.lru_cache(maxsize=128)
+def get_error_kind(exc_type: type) -> ErrorKind:
+    """
+    Resolve the error kind for an exception type.
+    
+    Args:
+        exc_type: Type of the raised exception
+        
+    Returns:
+        Error kind of the nearest listed base class, or UNEXPECTED_ERROR
+    """
+    for base in exc_type.__mro__:
+        kind = ERROR_KINDS.get(base)
+        if kind is not None:
+            return kind
+    return UNEXPECTED_ERROR
+
+
+class ErrorHandlerMiddleware:
     """
     Middleware for centralized error handling.
     
     Catches exceptions and converts them to appropriate HTTP responses
     with user-friendly error messages while logging detailed error information.
+    Implemented as plain ASGI middleware so WebSocket and lifespan traffic
+    pass straight through.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with error handling.
         
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in the chain
-            
-        Returns:
-            HTTP response or error response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def track_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
             # Process request normally
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, track_send)
             
         except HTTPException:
             # FastAPI HTTP exceptions - let them pass through
             raise
             
-        except SQLAlchemyError as e:
-            # Database errors
-            logger.error(
-                f"Database error in {request.method} {request.url.path}",
-                extra={
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "request_id": getattr(request.state, "request_id", "unknown")
-                },
-                exc_info=True
-            )
-            
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": "Database Error",
-                    "message": "A database error occurred. Please try again later.",
-                    "type": "database_error"
-                }
-            )
-            
-        except ValueError as e:
-            # Validation errors
-            logger.warning(
-                f"Validation error in {request.method} {request.url.path}",
-                extra={
-                    "error": str(e),
-                    "request_id": getattr(request.state, "request_id", "unknown")
-                }
-            )
-            
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Validation Error",
-                    "message": str(e),
-                    "type": "validation_error"
-                }
-            )
-            
-        except KeyError as e:
-            # Missing data errors
-            logger.warning(
-                f"Key error in {request.method} {request.url.path}",
-                extra={
-                    "error": str(e),
-                    "request_id": getattr(request.state, "request_id", "unknown")
-                }
-            )
-            
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Missing Data",
-                    "message": f"Required data is missing: {str(e)}",
-                    "type": "missing_data_error"
-                }
-            )
-            
-        except PermissionError as e:
-            # Permission/authorization errors
-            logger.warning(
-                f"Permission error in {request.method} {request.url.path}",
-                extra={
-                    "error": str(e),
-                    "request_id": getattr(request.state, "request_id", "unknown")
-                }
-            )
-            
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "error": "Permission Denied",
-                    "message": "You don't have permission to perform this action.",
-                    "type": "permission_error"
-                }
-            )
-            
         except Exception as e:
-            # Unexpected errors
-            logger.error(
-                f"Unexpected error in {request.method} {request.url.path}",
+            # A partly sent response cannot be replaced
+            if response_started:
+                raise
+            
+            kind = get_error_kind(type(e))
+            logger.log(
+                kind.log_level,
+                f"{kind.log_label} in {scope['method']} {scope['path']}",
                 extra={
                     "error": str(e),
                     "error_type": type(e).__name__,
-                    "request_id": getattr(request.state, "request_id", "unknown")
+                    "request_id": scope.get("state", {}).get("request_id", "unknown")
                 },
-                exc_info=True
+                exc_info=kind.log_level >= logging.ERROR
             )
             
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": "Internal Server Error",
-                    "message": "An unexpected error occurred. Please try again later.",
-                    "type": "internal_server_error"
-                }
-            )
+            body = STATIC_ERROR_BODIES.get(kind)
+            if body is None:
+                body = encode_error_body(kind, kind.message.format(error=e))
+            response = Response(content=body, status_code=kind.status_code, media_type="application/json")
+            await response(scope, receive, send)
@@ -3,93 +3,117 @@ Logging middleware for Multi-Agent AI Chat System.
 
 This middleware logs HTTP requests and responses for monitoring and debugging.
 """
+import itertools
 import json
 import logging
+import os
 import time
-import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 logger = logging.getLogger(__name__)
 
+# Request IDs are the process ID followed by a per-process counter, both in
+# hex, which keeps them unique across workers without generating a UUID
+_request_counter = itertools.count()
+_pid = os.getpid() & 0xFFFF
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+# Polled and long-lived endpoints that are not worth logging per request
+_SKIP_PATHS = frozenset({"/health", "/"})
+_SKIP_PREFIXES = ("/ws",)
+
+
+class LoggingMiddleware:
     """
     Middleware for logging HTTP requests and responses.
     
     Logs request details, response status, and processing time
-    for monitoring and debugging purposes.
+    for monitoring and debugging purposes. Implemented as plain ASGI
+    middleware so WebSocket and lifespan traffic pass straight through.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and response with logging.
         
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in the chain
-            
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
+        if path in _SKIP_PATHS or path.startswith(_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        
         # Generate unique request ID for tracking
-        request_id = str(uuid.uuid4())[:8]
+        request_id = f"{_pid:04x}{next(_request_counter) & 0xFFFFFF:06x}"
         
         # Record request start time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Extract request information
-        method = request.method
-        url = str(request.url)
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
-        
-        # Log request
-        logger.info(
-            f"Request started",
-            extra={
-                "request_id": request_id,
-                "method": method,
-                "url": url,
-                "client_ip": client_ip,
-                "user_agent": user_agent
-            }
-        )
+        method = scope["method"]
+        url = str(URL(scope=scope))
         
-        # Add request ID to request state for use in endpoints
-        request.state.request_id = request_id
+        # Skip building log records nobody will see
+        log_info = logger.isEnabledFor(logging.INFO)
         
-        try:
-            # Process request
-            response = await call_next(request)
-            
-            # Calculate processing time
-            process_time = time.time() - start_time
-            
-            # Log successful response
+        # Log request
+        if log_info:
+            # Read the raw ASGI scope rather than building Address and Headers objects
+            client = scope.get("client")
+            user_agent = next(
+                (value.decode("latin-1") for key, value in scope["headers"] if key == b"user-agent"),
+                "unknown"
+            )
             logger.info(
-                f"Request completed",
+                f"Request started",
                 extra={
                     "request_id": request_id,
                     "method": method,
                     "url": url,
-                    "status_code": response.status_code,
-                    "process_time": round(process_time, 4)
+                    "client_ip": client[0] if client else "unknown",
+                    "user_agent": user_agent
                 }
             )
-            
-            # Add custom headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = str(round(process_time, 4))
-            
-            return response
-            
+        
+        # Add request ID to request state for use in endpoints
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        response_start = {}
+        
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time in seconds, formatted once for log and header
+                process_time = f"{(time.perf_counter_ns() - start_ns) / 1e9:.4f}"
+                response_start["status_code"] = message["status"]
+                response_start["process_time"] = process_time
+                
+                # Add custom headers
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-request-id", request_id.encode("latin-1")),
+                    (b"x-process-time", process_time.encode("latin-1")),
+                ]
+            await send(message)
+        
+        try:
+            # Process request
+            await self.app(scope, receive, send_with_headers)
+        
         except Exception as e:
             # Calculate processing time even for errors
-            process_time = time.time() - start_time
+            process_time = f"{(time.perf_counter_ns() - start_ns) / 1e9:.4f}"
             
             # Log error
             logger.error(
@@ -100,10 +124,23 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                     "url": url,
                     "error": str(e),
                     "error_type": type(e).__name__,
-                    "process_time": round(process_time, 4)
+                    "process_time": process_time
                 },
                 exc_info=True
             )
             
             # Re-raise the exception
             raise
+        
+        # Log successful response
+        if log_info and response_start:
+            logger.info(
+                f"Request completed",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "url": url,
+                    "status_code": response_start["status_code"],
+                    "process_time": response_start["process_time"]
+                }
+            )
@@ -4,22 +4,48 @@ Pydantic schemas for Multi-Agent AI Chat System API.
 This module defines request and response schemas for API endpoints,
 providing data validation and documentation for the FastAPI application.
 """
+import time
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, Any, List, Literal, Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, BeforeValidator, Field, ConfigDict
 
 from .models import ConversationStatus, MessageType, SenderType
 
 
+def enum_value(value: Any) -> Any:
+    """Unwrap an enum member read from the ORM to its value."""
+    return getattr(value, "value", value)
+
+
+# String literals mirroring the model enums; pydantic validates a Literal
+# faster than an Enum, and the values are what the API sends anyway.
+# Enum members from the ORM or service code are unwrapped before the check.
+SenderTypeLiteral = Annotated[
+    Literal[tuple(member.value for member in SenderType)], BeforeValidator(enum_value)
+]
+MessageTypeLiteral = Annotated[
+    Literal[tuple(member.value for member in MessageType)], BeforeValidator(enum_value)
+]
+ConversationStatusLiteral = Annotated[
+    Literal[tuple(member.value for member in ConversationStatus)], BeforeValidator(enum_value)
+]
+
+
 # Base schemas
 class BaseSchema(BaseModel):
-    """Base schema with common configuration."""
+    """
+    Base schema with common configuration.
+    
+    Validators and serializers are built on first use rather than at
+    import, so schemas a process never touches cost nothing.
+    """
     
     model_config = ConfigDict(
         from_attributes = True,
         use_enum_values = True,
+        defer_build = True,
     )
 
 
@@ -45,10 +71,10 @@ class AgentList(BaseSchema):
 class MessageCreate(BaseSchema):
     """Schema for creating a new message."""
     
-    sender_type: SenderType = Field(..., description="Whether sender is agent or user")
+    sender_type: SenderTypeLiteral = Field(..., description="Whether sender is agent or user")
     sender_id: str = Field(..., description="Agent ID or 'user'")
     content: str = Field(..., min_length=1, max_length=10000, description="Message content")
-    message_type: MessageType = Field(..., description="Type of message")
+    message_type: MessageTypeLiteral = Field(..., description="Type of message")
     parent_message_id: Optional[uuid.UUID] = Field(None, description="Parent message for threading")
     requires_user_response: bool = Field(False, description="Whether message requires user response")
 
@@ -58,10 +84,10 @@ class MessageResponse(BaseSchema):
     
     id: uuid.UUID
     conversation_id: uuid.UUID
-    sender_type: SenderType
+    sender_type: SenderTypeLiteral
     sender_id: str
     content: str
-    message_type: MessageType
+    message_type: MessageTypeLiteral
     parent_message_id: Optional[uuid.UUID] = None
     requires_user_response: bool
     created_at: datetime
@@ -71,6 +97,33 @@ class MessageResponse(BaseSchema):
     is_from_agent: bool = Field(..., description="Whether message is from an agent")
     is_from_user: bool = Field(..., description="Whether message is from a user")
     is_question_for_user: bool = Field(..., description="Whether this requires user response")
+    
+    @classmethod
+    def from_orm_fast(cls, message) -> "MessageResponse":
+        """
+        Build a response from a trusted ORM message without validation.
+        
+        Args:
+            message: Message loaded from the database
+            
+        Returns:
+            Message response schema
+        """
+        return cls.model_construct(
+            id=message.id,
+            conversation_id=message.conversation_id,
+            sender_type=enum_value(message.sender_type),
+            sender_id=message.sender_id,
+            content=message.content,
+            message_type=enum_value(message.message_type),
+            parent_message_id=message.parent_message_id,
+            requires_user_response=message.requires_user_response,
+            created_at=message.created_at,
+            agent_name=message.agent_name,
+            is_from_agent=message.is_from_agent,
+            is_from_user=message.is_from_user,
+            is_question_for_user=message.is_question_for_user,
+        )
 
 
 class MessageList(BaseSchema):
@@ -96,7 +149,7 @@ class ConversationCreate(BaseSchema):
 class ConversationUpdate(BaseSchema):
     """Schema for updating a conversation."""
     
-    status: Optional[ConversationStatus] = Field(None, description="Conversation status")
+    status: Optional[ConversationStatusLiteral] = Field(None, description="Conversation status")
     final_summary: Optional[str] = Field(None, description="Final summary when completed")
 
 
@@ -105,7 +158,7 @@ class ConversationResponse(BaseSchema):
     
     id: uuid.UUID
     goal_description: str
-    status: ConversationStatus
+    status: ConversationStatusLiteral
     final_summary: Optional[str] = None
     created_at: datetime
     updated_at: datetime
@@ -113,12 +166,61 @@ class ConversationResponse(BaseSchema):
     # Additional computed fields
     message_count: int = Field(..., description="Number of messages in conversation")
     is_waiting_for_user: bool = Field(..., description="Whether conversation is paused for user input")
+    
+    @staticmethod
+    def _orm_fields(conversation, message_count: Optional[int] = None) -> dict:
+        """Read the response fields from an ORM conversation."""
+        return dict(
+            id=conversation.id,
+            goal_description=conversation.goal_description,
+            status=enum_value(conversation.status),
+            final_summary=conversation.final_summary,
+            created_at=conversation.created_at,
+            updated_at=conversation.updated_at,
+            message_count=conversation.message_count if message_count is None else message_count,
+            is_waiting_for_user=conversation.is_waiting_for_user,
+        )
+    
+    @classmethod
+    def from_orm_fast(cls, conversation, message_count: Optional[int] = None) -> "ConversationResponse":
+        """
+        Build a response from a trusted ORM conversation without validation.
+        
+        Args:
+            conversation: Conversation loaded from the database
+            message_count: Message count queried alongside the conversation;
+                read from its loaded messages when omitted
+            
+        Returns:
+            Conversation response schema
+        """
+        return cls.model_construct(**cls._orm_fields(conversation, message_count))
 
 
 class ConversationDetail(ConversationResponse):
     """Schema for detailed conversation response including messages."""
     
     messages: List[MessageResponse] = Field(..., description="All messages in the conversation")
+    
+    @classmethod
+    def from_orm_fast(
+        cls, conversation, include_messages: bool = True, message_count: Optional[int] = None
+    ) -> "ConversationDetail":
+        """
+        Build a detailed response from a trusted ORM conversation without validation.
+        
+        Args:
+            conversation: Conversation loaded from the database; its messages
+                must be loaded when they are included
+            include_messages: Whether to include the conversation messages
+            message_count: Message count queried alongside the conversation;
+                read from its loaded messages when omitted
+            
+        Returns:
+            Detailed conversation response schema
+        """
+        messages = [MessageResponse.from_orm_fast(message) for message in conversation.messages] if include_messages else []
+        return cls.model_construct(**cls._orm_fields(conversation, message_count), messages=messages)
 
 
 class ConversationList(BaseSchema):
@@ -153,7 +255,7 @@ class WebSocketMessage(BaseSchema):
     type: str = Field(..., description="Message type")
     conversation_id: uuid.UUID = Field(..., description="Related conversation ID")
     data: dict = Field(..., description="Message payload")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Message timestamp")
+    timestamp: float = Field(default_factory=time.time, description="Message timestamp as Unix epoch seconds")
 
 
 # Error schemas
@@ -2,16 +2,20 @@
 Services for the Multi-Agent AI Chat System.
 """
 
-from .base_llm_service import LLMService
-from .llm_service import LLMServiceFactory
-from .conversation_manager import ConversationManager
-from .consensus_engine import ConsensusEngine
-from .flow_controller import FlowController
-from .decision_maker import DecisionMaker
-from .prompt_manager import PromptManager
-from .response_validator import ResponseValidator
+import importlib
 
-from .errors import LLMServiceError
+# Public name -> submodule providing it; resolved lazily on first access
+_LAZY_ATTRS = {
+    "LLMService": ".base_llm_service",
+    "LLMServiceFactory": ".llm_service",
+    "ConversationManager": ".conversation_manager",
+    "ConsensusEngine": ".consensus_engine",
+    "FlowController": ".flow_controller",
+    "DecisionMaker": ".decision_maker",
+    "PromptManager": ".prompt_manager",
+    "ResponseValidator": ".response_validator",
+    "LLMServiceError": ".errors",
+}
 
 __all__ = [
     "LLMService",
@@ -24,3 +28,13 @@ __all__ = [
     "ResponseValidator",
     "LLMServiceError",
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
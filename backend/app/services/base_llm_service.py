@@ -1,7 +1,9 @@
 """
 Abstract base class for all LLM services.
 """
+import asyncio
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional
 
 class LLMService(ABC):
     """Abstract base class for all LLM services."""
@@ -13,3 +15,39 @@ class LLMService(ABC):
     async def generate_response(self, prompt: str) -> str:
         """Generates a response from the LLM."""
         pass
+
+    async def generate_batch(
+        self, prompts: List[str], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[str]:
+        """
+        Generates responses for several prompts.
+
+        Providers without a native batch endpoint fall back to issuing the
+        requests concurrently; each request holds ``semaphore``, when given,
+        while it is in flight. Responses are returned in prompt order.
+        """
+        if semaphore is None:
+            return list(await asyncio.gather(*(self.generate_response(prompt) for prompt in prompts)))
+
+        async def generate(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate_response(prompt)
+
+        return list(await asyncio.gather(*(generate(prompt) for prompt in prompts)))
+
+    async def health_check(self) -> bool:
+        """
+        Reports whether the LLM backend is reachable.
+
+        Providers without a cheap probe endpoint are assumed healthy.
+        """
+        return True
+
+    async def generate_response_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Streams a response from the LLM chunk by chunk.
+
+        Providers without streaming support yield the full response as a
+        single chunk.
+        """
+        yield await self.generate_response(prompt)
@@ -3,6 +3,7 @@ Consensus Engine for the Multi-Agent AI Chat System.
 
 This module handles voting and consensus building.
 """
+from collections import Counter
 from typing import List, Dict
 
 from app.agents.interfaces import Proposal, Vote
@@ -13,6 +14,8 @@ class ConsensusEngine:
     def __init__(self):
         self.proposals: Dict[str, Proposal] = {}
         self.votes: Dict[str, List[Vote]] = {}
+        # proposal_id -> approvals so far; ballots are len(self.votes[...])
+        self._approvals: Counter = Counter()
 
     def add_proposal(self, proposal: Proposal):
         """Adds a new proposal to the consensus engine."""
@@ -21,14 +24,15 @@ class ConsensusEngine:
 
     def add_vote(self, vote: Vote):
         """Adds a vote for a proposal."""
-        if vote.proposal_id not in self.proposals:
+        votes = self.votes.get(vote.proposal_id)
+        if votes is None:
             raise ValueError(f"Proposal with id {vote.proposal_id} not found.")
-        self.votes[vote.proposal_id].append(vote)
+        # Votes are kept for DecisionMaker.compile_decision's voting summary
+        votes.append(vote)
+        if vote.approve:
+            self._approvals[vote.proposal_id] += 1
 
     def has_consensus(self, proposal_id: str, agent_count: int) -> bool:
-        """Checks if a proposal has reached consensus."""
-        if proposal_id not in self.votes:
-            return False
-
-        # Simple majority consensus for now
-        return len(self.votes[proposal_id]) >= (agent_count // 2) + 1
\ No newline at end of file
+        """Checks if a majority of agents approved a proposal."""
+        # Simple majority of approvals for now; unknown proposals count as zero
+        return self._approvals[proposal_id] >= (agent_count // 2) + 1
@@ -3,73 +3,133 @@ Conversation Manager for the Multi-Agent AI Chat System.
 
 This module is the core orchestrator for conversations.
 """
-from typing import List, TYPE_CHECKING
+import logging
+import time
+from typing import Any, Collection, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.agents.agent_manager import AgentManager
+    from app.agents.base import BaseAgent
     from app.api.websockets import ConnectionManager
+    from app.models.conversation import Conversation
 
-from app.agents.interfaces import Message, ConversationContext, ConversationPhase
-from app.models.conversation import Conversation # Assuming conversation model exists
+from app.agents.message_router import MessageRouter
+from app.agents.interfaces import Message, ConversationContext, ConversationHistory, ConversationPhase
 from app.services.flow_controller import FlowController
 from app.services.consensus_engine import ConsensusEngine
 from app.services.decision_maker import DecisionMaker
+from app.services.response_validator import ResponseValidator
+
+logger = logging.getLogger(__name__)
+
+# Agent LLM calls in flight at once per conversation, to respect provider rate limits
+MAX_CONCURRENT_RESPONSES = 4
 
 class ConversationManager:
     """Manages the lifecycle of a single conversation."""
 
-    def __init__(self, agent_manager: "AgentManager", conversation: Conversation, connection_manager: "ConnectionManager" = None):
+    def __init__(self, agent_manager: "AgentManager", conversation: "Conversation", connection_manager: "ConnectionManager" = None, max_concurrent_responses: int = MAX_CONCURRENT_RESPONSES):
         self.agent_manager = agent_manager
         self.conversation = conversation
         self.flow_controller = FlowController()
         self.consensus_engine = ConsensusEngine()
         self.decision_maker = DecisionMaker()
-        self.conversation_history: List[Message] = []
+        self.response_validator = ResponseValidator()
+        # Bounded: older messages are condensed so prompts stop growing
+        self.conversation_history = ConversationHistory()
+        # Built once and shared by every agent and phase: it holds the history
+        # list itself, so each render only formats messages added since the last
+        self.context = ConversationContext(
+            conversation_history=self.conversation_history,
+            current_goal=conversation.goal_description,
+        )
+        # Clients subscribe to a conversation by the string form of its ID
         self.connection_manager = connection_manager
+        self.channel = str(conversation.id)
+        self.max_concurrent_responses = max_concurrent_responses
+        self.message_router = MessageRouter(self, max_concurrency=max_concurrent_responses)
+        # Borrowed from the agent manager's pools while the conversation runs
+        self.agents: List["BaseAgent"] = []
+
+    def get_agents_in_conversation(self, conversation_id: Any) -> Collection["BaseAgent"]:
+        """Returns the agents taking part in the conversation; every configured agent joins."""
+        return self.agents
 
     async def start(self):
         """Starts the conversation."""
-        # Initial message to the agents
-        initial_message = Message(sender="system", content=f"New conversation started with goal: {self.conversation.goal_description}")
-        self.conversation_history.append(initial_message)
-        await self.run_conversation_loop()
+        # The agent manager is shared by all conversations; each one borrows
+        # its own agents and hands them back, reset, when it ends
+        with self.agent_manager.pooled_agents() as agents:
+            self.agents = agents
+            # Initial message to the agents
+            initial_message = Message(sender="system", content=f"New conversation started with goal: {self.conversation.goal_description}")
+            self.add_message(initial_message)
+            try:
+                await self.run_conversation_loop()
+            finally:
+                self.message_router.invalidate_recipients(self.conversation.id)
+                self.agents = []
+
+    def add_message(self, message: Message) -> None:
+        """Appends a message to the history and pushes it to the conversation's clients."""
+        self.conversation_history.append(message)
+        self._notify({
+            "type": "new_message",
+            "conversation_id": self.channel,
+            "data": {"sender": message.sender, "content": message.content},
+        })
+
+    def _notify(self, update: dict) -> None:
+        """Queues an update for the conversation's WebSocket clients, if any are tracked."""
+        if self.connection_manager is not None:
+            self.connection_manager.enqueue(update, self.channel)
 
     async def run_conversation_loop(self):
         """The main loop that drives the conversation."""
-        while self.flow_controller.get_current_phase() != ConversationPhase.COMPLETED:
-            current_phase = self.flow_controller.get_current_phase()
-            print(f"Conversation {self.conversation.id} is in phase: {current_phase}")
-
-            if current_phase == ConversationPhase.INITIALIZATION:
-                # In the initialization phase, each agent gets to ask a clarifying question.
-                await self.initialization_phase()
-                self.flow_controller.transition_to_next_phase()
-
-            elif current_phase == ConversationPhase.EXPLORATION:
-                # In the exploration phase, agents generate ideas.
-                await self.exploration_phase()
-                self.flow_controller.transition_to_next_phase()
-
-            elif current_phase == ConversationPhase.DISCUSSION:
-                # In the discussion phase, agents discuss the ideas.
-                await self.discussion_phase()
-                self.flow_controller.transition_to_next_phase()
-
-            elif current_phase == ConversationPhase.CONSENSUS:
-                # In the consensus phase, agents vote on proposals.
-                await self.consensus_phase()
-                self.flow_controller.transition_to_next_phase()
+        handlers = {
+            # In the initialization phase, each agent gets to ask a clarifying question.
+            ConversationPhase.INITIALIZATION: self.initialization_phase,
+            # In the exploration phase, agents generate ideas.
+            ConversationPhase.EXPLORATION: self.exploration_phase,
+            # In the discussion phase, agents discuss the ideas.
+            ConversationPhase.DISCUSSION: self.discussion_phase,
+            # In the consensus phase, agents vote on proposals.
+            ConversationPhase.CONSENSUS: self.consensus_phase,
+        }
+        flow_controller = self.flow_controller
+        current_phase = flow_controller.current_phase
+        # Skip formatting and timing entirely unless debug logging is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        while current_phase != ConversationPhase.COMPLETED:
+            if debug:
+                logger.debug(f"Conversation {self.conversation.id} is in phase: {current_phase.label}")
+                started = time.perf_counter()
+
+            await handlers[current_phase]()
+            if debug:
+                logger.debug(
+                    f"Conversation {self.conversation.id} finished phase {current_phase.label} "
+                    f"in {time.perf_counter() - started:.3f}s"
+                )
+            flow_controller.transition_to_next_phase()
+            current_phase = flow_controller.current_phase
+            self._notify({
+                "type": "phase_change",
+                "conversation_id": self.channel,
+                "phase": current_phase.label,
+            })
 
     async def initialization_phase(self):
         """The initialization phase of the conversation."""
-        for agent in self.agent_manager.get_all_agents():
-            context = ConversationContext(
-                conversation_history=self.conversation_history,
-                current_goal=self.conversation.goal_description,
-            )
-            response = await agent.generate_response(context)
-            message = Message(sender=agent.agent_id, content=response)
-            self.conversation_history.append(message)
+        # Every agent asks its question against the same history snapshot, so
+        # the router sends all their prompts as one batch, at most
+        # max_concurrent_responses in flight. The shared context renders that
+        # snapshot once for all of them.
+        turn = await self.message_router.generate_turn(self.context, self.conversation)
+
+        # Append in agent order so the history is deterministic
+        for agent, response in turn:
+            self.add_message(Message(sender=agent.agent_id, content=response))
 
     async def exploration_phase(self):
         """The exploration phase of the conversation."""
@@ -78,8 +138,20 @@ class ConversationManager:
 
     async def discussion_phase(self):
         """The discussion phase of the conversation."""
-        # Placeholder for discussion phase logic
-        pass
+        # Agents speak in turn, each replying to everything said so far, so
+        # their replies are generated one after another and streamed to the
+        # conversation's clients as they are written.
+        for agent in self.agents:
+            response = await self.stream_response(agent)
+            self.add_message(Message(sender=agent.agent_id, content=response))
+
+    async def stream_response(self, agent: "BaseAgent") -> str:
+        """Streams an agent's reply to the conversation's clients and returns it validated."""
+        chunks = agent.generate_response_stream(self.context)
+        validate = self.response_validator.clean_and_validate
+        if self.connection_manager is None:
+            return validate("".join([chunk async for chunk in chunks]))
+        return await self.connection_manager.stream_response(self.channel, agent.agent_id, chunks, validate)
 
     async def consensus_phase(self):
         """The consensus phase of the conversation."""
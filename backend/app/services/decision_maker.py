@@ -12,12 +12,14 @@ class DecisionMaker:
 
     def compile_decision(self, proposal: Proposal, votes: List[Vote]) -> str:
         """Compiles the final decision based on the proposal and votes."""
-        approved_votes = [vote for vote in votes if vote.approve]
-        decision = f"Proposal '{proposal.title}' has been approved with {len(approved_votes)} votes.\n"
-        decision += f"Description: {proposal.description}\n"
-        decision += "\nVoting Summary:\n"
+        approved_count = sum(1 for vote in votes if vote.approve)
+        parts = [
+            f"Proposal '{proposal.title}' has been approved with {approved_count} votes.\n",
+            f"Description: {proposal.description}\n",
+            "\nVoting Summary:\n",
+        ]
         for vote in votes:
-            decision += f"- {vote.agent_id}: {'Approve' if vote.approve else 'Reject'}\n"
+            parts.append(f"- {vote.agent_id}: {'Approve' if vote.approve else 'Reject'}\n")
             if vote.reasoning:
-                decision += f"  Reasoning: {vote.reasoning}\n"
-        return decision
\ No newline at end of file
+                parts.append(f"  Reasoning: {vote.reasoning}\n")
+        return "".join(parts)
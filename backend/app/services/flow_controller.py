@@ -8,6 +8,15 @@ from app.agents.interfaces import ConversationPhase
 class FlowController:
     """Manages the flow and phase of a conversation."""
 
+    # Phase that follows each phase; COMPLETED is terminal
+    _NEXT_PHASE = {
+        ConversationPhase.INITIALIZATION: ConversationPhase.EXPLORATION,
+        ConversationPhase.EXPLORATION: ConversationPhase.DISCUSSION,
+        ConversationPhase.DISCUSSION: ConversationPhase.CONSENSUS,
+        ConversationPhase.CONSENSUS: ConversationPhase.COMPLETED,
+        ConversationPhase.COMPLETED: ConversationPhase.COMPLETED,
+    }
+
     def __init__(self):
         self.current_phase = ConversationPhase.INITIALIZATION
 
@@ -17,11 +26,4 @@ class FlowController:
 
     def transition_to_next_phase(self):
         """Transitions the conversation to the next phase."""
-        if self.current_phase == ConversationPhase.INITIALIZATION:
-            self.current_phase = ConversationPhase.EXPLORATION
-        elif self.current_phase == ConversationPhase.EXPLORATION:
-            self.current_phase = ConversationPhase.DISCUSSION
-        elif self.current_phase == ConversationPhase.DISCUSSION:
-            self.current_phase = ConversationPhase.CONSENSUS
-        elif self.current_phase == ConversationPhase.CONSENSUS:
-            self.current_phase = ConversationPhase.COMPLETED
\ No newline at end of file
+        self.current_phase = self._NEXT_PHASE[self.current_phase]
@@ -0,0 +1,41 @@
+"""
+Shared HTTP client for the Multi-Agent AI Chat System LLM providers.
+
+Every provider sends its requests through one process-wide client so
+connections to the LLM backends are kept alive and reused instead of
+paying a TCP and TLS handshake per request.
+"""
+from typing import Optional
+
+import httpx
+
+# Default request timeout in seconds; LLM generations can be slow
+HTTP_TIMEOUT = 60.0
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Creation never awaits, so concurrent callers on the event loop always
+    receive the same client.
+
+    Returns:
+        Process-wide AsyncClient with HTTP/2 and connection pooling enabled
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
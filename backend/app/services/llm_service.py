@@ -3,35 +3,51 @@ LLM Service Factory for the Multi-Agent AI Chat System.
 
 This module provides a factory for creating LLM service instances.
 """
-from typing import Dict, Type
+import asyncio
+import importlib
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
 
 from app.services.base_llm_service import LLMService
 from app.services.prompt_manager import PromptManager
 from app.services.response_validator import ResponseValidator
-from app.services.providers.ollama_provider import OllamaProvider
-from app.services.providers.openrouter_provider import OpenRouterProvider
+
+if TYPE_CHECKING:
+    import httpx
 
 class LLMServiceFactory:
     """Factory for creating LLMService instances based on configuration."""
 
-    _providers: Dict[str, Type[LLMService]] = {
-        "ollama": OllamaProvider,
-        "openrouter": OpenRouterProvider,
+    # Provider name -> (module, class); providers and their HTTP stack are
+    # imported the first time a provider is created, not when this module is
+    _providers: Dict[str, Tuple[str, str]] = {
+        "ollama": ("app.services.providers.ollama_provider", "OllamaProvider"),
+        "openrouter": ("app.services.providers.openrouter_provider", "OpenRouterProvider"),
     }
 
     @classmethod
-    def create_llm_service(cls, provider_name: str, config: dict) -> LLMService:
-        """Creates an LLMService instance for the specified provider."""
-        provider_class = cls._providers.get(provider_name)
-        if not provider_class:
+    def get_provider_class(cls, provider_name: str) -> Type[LLMService]:
+        """Imports and returns the LLMService class for the specified provider."""
+        location = cls._providers.get(provider_name)
+        if not location:
             raise ValueError(f"Unknown LLM provider: {provider_name}")
-        return provider_class(config)
+        module_name, class_name = location
+        return getattr(importlib.import_module(module_name), class_name)
+
+    @classmethod
+    def create_llm_service(cls, provider_name: str, config: dict, client: Optional["httpx.AsyncClient"] = None) -> LLMService:
+        """Creates an LLMService instance for the specified provider."""
+        return cls.get_provider_class(provider_name)(config, client=client)
+
+    def __init__(self, config: dict, prompt_manager: PromptManager = None, response_validator: ResponseValidator = None, client: Optional["httpx.AsyncClient"] = None):
+        from app.services.http_client import get_http_client
 
-    def __init__(self, config: dict, prompt_manager: PromptManager = None, response_validator: ResponseValidator = None):
         self.config = config
+        # Providers share one pooled client so connections survive across factories
+        self.client = client or get_http_client()
         self.provider = self.create_llm_service(
             provider_name=config.get("provider", "ollama"),
-            config=config.get(config.get("provider", "ollama"), {})
+            config=config.get(config.get("provider", "ollama"), {}),
+            client=self.client
         )
         self.prompt_manager = prompt_manager or PromptManager()
         self.response_validator = response_validator or ResponseValidator()
@@ -39,9 +55,28 @@ class LLMServiceFactory:
     async def generate_response(self, prompt: str) -> str:
         """Generates a response using the configured LLM provider."""
         response = await self.provider.generate_response(prompt)
-        if not self.response_validator.validate_response(response):
-            raise ValueError("LLM response failed validation.")
-        return self.response_validator.clean_response(response)
+        return self._validate_and_clean(response)
+
+    async def generate_batch(
+        self, prompts: List[str], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[str]:
+        """
+        Generates responses for several prompts through the provider's batch path.
+
+        Neither provider has a native batch endpoint, so this issues one
+        request per prompt concurrently, each holding ``semaphore`` if given.
+        """
+        responses = await self.provider.generate_batch(prompts, semaphore)
+        return [self._validate_and_clean(response) for response in responses]
+
+    async def generate_response_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Streams response chunks from the configured LLM provider as they arrive."""
+        async for chunk in self.provider.generate_response_stream(prompt):
+            yield chunk
+
+    def _validate_and_clean(self, response: str) -> str:
+        """Validates a raw provider response and returns its cleaned form."""
+        return self.response_validator.clean_and_validate(response)
 
     def get_prompt_manager(self) -> PromptManager:
         """Returns the prompt manager instance."""
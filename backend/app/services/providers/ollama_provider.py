@@ -1,37 +1,82 @@
 """
 Ollama LLM Provider for the Multi-Agent AI Chat System.
 """
+from typing import AsyncIterator, Optional
+
 import httpx
+import orjson
 
 from app.services.base_llm_service import LLMService
 from app.services.errors import LLMServiceError
+from app.services.http_client import get_http_client
+
+# Request bodies are serialized with orjson and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 class OllamaProvider(LLMService):
     """Ollama LLM service implementation."""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, client: Optional[httpx.AsyncClient] = None):
         super().__init__(config)
+        self.client = client or get_http_client()
         self.base_url = config.get("base_url", "http://localhost:11434")
         self.model = config.get("model", "llama2")
 
     async def generate_response(self, prompt: str) -> str:
         """Generates a response from the Ollama LLM."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                    },
-                    timeout=60.0,
-                )
-                await response.raise_for_status()
-                return (await response.json())["response"]
+            response = await self.client.post(
+                f"{self.base_url}/api/generate",
+                content=orjson.dumps({
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                }),
+                headers=_JSON_HEADERS,
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)["response"]
         except httpx.RequestError as e:
             raise LLMServiceError(f"Network or request error communicating with Ollama: {e}", original_exception=e)
         except httpx.HTTPStatusError as e:
             raise LLMServiceError(f"Ollama API returned an error: {e.response.status_code} - {e.response.text}", original_exception=e)
         except Exception as e:
-            raise LLMServiceError(f"An unexpected error occurred during Ollama response generation: {e}", original_exception=e)
\ No newline at end of file
+            raise LLMServiceError(f"An unexpected error occurred during Ollama response generation: {e}", original_exception=e)
+
+    async def health_check(self) -> bool:
+        """Checks that the Ollama server answers its model listing endpoint."""
+        try:
+            response = await self.client.get(f"{self.base_url}/api/tags")
+            response.raise_for_status()
+            return True
+        except httpx.HTTPError:
+            return False
+
+    async def generate_response_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Streams a response from the Ollama LLM as newline-delimited JSON chunks."""
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/api/generate",
+                content=orjson.dumps({
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": True,
+                }),
+                headers=_JSON_HEADERS,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
+        except httpx.RequestError as e:
+            raise LLMServiceError(f"Network or request error communicating with Ollama: {e}", original_exception=e)
+        except httpx.HTTPStatusError as e:
+            raise LLMServiceError(f"Ollama API returned an error: {e.response.status_code}", original_exception=e)
+        except Exception as e:
+            raise LLMServiceError(f"An unexpected error occurred during Ollama response streaming: {e}", original_exception=e)
@@ -1,16 +1,21 @@
 """
 OpenRouter LLM Provider for the Multi-Agent AI Chat System.
 """
+from typing import AsyncIterator, Optional
+
 import httpx
+import orjson
 
 from app.services.base_llm_service import LLMService
 from app.services.errors import LLMServiceError
+from app.services.http_client import get_http_client
 
 class OpenRouterProvider(LLMService):
     """OpenRouter LLM service implementation."""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, client: Optional[httpx.AsyncClient] = None):
         super().__init__(config)
+        self.client = client or get_http_client()
         self.api_key = config.get("api_key")
         self.model = config.get("model", "openai/gpt-3.5-turbo")
         self.base_url = "https://openrouter.ai/api/v1"
@@ -30,18 +35,64 @@ class OpenRouterProvider(LLMService):
                 "messages": [{"role": "user", "content": prompt}],
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=data,
-                    timeout=60.0,
-                )
-                await response.raise_for_status()
-                return (await response.json())["choices"][0]["message"]["content"]
+            response = await self.client.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                content=orjson.dumps(data),
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)["choices"][0]["message"]["content"]
         except httpx.RequestError as e:
             raise LLMServiceError(f"Network or request error communicating with OpenRouter: {e}", original_exception=e)
         except httpx.HTTPStatusError as e:
             raise LLMServiceError(f"OpenRouter API returned an error: {e.response.status_code} - {e.response.text}", original_exception=e)
         except Exception as e:
-            raise LLMServiceError(f"An unexpected error occurred during OpenRouter response generation: {e}", original_exception=e)
\ No newline at end of file
+            raise LLMServiceError(f"An unexpected error occurred during OpenRouter response generation: {e}", original_exception=e)
+
+    async def health_check(self) -> bool:
+        """Checks that OpenRouter accepts the configured API key."""
+        try:
+            response = await self.client.get(
+                f"{self.base_url}/auth/key",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+            response.raise_for_status()
+            return True
+        except httpx.HTTPError:
+            return False
+
+    async def generate_response_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Streams a response from the OpenRouter LLM via server-sent events."""
+        try:
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+            data = {
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": True,
+            }
+
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                content=orjson.dumps(data),
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    payload = line[len("data: "):]
+                    if payload == "[DONE]":
+                        break
+                    content = orjson.loads(payload)["choices"][0]["delta"].get("content")
+                    if content:
+                        yield content
+        except httpx.RequestError as e:
+            raise LLMServiceError(f"Network or request error communicating with OpenRouter: {e}", original_exception=e)
+        except httpx.HTTPStatusError as e:
+            raise LLMServiceError(f"OpenRouter API returned an error: {e.response.status_code}", original_exception=e)
+        except Exception as e:
+            raise LLMServiceError(f"An unexpected error occurred during OpenRouter response streaming: {e}", original_exception=e)
@@ -9,8 +9,28 @@ class ResponseValidator:
 
     def validate_response(self, response: str) -> bool:
         """Performs basic validation on the LLM response."""
-        return bool(response and len(response.strip()) > 0)
+        # isspace() checks in place instead of building a stripped copy
+        return bool(response) and not response.isspace()
 
     def clean_response(self, response: str) -> str:
         """Cleans up the LLM response (e.g., removes leading/trailing whitespace)."""
         return response.strip()
+
+    def clean_and_validate(self, response: str) -> str:
+        """
+        Cleans up the LLM response and validates the result in one pass.
+
+        Args:
+            response: Raw response text from the LLM provider
+
+        Returns:
+            The response without leading/trailing whitespace
+
+        Raises:
+            ValueError: If the response is empty or only whitespace
+        """
+        # strip() returns the string itself when there is nothing to remove
+        cleaned = response.strip() if response else ""
+        if not cleaned:
+            raise ValueError("LLM response failed validation.")
+        return cleaned
@@ -13,11 +13,24 @@ Example:
 """
 import os
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Union
+from types import MappingProxyType
+from typing import Callable, ClassVar, Dict, List, Literal, Mapping, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+# Project root holding the .env files
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# URL schemes accepted by the validators below
+HTTP_SCHEMES = ("http://", "https://")
+DATABASE_SCHEMES = ("sqlite://", "postgresql://", "mysql://")
+
+# Read once; production worker sizing uses it on every Settings() build
+_CPU_COUNT = os.cpu_count() or 1
 
 
 class Environment(str, Enum):
@@ -43,7 +56,18 @@ class LLMProvider(str, Enum):
     BOTH = "both"  # Try ollama first, fallback to openrouter
 
 
-class DatabaseSettings(BaseModel):
+class SettingsSection(BaseModel):
+    """
+    Base for the nested configuration sections.
+    
+    Validators are built when settings are first created rather than at
+    import, so importing this module stays cheap.
+    """
+    
+    model_config = ConfigDict(defer_build=True)
+
+
+class DatabaseSettings(SettingsSection):
     """
     Database configuration settings.
     
@@ -95,12 +119,12 @@ class DatabaseSettings(BaseModel):
         """Validate database URL format."""
         if not v:
             raise ValueError("Database URL cannot be empty")
-        if not (v.startswith('sqlite://') or v.startswith('postgresql://') or v.startswith('mysql://')):
+        if not v.startswith(DATABASE_SCHEMES):
             raise ValueError("Database URL must use sqlite://, postgresql://, or mysql:// scheme")
         return v
 
 
-class SecuritySettings(BaseModel):
+class SecuritySettings(SettingsSection):
     """
     Security configuration settings.
     
@@ -109,6 +133,8 @@ class SecuritySettings(BaseModel):
         cors_credentials: Allow credentials in CORS
         cors_methods: Allowed HTTP methods
         cors_headers: Allowed headers
+        cors_expose_headers: Response headers readable by browser clients
+        cors_max_age: Seconds browsers may cache preflight responses
         api_keys: API keys for external services
         rate_limit_per_minute: Rate limiting threshold
         secret_key: Application secret key
@@ -132,9 +158,18 @@ class SecuritySettings(BaseModel):
         description="Allowed HTTP methods"
     )
     cors_headers: List[str] = Field(
-        default=["*"],
+        default=["authorization", "content-type", "x-request-id"],
         description="Allowed headers"
     )
+    cors_expose_headers: List[str] = Field(
+        default=["X-Request-ID", "X-Process-Time"],
+        description="Response headers exposed to browser clients"
+    )
+    cors_max_age: int = Field(
+        default=86400,
+        ge=0,
+        description="Seconds browsers may cache CORS preflight responses"
+    )
     api_keys: Dict[str, str] = Field(
         default_factory=dict,
         description="API keys for external services"
@@ -154,13 +189,13 @@ class SecuritySettings(BaseModel):
     @classmethod
     def validate_cors_origins(cls, v):
         """Validate CORS origins format."""
-        for origin in v:
-            if not origin.startswith(('http://', 'https://')):
-                raise ValueError(f"Invalid CORS origin format: {origin}")
+        invalid = next((origin for origin in v if not origin.startswith(HTTP_SCHEMES)), None)
+        if invalid is not None:
+            raise ValueError(f"Invalid CORS origin format: {invalid}")
         return v
 
 
-class OllamaSettings(BaseModel):
+class OllamaSettings(SettingsSection):
     """
     Ollama (local LLM) configuration.
     
@@ -203,12 +238,12 @@ class OllamaSettings(BaseModel):
     @classmethod
     def validate_base_url(cls, v):
         """Validate Ollama base URL format."""
-        if not v.startswith(('http://', 'https://')):
+        if not v.startswith(HTTP_SCHEMES):
             raise ValueError("Ollama base URL must start with http:// or https://")
         return v.rstrip('/')
 
 
-class OpenRouterSettings(BaseModel):
+class OpenRouterSettings(SettingsSection):
     """
     OpenRouter (cloud LLM) configuration.
     
@@ -261,7 +296,7 @@ class OpenRouterSettings(BaseModel):
         return v
 
 
-class LLMSettings(BaseModel):
+class LLMSettings(SettingsSection):
     """
     LLM (Language Learning Model) configuration.
     
@@ -311,7 +346,7 @@ class LLMSettings(BaseModel):
     )
 
 
-class AgentSettings(BaseModel):
+class AgentSettings(SettingsSection):
     """
     Agent behavior configuration.
     
@@ -360,7 +395,7 @@ class AgentSettings(BaseModel):
     )
 
 
-class LoggingSettings(BaseModel):
+class LoggingSettings(SettingsSection):
     """
     Logging configuration.
     
@@ -403,7 +438,7 @@ class LoggingSettings(BaseModel):
     )
 
 
-class ServerSettings(BaseModel):
+class ServerSettings(SettingsSection):
     """
     Server configuration.
     
@@ -536,7 +571,8 @@ class Settings(BaseSettings):
         description="Logging configuration"
     )
     
-    model_config = ConfigDict(
+    model_config = SettingsConfigDict(
+        defer_build = True,
         env_file = ".env",
         env_file_encoding = "utf-8",
         env_nested_delimiter = "__",
@@ -544,54 +580,63 @@ class Settings(BaseSettings):
         extra = "ignore", # Allow extra fields for compatibility
     )
     
-    @field_validator('debug')
-    @classmethod
-    def validate_debug_in_production(cls, v, info):
+    # (predicate, issue) pairs checked by validate_production_readiness
+    _PRODUCTION_CHECKS: ClassVar[Tuple[Tuple[Callable[["Settings"], bool], str], ...]] = (
+        (lambda s: s.debug, "Debug mode should be disabled in production"),
+        (lambda s: "localhost" in s.database.url, "Production should not use localhost database"),
+        (
+            lambda s: not s.llm.openrouter.api_key and s.llm.provider != LLMProvider.OLLAMA,
+            "OpenRouter API key required for production LLM"
+        ),
+        (lambda s: not s.security.secret_key, "Secret key required for production security"),
+        (lambda s: s.server.host == "127.0.0.1", "Production server should listen on 0.0.0.0"),
+    )
+    
+    @model_validator(mode="after")
+    def validate_debug_in_production(self) -> "Settings":
         """Ensure debug is disabled in production."""
-        environment = info.data.get('environment')
-        if environment == Environment.PRODUCTION and v:
+        if self.environment == Environment.PRODUCTION and self.debug:
             raise ValueError("Debug mode must be disabled in production")
-        return v
+        return self
     
-    @field_validator('logging')
-    @classmethod
-    def configure_logging_for_environment(cls, v, info):
+    @model_validator(mode="after")
+    def configure_logging_for_environment(self) -> "Settings":
         """Configure logging based on environment."""
-        environment = info.data.get('environment')
-        debug = info.data.get('debug', True)
+        environment = self.environment
+        logging_settings = self.logging
         
         if environment == Environment.DEVELOPMENT:
-            v.level = LogLevel.DEBUG if debug else LogLevel.INFO
-            v.console_output = True
+            logging_settings.level = LogLevel.DEBUG if self.debug else LogLevel.INFO
+            logging_settings.console_output = True
         elif environment == Environment.TESTING:
-            v.level = LogLevel.WARNING
-            v.console_output = False
+            logging_settings.level = LogLevel.WARNING
+            logging_settings.console_output = False
         elif environment == Environment.PRODUCTION:
-            v.level = LogLevel.INFO
-            v.json_format = True
-            v.console_output = True
+            logging_settings.level = LogLevel.INFO
+            logging_settings.json_format = True
+            logging_settings.console_output = True
         
-        return v
+        return self
     
-    @field_validator('server')
-    @classmethod
-    def configure_server_for_environment(cls, v, info):
+    @model_validator(mode="after")
+    def configure_server_for_environment(self) -> "Settings":
         """Configure server based on environment."""
-        environment = info.data.get('environment')
+        environment = self.environment
+        server = self.server
         
         if environment == Environment.DEVELOPMENT:
-            v.reload = True
-            v.workers = 1
+            server.reload = True
+            server.workers = 1
         elif environment == Environment.TESTING:
-            v.reload = False
-            v.workers = 1
-            v.access_log = False
+            server.reload = False
+            server.workers = 1
+            server.access_log = False
         elif environment == Environment.PRODUCTION:
-            v.reload = False
-            v.workers = min(4, (os.cpu_count() or 1) + 1)
-            v.host = "0.0.0.0"  # Listen on all interfaces
+            server.reload = False
+            server.workers = min(4, _CPU_COUNT + 1)
+            server.host = "0.0.0.0"  # Listen on all interfaces
         
-        return v
+        return self
     
     @property
     def is_development(self) -> bool:
@@ -612,14 +657,22 @@ class Settings(BaseSettings):
         """Get properly formatted database URL."""
         return self.database.url
     
-    def get_cors_config(self) -> Dict[str, Union[List[str], bool]]:
+    @cached_property
+    def cors_config(self) -> Mapping[str, Union[Tuple[str, ...], bool, int]]:
+        """Read-only CORS configuration for FastAPI, built on first access."""
+        security = self.security
+        return MappingProxyType({
+            "allow_origins": tuple(security.cors_origins),
+            "allow_credentials": security.cors_credentials,
+            "allow_methods": tuple(security.cors_methods),
+            "allow_headers": tuple(security.cors_headers),
+            "expose_headers": tuple(security.cors_expose_headers),
+            "max_age": security.cors_max_age,
+        })
+    
+    def get_cors_config(self) -> Mapping[str, Union[Tuple[str, ...], bool, int]]:
         """Get CORS configuration for FastAPI."""
-        return {
-            "allow_origins": self.security.cors_origins,
-            "allow_credentials": self.security.cors_credentials,
-            "allow_methods": self.security.cors_methods,
-            "allow_headers": self.security.cors_headers,
-        }
+        return self.cors_config
     
     def validate_production_readiness(self) -> List[str]:
         """
@@ -628,25 +681,18 @@ class Settings(BaseSettings):
         Returns:
             List of configuration issues (empty if valid)
         """
-        issues = []
-        
-        if self.environment == Environment.PRODUCTION:
-            if self.debug:
-                issues.append("Debug mode should be disabled in production")
-            
-            if "localhost" in self.database.url:
-                issues.append("Production should not use localhost database")
-            
-            if not self.llm.openrouter.api_key and self.llm.provider != LLMProvider.OLLAMA:
-                issues.append("OpenRouter API key required for production LLM")
-            
-            if not self.security.secret_key:
-                issues.append("Secret key required for production security")
-            
-            if self.server.host == "127.0.0.1":
-                issues.append("Production server should listen on 0.0.0.0")
-        
-        return issues
+        if self.environment != Environment.PRODUCTION:
+            return []
+        return [message for check, message in self._PRODUCTION_CHECKS if check(self)]
+
+
+# Environment-specific .env files, falling back to DEFAULT_ENV_FILE
+DEFAULT_ENV_FILE = BASE_DIR / ".env"
+ENV_FILES = {
+    Environment.DEVELOPMENT: BASE_DIR / ".env.development",
+    Environment.TESTING: BASE_DIR / ".env.testing",
+    Environment.PRODUCTION: BASE_DIR / ".env.production",
+}
 
 
 # Configuration factory functions
@@ -666,31 +712,26 @@ def get_environment() -> Environment:
         return Environment.DEVELOPMENT
 
 
+@lru_cache(maxsize=4)
 def get_env_file_path(environment: Environment) -> str:
     """
     Get environment-specific .env file path.
     
+    The result is cached per environment; ``reload_settings`` clears it so
+    newly created .env files are picked up.
+    
     Args:
         environment: Target environment
         
     Returns:
         Path to environment-specific .env file
     """
-    base_path = Path(__file__).parent.parent
-    
-    env_files = {
-        Environment.DEVELOPMENT: base_path / ".env.development",
-        Environment.TESTING: base_path / ".env.testing", 
-        Environment.PRODUCTION: base_path / ".env.production"
-    }
-    
-    env_file = env_files.get(environment, base_path / ".env")
+    env_file = ENV_FILES.get(environment, DEFAULT_ENV_FILE)
     
     # Fallback to generic .env if environment-specific file doesn't exist
     if not env_file.exists():
-        fallback = base_path / ".env"
-        if fallback.exists():
-            return str(fallback)
+        if DEFAULT_ENV_FILE.exists():
+            return str(DEFAULT_ENV_FILE)
     
     return str(env_file)
 
@@ -725,14 +766,14 @@ def create_settings(environment: Optional[Environment] = None) -> Settings:
     return settings
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get global settings instance (singleton pattern).
     
+    Settings are built on the first call and cached; use ``reload_settings``
+    to pick up environment changes.
+    
     Returns:
         Global settings instance
         
@@ -742,12 +783,7 @@ def get_settings() -> Settings:
         settings = get_settings()
         print(f"Running in {settings.environment} mode")
     """
-    global _settings
-    
-    if _settings is None:
-        _settings = create_settings()
-    
-    return _settings
+    return create_settings()
 
 
 def reload_settings() -> Settings:
@@ -757,10 +793,13 @@ def reload_settings() -> Settings:
     Returns:
         Newly loaded settings instance
     """
-    global _settings
-    _settings = None
+    get_env_file_path.cache_clear()
+    get_settings.cache_clear()
     return get_settings()
 
 
-# Legacy compatibility
-settings = get_settings()
+def __getattr__(name: str):
+    """Expose the legacy ``settings`` attribute without building it at import."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,12 +6,12 @@ This script tests the FastAPI application by making HTTP requests
 to the API endpoints and verifying responses.
 """
 import asyncio
-import json
 import sys
 from pathlib import Path
 from typing import Dict, Any
 
 import httpx
+import orjson
 
 # Add backend app to Python path
 backend_path = Path(__file__).parent / "backend"
@@ -23,19 +23,22 @@ class APITester:
     
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
+        # One client for every request, so the keep-alive connection is reused
         self.client = httpx.AsyncClient(base_url=base_url)
     
     async def get(self, endpoint: str) -> Dict[Any, Any]:
         """Make GET request to endpoint."""
         response = await self.client.get(endpoint)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     async def post(self, endpoint: str, data: Dict[Any, Any]) -> Dict[Any, Any]:
         """Make POST request to endpoint."""
-        response = await self.client.post(endpoint, json=data)
+        response = await self.client.post(
+            endpoint, content=orjson.dumps(data), headers={"Content-Type": "application/json"}
+        )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     async def close(self):
         """Close the HTTP client."""
@@ -29,3 +29,22 @@ def test_get_agent(mock_llm_service):
 
     with pytest.raises(KeyError):
         agent_manager.get_agent("non_existent_agent")
+
+def test_pooled_agent(mock_llm_service):
+    """Test that pooled agents are reused across borrows."""
+    agent_manager = AgentManager(llm_service=mock_llm_service)
+    with agent_manager.pooled_agent("project_manager") as agent:
+        assert agent.agent_id == "project_manager"
+    with agent_manager.pooled_agent("project_manager") as reused_agent:
+        assert reused_agent is agent
+
+    with pytest.raises(KeyError):
+        agent_manager.pooled_agent("non_existent_agent")
+
+def test_pooled_agents(mock_llm_service):
+    """Test that every configured agent can be borrowed at once and is returned afterwards."""
+    agent_manager = AgentManager(llm_service=mock_llm_service)
+    with agent_manager.pooled_agents() as agents:
+        assert [agent.agent_id for agent in agents] == list(agent_manager.agents)
+        assert all(len(pool) == 0 for pool in agent_manager.pools.values())
+    assert all(len(pool) == 1 for pool in agent_manager.pools.values())
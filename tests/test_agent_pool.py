@@ -0,0 +1,46 @@
+"""
+Unit tests for the AgentPool.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from app.agents.agent_pool import AgentPool
+
+@pytest.fixture
+def factory():
+    """Fixture to create a factory producing distinct mock agents."""
+    return MagicMock(side_effect=lambda: MagicMock())
+
+def test_acquire_creates_agent_when_pool_is_empty(factory):
+    """Test that acquire falls back to the factory when no agent is idle."""
+    pool = AgentPool(factory=factory, max_size=2)
+    agent = pool.acquire()
+    assert agent is not None
+    factory.assert_called_once()
+
+def test_release_resets_and_reuses_agent(factory):
+    """Test that a released agent is reset and handed out again."""
+    pool = AgentPool(factory=factory, max_size=2)
+    agent = pool.acquire()
+    pool.release(agent)
+
+    agent.reset.assert_called_once()
+    assert len(pool) == 1
+    assert pool.acquire() is agent
+    factory.assert_called_once()
+
+def test_release_drops_agents_beyond_max_size(factory):
+    """Test that the pool never holds more than max_size idle agents."""
+    pool = AgentPool(factory=factory, max_size=1)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert len(pool) == 1
+
+def test_agent_context_manager_returns_agent_to_pool(factory):
+    """Test that the agent context manager releases the agent on exit."""
+    pool = AgentPool(factory=factory, max_size=1)
+    with pool.agent() as agent:
+        assert len(pool) == 0
+    assert len(pool) == 1
+    assert pool.acquire() is agent
@@ -5,31 +5,29 @@ import pytest
 from unittest.mock import AsyncMock
 
 from app.agents.config import get_agent_config
-from app.agents.specific_agents import (
-    ProjectManagerAgent,
-    TechnicalArchitectAgent,
-    CreativeStrategistAgent,
-    QualityAssuranceAgent,
-    ResourceCoordinatorAgent,
-)
-from app.agents.interfaces import ConversationContext, Message
+from app.agents.specific_agents import DefaultAgent
+from app.agents.interfaces import ConversationContext, ConversationHistory, Message
 
 @pytest.fixture
 def mock_llm_service():
     """Fixture to create a mock LLM service."""
     mock = AsyncMock()
     mock.generate_response = AsyncMock(return_value="Mocked LLM response")
+
+    async def generate_response_stream(prompt):
+        yield "Mocked LLM response"
+
+    mock.generate_response_stream = generate_response_stream
     return mock
 
 @pytest.mark.asyncio
 async def test_project_manager_agent_creation(mock_llm_service):
-    """Test that the ProjectManagerAgent can be created."""
+    """Test that an agent can be created from the project manager config."""
     config = get_agent_config("project_manager")
-    agent = ProjectManagerAgent(
+    agent = DefaultAgent(
         agent_id="project_manager",
         name=config.name,
         role=config.role,
-        personality_prompt=config.system_prompt,
         system_prompt=config.system_prompt,
         llm_service=mock_llm_service,
     )
@@ -37,13 +35,12 @@ async def test_project_manager_agent_creation(mock_llm_service):
 
 @pytest.mark.asyncio
 async def test_project_manager_agent_generate_response(mock_llm_service):
-    """Test the generate_response method of the ProjectManagerAgent."""
+    """Test the generate_response method of the project manager agent."""
     config = get_agent_config("project_manager")
-    agent = ProjectManagerAgent(
+    agent = DefaultAgent(
         agent_id="project_manager",
         name=config.name,
         role=config.role,
-        personality_prompt=config.system_prompt,
         system_prompt=config.system_prompt,
         llm_service=mock_llm_service,
     )
@@ -53,4 +50,109 @@ async def test_project_manager_agent_generate_response(mock_llm_service):
     )
     response = await agent.generate_response(context)
     assert response == "Mocked LLM response"
-    mock_llm_service.generate_response.assert_called_once()
+    mock_llm_service.generate_response.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_generate_response_joins_and_validates_stream(mock_llm_service):
+    """Test that generate_response joins the streamed chunks and validates the whole reply once."""
+    async def fake_stream(prompt):
+        for chunk in [" Mocked ", "stream "]:
+            yield chunk
+
+    mock_llm_service.generate_response_stream = fake_stream
+    config = get_agent_config("project_manager")
+    agent = DefaultAgent(
+        agent_id="project_manager",
+        name=config.name,
+        role=config.role,
+        system_prompt=config.system_prompt,
+        llm_service=mock_llm_service,
+    )
+    context = ConversationContext(
+        conversation_history=[Message(sender="user", content="Hello")],
+        current_goal="Test goal",
+    )
+    assert await agent.generate_response(context) == "Mocked stream"
+
+    async def blank_stream(prompt):
+        yield "  "
+
+    mock_llm_service.generate_response_stream = blank_stream
+    with pytest.raises(ValueError):
+        await agent.generate_response(context)
+
+def test_conversation_context_render_is_incremental():
+    """Test that ConversationContext.render only appends newly added messages."""
+    context = ConversationContext(
+        conversation_history=[Message(sender="user", content="Hello")],
+        current_goal="Test goal",
+    )
+    assert context.render() == "user: Hello"
+
+    context.conversation_history.append(Message(sender="project_manager", content="Hi there"))
+    assert context.render() == "user: Hello\nproject_manager: Hi there"
+    assert context.rendered_upto == 2
+
+def test_conversation_history_condenses_messages_leaving_the_window():
+    """Test that ConversationHistory keeps a bounded window and summarizes older messages."""
+    history = ConversationHistory(window=2, summary_chars=40)
+    for i in range(4):
+        history.append(Message(sender=f"agent{i}", content="x" * 10))
+
+    assert [m.sender for m in history] == ["agent2", "agent3"]
+    assert history.total == 4
+    assert history.dropped == 2
+    assert history.summary == "agent0: xxxxxxxxxx\nagent1: xxxxxxxxxx"
+
+    history.append(Message(sender="agent4", content="x" * 10))
+    # The oldest summary line no longer fits and is dropped whole
+    assert history.summary == "agent1: xxxxxxxxxx\nagent2: xxxxxxxxxx"
+
+def test_conversation_context_render_stays_bounded():
+    """Test that rendering rebuilds from the summary once messages leave the window."""
+    history = ConversationHistory(window=2)
+    context = ConversationContext(conversation_history=history, current_goal="Test goal")
+    history.append(Message(sender="user", content="one"))
+    history.append(Message(sender="agent", content="two"))
+    assert context.render() == "user: one\nagent: two"
+
+    history.append(Message(sender="user", content="three"))
+    assert context.render() == "user: one\nagent: two\nuser: three"
+    assert context.conversation_history is history
+
+@pytest.mark.asyncio
+async def test_process_message_echoes_content(mock_llm_service):
+    """Test that process_message echoes the message with the agent name."""
+    config = get_agent_config("project_manager")
+    agent = DefaultAgent(
+        agent_id="project_manager",
+        name=config.name,
+        role=config.role,
+        system_prompt=config.system_prompt,
+        llm_service=mock_llm_service,
+    )
+    response = await agent.process_message(Message(sender="user", content="Hello"))
+    assert response.content == "Alex PM received: Hello"
+
+@pytest.mark.asyncio
+async def test_generate_response_stream(mock_llm_service):
+    """Test that generate_response_stream relays chunks from the LLM service."""
+    async def fake_stream(prompt):
+        for chunk in ["Mocked ", "stream"]:
+            yield chunk
+
+    mock_llm_service.generate_response_stream = fake_stream
+    config = get_agent_config("project_manager")
+    agent = DefaultAgent(
+        agent_id="project_manager",
+        name=config.name,
+        role=config.role,
+        system_prompt=config.system_prompt,
+        llm_service=mock_llm_service,
+    )
+    context = ConversationContext(
+        conversation_history=[Message(sender="user", content="Hello")],
+        current_goal="Test goal",
+    )
+    chunks = [chunk async for chunk in agent.generate_response_stream(context)]
+    assert chunks == ["Mocked ", "stream"]
@@ -3,9 +3,10 @@ Unit/integration tests for the Conversation API endpoints.
 """
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 import uuid
 from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
 from app.db import get_db
@@ -13,13 +14,16 @@ from app.models import Conversation, ConversationStatus, Message, MessageType, S
 from app.services.llm_service import LLMServiceFactory
 from app.agents.agent_manager import AgentManager
 from app.services.conversation_manager import ConversationManager as ServiceConversationManager
-from app.api.websockets import ConnectionManager
+from app.api.websockets import ConnectionManager, manager as global_connection_manager
 
 # Fixtures for mocking dependencies
 @pytest.fixture
 def mock_db_session():
-    """Mock database session."""
-    return MagicMock()
+    """Mock async database session."""
+    session = MagicMock(spec=AsyncSession)
+    # Results are plain objects; only the session calls themselves are awaited
+    session.execute.return_value = MagicMock()
+    return session
 
 @pytest.fixture
 def mock_llm_service_factory():
@@ -64,7 +68,7 @@ def test_create_conversation(client, mock_db_session):
     mock_db_session.add.return_value = None
     mock_db_session.commit.return_value = None
     mock_db_session.refresh.return_value = None
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_conversation
+    mock_db_session.get.return_value = mock_conversation
 
     response = client.post("/api/conversations", json=conversation_data)
     assert response.status_code == 201
@@ -74,61 +78,100 @@ def test_create_conversation(client, mock_db_session):
 def test_list_conversations(client, mock_db_session):
     """Test GET /api/conversations."""
     mock_conversation = MagicMock(spec=Conversation, id=uuid.uuid4(), goal_description="Test", status=ConversationStatus.ACTIVE, message_count=0, is_waiting_for_user=False, created_at=datetime.now(), updated_at=datetime.now(), final_summary=None)
-    mock_db_session.query.return_value.count.return_value = 1
-    mock_db_session.query.return_value.filter.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [mock_conversation]
+    mock_db_session.execute.return_value.all.return_value = [MagicMock(Conversation=mock_conversation, message_count=3, total=1)]
 
     response = client.get("/api/conversations")
     assert response.status_code == 200
     assert response.json()["count"] == 1
     assert response.json()["conversations"][0]["goal_description"] == "Test"
+    assert response.json()["conversations"][0]["message_count"] == 3
+
+def test_list_conversations_past_end_keeps_total(client, mock_db_session):
+    """Test GET /api/conversations beyond the last page still reports the total."""
+    mock_db_session.execute.return_value.all.return_value = []
+    mock_db_session.scalar.return_value = 7
+
+    response = client.get("/api/conversations", params={"skip": 50})
+    assert response.status_code == 200
+    assert response.json() == {"conversations": [], "count": 7}
+    mock_db_session.scalar.assert_awaited_once()
+
+def test_list_conversations_empty_first_page_skips_count(client, mock_db_session):
+    """Test GET /api/conversations with no results needs no extra count query."""
+    mock_db_session.execute.return_value.all.return_value = []
+
+    response = client.get("/api/conversations")
+    assert response.json()["count"] == 0
+    mock_db_session.scalar.assert_not_called()
 
 def test_get_conversation(client, mock_db_session):
     """Test GET /api/conversations/{id}."""
     conv_id = uuid.uuid4()
     mock_conversation = MagicMock(spec=Conversation, id=conv_id, goal_description="Test", status=ConversationStatus.ACTIVE, message_count=0, is_waiting_for_user=False, messages=[], created_at=datetime.now(), updated_at=datetime.now(), final_summary=None)
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_conversation
+    mock_db_session.get.return_value = mock_conversation
 
     response = client.get(f"/api/conversations/{conv_id}")
     assert response.status_code == 200
     assert response.json()["id"] == str(conv_id)
     assert response.json()["goal_description"] == "Test"
 
+def test_get_conversation_without_messages(client, mock_db_session):
+    """Test GET /api/conversations/{id} counts messages instead of loading them."""
+    conv_id = uuid.uuid4()
+    mock_conversation = MagicMock(spec=Conversation, id=conv_id, goal_description="Test", status=ConversationStatus.ACTIVE, is_waiting_for_user=False, created_at=datetime.now(), updated_at=datetime.now(), final_summary=None)
+    mock_db_session.execute.return_value.first.return_value = (mock_conversation, 5)
+
+    response = client.get(f"/api/conversations/{conv_id}", params={"include_messages": False})
+    assert response.status_code == 200
+    assert response.json()["message_count"] == 5
+    assert response.json()["messages"] == []
+    mock_db_session.get.assert_not_called()
+
 def test_update_conversation(client, mock_db_session):
     """Test PUT /api/conversations/{id}."""
     conv_id = uuid.uuid4()
     mock_conversation = MagicMock(spec=Conversation, id=conv_id, goal_description="Test", status=ConversationStatus.ACTIVE, message_count=0, is_waiting_for_user=False, created_at=datetime.now(), updated_at=datetime.now(), final_summary=None)
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_conversation
+    mock_db_session.execute.return_value.first.return_value = (mock_conversation, 2)
 
     update_data = {"status": "paused", "final_summary": "Updated summary"}
     response = client.put(f"/api/conversations/{conv_id}", json=update_data)
     assert response.status_code == 200
     assert response.json()["status"] == "paused"
     assert response.json()["final_summary"] == "Updated summary"
+    assert response.json()["message_count"] == 2
+    mock_db_session.commit.assert_awaited_once()
+    mock_db_session.refresh.assert_awaited_once_with(mock_conversation, ["updated_at"])
 
 def test_delete_conversation(client, mock_db_session):
     """Test DELETE /api/conversations/{id}."""
     conv_id = uuid.uuid4()
     mock_conversation = MagicMock(spec=Conversation, id=conv_id)
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_conversation
+    mock_db_session.get.return_value = mock_conversation
 
     response = client.delete(f"/api/conversations/{conv_id}")
     assert response.status_code == 204
-    mock_db_session.delete.assert_called_once_with(mock_conversation)
-    mock_db_session.commit.assert_called_once()
+    mock_db_session.delete.assert_awaited_once_with(mock_conversation)
+    mock_db_session.commit.assert_awaited_once()
 
-@pytest.mark.asyncio
-async def test_start_conversation_discussion(client, mock_db_session, mock_llm_service_factory, mock_agent_manager, mock_connection_manager):
+def test_start_conversation_discussion(client, mock_db_session):
     """Test POST /api/conversations/{id}/start."""
     conv_id = uuid.uuid4()
-    mock_conversation = MagicMock(spec=Conversation, id=conv_id, goal_description="Test goal", status=ConversationStatus.ACTIVE, message_count=0, is_waiting_for_user=False, created_at=datetime.now(), updated_at=datetime.now())
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_conversation
+    mock_conversation = MagicMock(spec=Conversation, id=conv_id, goal_description="Test goal", status=ConversationStatus.ACTIVE, is_waiting_for_user=False, created_at=datetime.now(), updated_at=datetime.now(), final_summary=None)
+    mock_db_session.execute.return_value.first.return_value = (mock_conversation, 0)
 
     # Mock the service-level ConversationManager's start method
-    with patch('app.services.conversation_manager.ServiceConversationManager.start', new_callable=AsyncMock) as mock_service_conv_manager_start:
+    with patch('app.services.conversation_manager.ConversationManager.__init__', return_value=None) as mock_init, \
+            patch('app.services.conversation_manager.ConversationManager.start', new_callable=AsyncMock) as mock_start:
         response = client.post(f"/api/conversations/{conv_id}/start")
-        assert response.status_code == 200
+        assert response.status_code == 202
         assert response.json()["id"] == str(conv_id)
-        mock_service_conv_manager_start.assert_called_once()
+        mock_start.assert_called_once()
+
+    # The discussion reuses the startup agent manager and pushes updates to WebSocket clients
+    kwargs = mock_init.call_args.kwargs
+    assert kwargs["agent_manager"] is client.app.state.agent_manager
+    assert kwargs["agent_manager"].llm_service is client.app.state.llm_factory
+    assert kwargs["connection_manager"] is global_connection_manager
 
 # --- Message Operations Tests ---
 
@@ -136,7 +179,7 @@ def test_create_message(client, mock_db_session):
     """Test POST /api/conversations/{id}/messages."""
     conv_id = uuid.uuid4()
     mock_conversation = MagicMock(spec=Conversation, id=conv_id, status=ConversationStatus.ACTIVE, created_at=datetime.now(), updated_at=datetime.now(), message_count=0, is_waiting_for_user=False)
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_conversation
+    mock_db_session.get.return_value = mock_conversation
 
     message_data = {
         "sender_type": "user",
@@ -145,11 +188,6 @@ def test_create_message(client, mock_db_session):
         "message_type": "user_response",
         "requires_user_response": False
     }
-    mock_message = MagicMock(spec=Message, id=uuid.uuid4(), conversation_id=conv_id, created_at=datetime.now(), agent_name="User", is_from_agent=False, is_from_user=True, is_question_for_user=False, **message_data)
-    mock_db_session.add.return_value = None
-    mock_db_session.commit.return_value = None
-    mock_db_session.refresh.return_value = None
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_message
 
     response = client.post(f"/api/conversations/{conv_id}/messages", json=message_data)
     assert response.status_code == 201
@@ -160,9 +198,8 @@ def test_get_conversation_messages(client, mock_db_session):
     conv_id = uuid.uuid4()
     mock_conversation = MagicMock(spec=Conversation, id=conv_id, created_at=datetime.now(), updated_at=datetime.now(), status=ConversationStatus.ACTIVE, final_summary=None)
     mock_message = MagicMock(spec=Message, id=uuid.uuid4(), conversation_id=conv_id, content="Test message", sender_id="user", sender_type=SenderType.USER, message_type=MessageType.DISCUSSION, requires_user_response=False, agent_name="User", is_from_agent=False, is_from_user=True, is_question_for_user=False, created_at=datetime.now(), parent_message_id=None)
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_conversation
-    mock_db_session.query.return_value.filter.return_value.count.return_value = 1
-    mock_db_session.query.return_value.filter.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [mock_message]
+    mock_db_session.get.return_value = mock_conversation
+    mock_db_session.execute.return_value.all.return_value = [MagicMock(Message=mock_message, total=1)]
 
     response = client.get(f"/api/conversations/{conv_id}/messages")
     assert response.status_code == 200
@@ -174,8 +211,8 @@ def test_get_pending_user_messages(client, mock_db_session):
     conv_id = uuid.uuid4()
     mock_conversation = MagicMock(spec=Conversation, id=conv_id, created_at=datetime.now(), updated_at=datetime.now(), status=ConversationStatus.ACTIVE, final_summary=None)
     mock_message = MagicMock(spec=Message, id=uuid.uuid4(), conversation_id=conv_id, content="Pending message", sender_id="agent", sender_type=SenderType.AGENT, message_type=MessageType.QUESTION_TO_USER, requires_user_response=True, agent_name="Project Manager", is_from_agent=True, is_from_user=False, is_question_for_user=True, created_at=datetime.now(), parent_message_id=None)
-    mock_db_session.query.return_value.filter.return_value.first.return_value = mock_conversation
-    mock_db_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = [mock_message]
+    mock_db_session.get.return_value = mock_conversation
+    mock_db_session.execute.return_value.scalars.return_value.all.return_value = [mock_message]
 
     response = client.get(f"/api/conversations/{conv_id}/messages/pending")
     assert response.status_code == 200
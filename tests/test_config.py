@@ -129,6 +129,11 @@ def test_utility_methods(monkeypatch):
     cors_config = settings.get_cors_config()
     assert len(cors_config['allow_origins']) == 4
     assert cors_config['allow_credentials'] is True
+    assert "*" not in cors_config['allow_headers']
+    assert cors_config['max_age'] == 86400
+    assert settings.get_cors_config() is cors_config
+    with pytest.raises(TypeError):
+        cors_config['allow_credentials'] = False
 
 def test_production_validation(monkeypatch):
     """Test production readiness validation."""
@@ -199,3 +204,37 @@ def test_environment_specific_config(monkeypatch):
             assert settings.server.access_log is False
             assert settings.database.echo is False
 
+
+def test_settings_are_cached_until_reloaded():
+    """Test that get_settings returns one cached instance until reload_settings."""
+    import backend.config as config
+
+    first = get_settings()
+    assert get_settings() is first
+    assert config.settings is first
+
+    reloaded = reload_settings()
+    assert reloaded is not first
+    assert get_settings() is reloaded
+
+def test_env_file_path_is_cached_per_environment():
+    """Test that env file resolution is memoized and cleared by reload_settings."""
+    from backend.config import BASE_DIR, get_env_file_path
+
+    path = get_env_file_path(Environment.TESTING)
+    assert Path(path).parent == BASE_DIR
+    assert get_env_file_path(Environment.TESTING) is path
+
+    reload_settings()
+    assert get_env_file_path.cache_info().currsize == 1  # only the reload's own lookup
+
+def test_url_scheme_validation():
+    """Test that URL fields reject unsupported schemes and name the bad CORS origin."""
+    from pydantic import ValidationError
+    from backend.config import DatabaseSettings, OllamaSettings, SecuritySettings
+
+    with pytest.raises(ValidationError, match="Invalid CORS origin format: ftp://example.com"):
+        SecuritySettings(cors_origins=["https://example.com", "ftp://example.com"])
+    with pytest.raises(ValidationError, match="sqlite://, postgresql://, or mysql://"):
+        DatabaseSettings(url="oracle://db")
+    assert OllamaSettings(base_url="http://ollama:11434/").base_url == "http://ollama:11434"
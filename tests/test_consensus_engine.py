@@ -38,3 +38,21 @@ def test_has_consensus(consensus_engine: ConsensusEngine):
     
     consensus_engine.add_vote(vote2)
     assert consensus_engine.has_consensus("prop1", agent_count=3)
+
+def test_has_consensus_counts_only_approvals(consensus_engine: ConsensusEngine):
+    """Test that rejections do not count towards consensus."""
+    proposal = Proposal(id="prop1", title="Test Proposal", description="A test proposal.", proposed_by="agent1")
+    consensus_engine.add_proposal(proposal)
+
+    consensus_engine.add_vote(Vote(proposal_id="prop1", agent_id="agent2", approve=True))
+    consensus_engine.add_vote(Vote(proposal_id="prop1", agent_id="agent3", approve=False))
+    assert not consensus_engine.has_consensus("prop1", agent_count=3)
+
+    consensus_engine.add_vote(Vote(proposal_id="prop1", agent_id="agent4", approve=True))
+    assert consensus_engine.has_consensus("prop1", agent_count=3)
+
+def test_unknown_proposal(consensus_engine: ConsensusEngine):
+    """Test that votes for unknown proposals are rejected and never reach consensus."""
+    with pytest.raises(ValueError):
+        consensus_engine.add_vote(Vote(proposal_id="missing", agent_id="agent2", approve=True))
+    assert not consensus_engine.has_consensus("missing", agent_count=1)
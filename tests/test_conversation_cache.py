@@ -0,0 +1,47 @@
+"""
+Unit tests for the conversation existence cache.
+"""
+import uuid
+from unittest.mock import patch
+
+from app.api.conversation_cache import ConversationCache
+
+
+def test_add_and_contains():
+    """Test that added conversations are reported until discarded."""
+    cache = ConversationCache()
+    conv_id = uuid.uuid4()
+
+    assert not cache.contains(conv_id)
+    cache.add(conv_id)
+    assert cache.contains(conv_id)
+
+    cache.discard(conv_id)
+    assert not cache.contains(conv_id)
+
+
+def test_entries_expire():
+    """Test that entries are dropped once their TTL has passed."""
+    cache = ConversationCache(ttl=30.0)
+    conv_id = uuid.uuid4()
+
+    with patch("app.api.conversation_cache.time.monotonic", return_value=100.0):
+        cache.add(conv_id)
+    with patch("app.api.conversation_cache.time.monotonic", return_value=129.0):
+        assert cache.contains(conv_id)
+    with patch("app.api.conversation_cache.time.monotonic", return_value=130.0):
+        assert not cache.contains(conv_id)
+
+
+def test_max_size_clears_cache():
+    """Test that reaching max_size starts the cache afresh."""
+    cache = ConversationCache(max_size=2)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    cache.add(first)
+    cache.add(second)
+    cache.add(third)
+
+    assert not cache.contains(first)
+    assert not cache.contains(second)
+    assert cache.contains(third)
@@ -1,24 +1,65 @@
 """
 Unit tests for the ConversationManager.
 """
+import asyncio
+from contextlib import nullcontext
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from app.services.conversation_manager import ConversationManager
-from app.models.conversation import Conversation
 from app.agents.agent_manager import AgentManager
+from app.agents.interfaces import ConversationPhase, Message
+from app.services.base_llm_service import LLMService
+
+class EchoService(LLMService):
+    """LLM service answering each prompt after an optional per-prompt delay."""
+
+    def __init__(self, delays=None):
+        super().__init__(config={})
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate_response(self, prompt):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delays.get(prompt, 0))
+        self.in_flight -= 1
+        return f"{prompt} response"
+
+def make_agent(agent_id, llm_service, prompts=None):
+    """Create a mock agent whose prompt is its ID, recording the context it was built from."""
+    agent = MagicMock()
+    agent.agent_id = agent_id
+    agent.llm_service = llm_service
+
+    def build_prompt(context):
+        if prompts is not None:
+            prompts.append((context, context.rendered_history))
+        return agent_id
+
+    async def generate_response_stream(context):
+        for chunk in (f" {agent_id}", " says hi "):
+            yield chunk
+
+    agent.build_prompt = build_prompt
+    agent.generate_response_stream = generate_response_stream
+    return agent
 
 @pytest.fixture
 def mock_agent_manager():
     """Fixture to create a mock AgentManager."""
     mock = MagicMock(spec=AgentManager)
     mock.get_all_agents = MagicMock(return_value=[])
+    # Conversations borrow one pooled agent per configured agent
+    mock.pooled_agents = MagicMock(side_effect=lambda: nullcontext(list(mock.get_all_agents())))
     return mock
 
 @pytest.fixture
 def mock_conversation():
     """Fixture to create a mock Conversation."""
-    mock = MagicMock(spec=Conversation)
+    mock = MagicMock()
     mock.id = "conv1"
     mock.goal_description = "Test goal"
     return mock
@@ -41,3 +82,138 @@ async def test_start(mock_agent_manager, mock_conversation):
     assert len(manager.conversation_history) == 1
     assert manager.conversation_history[0].sender == "system"
     manager.run_conversation_loop.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_initialization_phase_shares_context(mock_agent_manager, mock_conversation):
+    """Test that all agents in the initialization phase read the same history snapshot."""
+    contexts = []
+    llm_service = EchoService()
+    manager = ConversationManager(agent_manager=mock_agent_manager, conversation=mock_conversation)
+    manager.agents = [make_agent("agent1", llm_service, contexts), make_agent("agent2", llm_service, contexts)]
+    manager.conversation_history.append(Message(sender="system", content="Goal"))
+
+    await manager.initialization_phase()
+
+    assert contexts[0][0] is contexts[1][0]
+    assert contexts[0][1] == contexts[1][1] == "system: Goal"
+    assert [m.sender for m in manager.conversation_history] == ["system", "agent1", "agent2"]
+
+@pytest.mark.asyncio
+async def test_initialization_phase_runs_agents_concurrently(mock_agent_manager, mock_conversation):
+    """Test that agent responses overlap, bounded by max_concurrent_responses, and keep agent order."""
+    llm_service = EchoService(delays={f"agent{i}": 0.01 * (3 - i) for i in range(3)})
+    manager = ConversationManager(
+        agent_manager=mock_agent_manager, conversation=mock_conversation, max_concurrent_responses=2
+    )
+    manager.agents = [make_agent(f"agent{i}", llm_service) for i in range(3)]
+
+    await manager.initialization_phase()
+
+    assert llm_service.peak == 2
+    assert [m.content for m in manager.conversation_history] == [
+        "agent0 response", "agent1 response", "agent2 response"
+    ]
+
+@pytest.mark.asyncio
+async def test_run_conversation_loop_runs_each_phase_once(mock_agent_manager, mock_conversation):
+    """Test that the loop dispatches every phase handler in order, then stops."""
+    manager = ConversationManager(agent_manager=mock_agent_manager, conversation=mock_conversation)
+    calls = []
+    for name in ("initialization_phase", "exploration_phase", "discussion_phase", "consensus_phase"):
+        setattr(manager, name, AsyncMock(side_effect=lambda name=name: calls.append(name)))
+
+    await manager.run_conversation_loop()
+
+    assert calls == ["initialization_phase", "exploration_phase", "discussion_phase", "consensus_phase"]
+    assert manager.flow_controller.get_current_phase() == ConversationPhase.COMPLETED
+
+@pytest.mark.asyncio
+async def test_context_is_reused_across_calls(mock_agent_manager, mock_conversation):
+    """Test that the manager keeps one context that tracks its history list."""
+    manager = ConversationManager(agent_manager=mock_agent_manager, conversation=mock_conversation)
+    manager.run_conversation_loop = AsyncMock()
+
+    await manager.start()
+
+    assert manager.context.conversation_history is manager.conversation_history
+    assert manager.context.rendered_history == "system: New conversation started with goal: Test goal"
+
+@pytest.mark.asyncio
+async def test_messages_and_phase_changes_are_pushed_to_clients(mock_agent_manager, mock_conversation):
+    """Test that every appended message and phase change is queued for the conversation's clients."""
+    connection_manager = MagicMock()
+    connection_manager.stream_response = AsyncMock(return_value="agent1 says hi")
+    mock_agent_manager.get_all_agents = MagicMock(return_value=[make_agent("agent1", EchoService())])
+    manager = ConversationManager(
+        agent_manager=mock_agent_manager, conversation=mock_conversation, connection_manager=connection_manager
+    )
+
+    await manager.start()
+
+    updates = [call.args for call in connection_manager.enqueue.call_args_list]
+    assert all(channel == "conv1" for _, channel in updates)
+    assert [update["type"] for update, _ in updates] == [
+        "new_message", "new_message", "phase_change", "phase_change",
+        "new_message", "phase_change", "phase_change"
+    ]
+    assert updates[1][0]["data"] == {"sender": "agent1", "content": "agent1 response"}
+    assert updates[4][0]["data"] == {"sender": "agent1", "content": "agent1 says hi"}
+    assert [update["phase"] for update, _ in updates if update["type"] == "phase_change"] == [
+        "exploration", "discussion", "consensus", "completed"
+    ]
+
+@pytest.mark.asyncio
+async def test_discussion_phase_streams_each_agent_in_turn(mock_agent_manager, mock_conversation):
+    """Test that discussion replies stream through the connection manager with validation."""
+    connection_manager = MagicMock()
+    connection_manager.stream_response = AsyncMock(side_effect=["first", "second"])
+    manager = ConversationManager(
+        agent_manager=mock_agent_manager, conversation=mock_conversation, connection_manager=connection_manager
+    )
+    manager.agents = [make_agent("agent1", EchoService()), make_agent("agent2", EchoService())]
+
+    await manager.discussion_phase()
+
+    calls = connection_manager.stream_response.await_args_list
+    assert [call.args[:2] for call in calls] == [("conv1", "agent1"), ("conv1", "agent2")]
+    assert calls[0].args[3] == manager.response_validator.clean_and_validate
+    assert [(m.sender, m.content) for m in manager.conversation_history] == [("agent1", "first"), ("agent2", "second")]
+
+@pytest.mark.asyncio
+async def test_discussion_phase_without_clients_validates_reply(mock_agent_manager, mock_conversation):
+    """Test that without a connection manager the streamed reply is assembled and cleaned."""
+    manager = ConversationManager(agent_manager=mock_agent_manager, conversation=mock_conversation)
+    manager.agents = [make_agent("agent1", EchoService())]
+
+    await manager.discussion_phase()
+
+    assert manager.conversation_history[-1].content == "agent1 says hi"
+
+@pytest.mark.asyncio
+async def test_recipients_are_dropped_when_conversation_ends(mock_agent_manager, mock_conversation):
+    """Test that the router forgets the conversation's recipients once the loop finishes."""
+    mock_agent_manager.get_all_agents = MagicMock(return_value=[make_agent("agent1", EchoService())])
+    manager = ConversationManager(agent_manager=mock_agent_manager, conversation=mock_conversation)
+
+    await manager.start()
+
+    assert "conv1" not in manager.message_router._recipients_by_sender
+
+@pytest.mark.asyncio
+async def test_start_borrows_agents_for_the_conversation(mock_conversation):
+    """Test that a conversation runs on pooled agents and hands them back when it ends."""
+    agent_manager = AgentManager(llm_service=EchoService())
+    manager = ConversationManager(agent_manager=agent_manager, conversation=mock_conversation)
+    borrowed = []
+
+    async def record_agents():
+        borrowed.extend(manager.agents)
+
+    manager.run_conversation_loop = record_agents
+
+    await manager.start()
+
+    assert [agent.agent_id for agent in borrowed] == list(agent_manager.pools)
+    assert all(agent not in agent_manager.agents.values() for agent in borrowed)
+    assert manager.agents == []
+    assert all(len(pool) == 1 for pool in agent_manager.pools.values())
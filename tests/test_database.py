@@ -0,0 +1,151 @@
+"""
+Tests for database engine and session configuration.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+
+def run_with_database_url(database_url, script):
+    """Run a script in a fresh interpreter so the module-level engines see the URL."""
+    env = {**os.environ, "DATABASE_URL": database_url, "PYTHONPATH": BACKEND_DIR}
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(script)],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_in_memory_database_is_shared_with_get_db():
+    """Rows written through the sync engine are visible to get_db sessions."""
+    result = run_with_database_url("sqlite:///:memory:", """
+        import asyncio
+        from sqlalchemy import text
+        from app.db import DatabaseSession, async_engine, engine, get_db
+
+        with engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+        with DatabaseSession() as db:
+            db.execute(text("INSERT INTO notes (body) VALUES ('hello')"))
+
+        async def read_notes():
+            async for db in get_db():
+                notes = (await db.execute(text("SELECT body FROM notes"))).scalars().all()
+            # The driver thread keeps the interpreter alive until the pool closes
+            await async_engine.dispose()
+            return notes
+
+        print(asyncio.run(read_notes()))
+    """)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "['hello']"
+
+
+# Minimal mapped table, so session behaviour is checked without the app models
+NOTES_TABLE = """
+        from sqlalchemy import Column, Integer, String
+        from sqlalchemy.orm import declarative_base
+        from app.db import engine
+
+        Base = declarative_base()
+
+        class Note(Base):
+            __tablename__ = "notes"
+            id = Column(Integer, primary_key=True)
+            body = Column(String)
+
+        Base.metadata.create_all(engine)
+    """
+
+
+def test_repeated_query_uses_compiled_cache():
+    """Repeating an ORM query reuses its compiled statement."""
+    result = run_with_database_url("sqlite:///:memory:", NOTES_TABLE + """
+        from sqlalchemy import event, select
+        from app.db import DatabaseSession
+
+        cache_stats = []
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def record_cache_stats(conn, cursor, statement, parameters, context, executemany):
+            cache_stats.append(context.cache_hit.name)
+
+        with DatabaseSession() as db:
+            for note_id in (1, 2):
+                db.execute(select(Note).where(Note.id == note_id)).all()
+        print(cache_stats[-1])
+    """)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "CACHE_HIT"
+
+
+def test_database_session_commits_only_writes():
+    """Read-only blocks roll back; blocks that wrote commit."""
+    result = run_with_database_url("sqlite:///:memory:", NOTES_TABLE + """
+        from sqlalchemy import event, select, text
+        from app.db import DatabaseSession
+
+        commits = []
+        event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+        with DatabaseSession() as db:
+            db.execute(select(Note)).all()
+        print(len(commits))
+
+        with DatabaseSession() as db:
+            db.add(Note(body="hello"))
+            db.flush()
+        print(len(commits))
+
+        with DatabaseSession() as db:
+            db.execute(text("UPDATE notes SET body = 'bye'"))
+        print(len(commits))
+    """)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["0", "1", "2"]
+
+
+def test_init_database_skips_up_to_date_schema():
+    """Startup only creates tables when the stored schema fingerprint differs."""
+    result = run_with_database_url("sqlite:///:memory:", """
+        from app.db import database
+
+        created = []
+        database.get_schema_version = lambda: 1234
+        database.create_tables = lambda: created.append(True)
+
+        database.init_database()
+        print(database.get_stored_schema_version(), len(created))
+        database.init_database()
+        print(len(created))
+        database.set_schema_version(0)
+        database.init_database()
+        print(len(created))
+    """)
+
+    assert result.returncode == 0, result.stderr
+    lines = [line for line in result.stdout.splitlines() if not line.startswith("Database initialized")]
+    assert lines == ["1234 1", "1", "2"]
+
+
+def test_in_memory_url_uses_shared_cache():
+    """Both engines point at the same named in-memory database."""
+    result = run_with_database_url("sqlite://", """
+        from app.db import ASYNC_DATABASE_URL, DATABASE_URL
+        print(DATABASE_URL)
+        print(ASYNC_DATABASE_URL)
+    """)
+
+    assert result.returncode == 0, result.stderr
+    sync_url, async_url = result.stdout.split()
+    assert "mode=memory&cache=shared" in sync_url
+    assert async_url == sync_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
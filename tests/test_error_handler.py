@@ -0,0 +1,47 @@
+"""
+Unit tests for the error handling middleware.
+"""
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+
+from app.middleware.error_handler import ErrorHandlerMiddleware
+
+
+def make_client(exc: Exception) -> TestClient:
+    """Create a client for an app whose only route raises the given exception."""
+    app = FastAPI()
+    app.add_middleware(ErrorHandlerMiddleware)
+
+    @app.get("/fail")
+    async def fail():
+        raise exc
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.mark.parametrize("exc, status_code, error_type, message", [
+    (IntegrityError("INSERT", {}, Exception("constraint")), 500, "database_error",
+     "A database error occurred. Please try again later."),
+    (ValueError("bad goal"), 400, "validation_error", "bad goal"),
+    (KeyError("goal"), 400, "missing_data_error", "Required data is missing: 'goal'"),
+    (PermissionError("nope"), 403, "permission_error", "You don't have permission to perform this action."),
+    (RuntimeError("boom"), 500, "internal_server_error", "An unexpected error occurred. Please try again later."),
+])
+def test_exceptions_map_to_error_responses(exc, status_code, error_type, message):
+    """Test that each exception family maps to its status code and body."""
+    response = make_client(exc).get("/fail")
+
+    assert response.status_code == status_code
+    body = response.json()
+    assert body["type"] == error_type
+    assert body["message"] == message
+
+
+def test_http_exceptions_pass_through():
+    """Test that HTTP exceptions are left for FastAPI to handle."""
+    response = make_client(HTTPException(status_code=404, detail="Missing")).get("/fail")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Missing"}
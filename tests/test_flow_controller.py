@@ -26,3 +26,11 @@ def test_flow_controller_transitions():
     
     flow_controller.transition_to_next_phase()
     assert flow_controller.get_current_phase() == ConversationPhase.COMPLETED
+
+def test_flow_controller_stays_completed():
+    """Test that transitioning from COMPLETED keeps the conversation completed."""
+    flow_controller = FlowController()
+    flow_controller.current_phase = ConversationPhase.COMPLETED
+
+    flow_controller.transition_to_next_phase()
+    assert flow_controller.get_current_phase() == ConversationPhase.COMPLETED
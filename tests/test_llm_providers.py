@@ -2,57 +2,54 @@
 Unit tests for LLM Providers (OllamaProvider, OpenRouterProvider).
 """
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 import httpx
+import orjson
 
 from app.services.providers.ollama_provider import OllamaProvider
 from app.services.providers.openrouter_provider import OpenRouterProvider
 from app.services.errors import LLMServiceError
+from app.services.http_client import close_http_client, get_http_client
 
 @pytest.fixture
 def mock_httpx_client():
-    """Fixture to mock httpx.AsyncClient."""
-    with patch('httpx.AsyncClient') as mock_client_class:
-        mock_client_instance = AsyncMock()
-        mock_client_class.return_value = mock_client_instance
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-        mock_client_instance.__aexit__.return_value = False
-        yield mock_client_instance
+    """Fixture to mock the httpx.AsyncClient injected into providers."""
+    return AsyncMock(spec=httpx.AsyncClient)
 
 @pytest.mark.asyncio
 async def test_ollama_provider_generate_response(mock_httpx_client):
     """Test OllamaProvider's generate_response method."""
-    mock_response = AsyncMock()
-    mock_response.json.return_value = {"response": "Ollama test response"}
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps({"response": "Ollama test response"})
     mock_response.raise_for_status.return_value = None
     mock_httpx_client.post.return_value = mock_response
 
     config = {"base_url": "http://localhost:11434", "model": "llama2"}
-    provider = OllamaProvider(config)
+    provider = OllamaProvider(config, client=mock_httpx_client)
     response = await provider.generate_response("Test prompt for Ollama")
 
     assert response == "Ollama test response"
     mock_httpx_client.post.assert_called_once_with(
         "http://localhost:11434/api/generate",
-        json={
+        content=orjson.dumps({
             "model": "llama2",
             "prompt": "Test prompt for Ollama",
             "stream": False,
-        },
-        timeout=60.0,
+        }),
+        headers={"Content-Type": "application/json"},
     )
 
 @pytest.mark.asyncio
 async def test_ollama_provider_generate_response_error(mock_httpx_client):
     """Test OllamaProvider's generate_response method with an error."""
-    mock_response = AsyncMock()
+    mock_response = MagicMock()
     mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
         message="Bad Request", request=httpx.Request("POST", "url"), response=httpx.Response(400)
     )
     mock_httpx_client.post.return_value = mock_response
 
     config = {"base_url": "http://localhost:11434", "model": "llama2"}
-    provider = OllamaProvider(config)
+    provider = OllamaProvider(config, client=mock_httpx_client)
 
     with pytest.raises(LLMServiceError):
         await provider.generate_response("Test prompt for Ollama")
@@ -60,13 +57,13 @@ async def test_ollama_provider_generate_response_error(mock_httpx_client):
 @pytest.mark.asyncio
 async def test_openrouter_provider_generate_response(mock_httpx_client):
     """Test OpenRouterProvider's generate_response method."""
-    mock_response = AsyncMock()
-    mock_response.json.return_value = {"choices": [{"message": {"content": "OpenRouter test response"}}]}
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps({"choices": [{"message": {"content": "OpenRouter test response"}}]})
     mock_response.raise_for_status.return_value = None
     mock_httpx_client.post.return_value = mock_response
 
     config = {"api_key": "test_key", "model": "openai/gpt-3.5-turbo"}
-    provider = OpenRouterProvider(config)
+    provider = OpenRouterProvider(config, client=mock_httpx_client)
     response = await provider.generate_response("Test prompt for OpenRouter")
 
     assert response == "OpenRouter test response"
@@ -76,24 +73,23 @@ async def test_openrouter_provider_generate_response(mock_httpx_client):
             "Authorization": "Bearer test_key",
             "Content-Type": "application/json",
         },
-        json={
+        content=orjson.dumps({
             "model": "openai/gpt-3.5-turbo",
             "messages": [{"role": "user", "content": "Test prompt for OpenRouter"}],
-        },
-        timeout=60.0,
+        }),
     )
 
 @pytest.mark.asyncio
 async def test_openrouter_provider_generate_response_error(mock_httpx_client):
     """Test OpenRouterProvider's generate_response method with an error."""
-    mock_response = AsyncMock()
+    mock_response = MagicMock()
     mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
         message="Unauthorized", request=httpx.Request("POST", "url"), response=httpx.Response(401)
     )
     mock_httpx_client.post.return_value = mock_response
 
     config = {"api_key": "test_key", "model": "openai/gpt-3.5-turbo"}
-    provider = OpenRouterProvider(config)
+    provider = OpenRouterProvider(config, client=mock_httpx_client)
 
     with pytest.raises(LLMServiceError):
         await provider.generate_response("Test prompt for OpenRouter")
@@ -101,4 +97,73 @@ async def test_openrouter_provider_generate_response_error(mock_httpx_client):
 def test_openrouter_provider_no_api_key():
     """Test that OpenRouterProvider raises ValueError if no API key is provided."""
     with pytest.raises(ValueError, match="OpenRouter API key is not provided in the configuration."):
-        OpenRouterProvider({"model": "openai/gpt-3.5-turbo"})
\ No newline at end of file
+        OpenRouterProvider({"model": "openai/gpt-3.5-turbo"})
+@pytest.mark.asyncio
+async def test_ollama_provider_generate_response_stream(mock_httpx_client):
+    """Test OllamaProvider's generate_response_stream yields chunks until done."""
+    lines = [
+        '{"response": "Hello", "done": false}',
+        '',
+        '{"response": " world", "done": false}',
+        '{"response": "", "done": true}',
+    ]
+
+    async def aiter_lines():
+        for line in lines:
+            yield line
+
+    stream_response = MagicMock()
+    stream_response.aiter_lines = aiter_lines
+    stream_context = MagicMock()
+    stream_context.__aenter__ = AsyncMock(return_value=stream_response)
+    stream_context.__aexit__ = AsyncMock(return_value=False)
+    mock_httpx_client.stream = MagicMock(return_value=stream_context)
+
+    provider = OllamaProvider({"base_url": "http://localhost:11434", "model": "llama2"}, client=mock_httpx_client)
+    chunks = [chunk async for chunk in provider.generate_response_stream("Test prompt")]
+
+    assert chunks == ["Hello", " world"]
+    stream_response.raise_for_status.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_providers_share_http_client():
+    """Test that providers built without a client reuse one pooled client."""
+    ollama = OllamaProvider({"model": "llama2"})
+    openrouter = OpenRouterProvider({"api_key": "test_key"})
+
+    assert ollama.client is openrouter.client is get_http_client()
+
+    await close_http_client()
+    assert ollama.client.is_closed
+    assert get_http_client() is not ollama.client
+    await close_http_client()
+
+@pytest.mark.asyncio
+async def test_ollama_provider_health_check(mock_httpx_client):
+    """Test OllamaProvider's health_check probes the model listing and reports failures as unhealthy."""
+    mock_httpx_client.get.return_value = MagicMock()
+    provider = OllamaProvider({"base_url": "http://localhost:11434", "model": "llama2"}, client=mock_httpx_client)
+
+    assert await provider.health_check() is True
+    mock_httpx_client.get.assert_called_once_with("http://localhost:11434/api/tags")
+
+    mock_httpx_client.get.side_effect = httpx.ConnectError("Connection refused")
+    assert await provider.health_check() is False
+
+@pytest.mark.asyncio
+async def test_openrouter_provider_health_check(mock_httpx_client):
+    """Test OpenRouterProvider's health_check checks the API key and reports rejections as unhealthy."""
+    mock_response = MagicMock()
+    mock_httpx_client.get.return_value = mock_response
+    provider = OpenRouterProvider({"api_key": "test_key"}, client=mock_httpx_client)
+
+    assert await provider.health_check() is True
+    mock_httpx_client.get.assert_called_once_with(
+        "https://openrouter.ai/api/v1/auth/key",
+        headers={"Authorization": "Bearer test_key"},
+    )
+
+    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        message="Unauthorized", request=httpx.Request("GET", "url"), response=httpx.Response(401)
+    )
+    assert await provider.health_check() is False
@@ -25,8 +25,7 @@ def mock_openrouter_provider():
 @pytest.fixture
 def mock_response_validator():
     mock = MagicMock(spec=ResponseValidator)
-    mock.validate_response.return_value = True
-    mock.clean_response.side_effect = lambda x: x # Return as is for cleaning
+    mock.clean_and_validate.side_effect = lambda x: x # Return as is for cleaning
     return mock
 
 @pytest.fixture
@@ -44,7 +43,7 @@ def mock_response_validator_and_prompt_manager(mock_response_validator, mock_pro
 def mock_llm_providers(mock_ollama_provider, mock_openrouter_provider):
     """Mock the actual provider classes in the factory."""
     with patch.object(LLMServiceFactory, 'create_llm_service') as mock_create_llm_service:
-        def side_effect(provider_name, config):
+        def side_effect(provider_name, config, client=None):
             if provider_name == "ollama":
                 return mock_ollama_provider
             elif provider_name == "openrouter":
@@ -90,8 +89,7 @@ async def test_llm_service_factory_generate_response_ollama(mock_ollama_provider
     response = await factory.generate_response("Test prompt")
     
     mock_ollama_provider.generate_response.assert_called_once_with("Test prompt")
-    mock_response_validator.validate_response.assert_called_once_with("Ollama response")
-    mock_response_validator.clean_response.assert_called_once_with("Ollama response")
+    mock_response_validator.clean_and_validate.assert_called_once_with("Ollama response")
     assert response == "Ollama response"
 
 @pytest.mark.asyncio
@@ -103,14 +101,13 @@ async def test_llm_service_factory_generate_response_openrouter(mock_openrouter_
     response = await factory.generate_response("Test prompt")
     
     mock_openrouter_provider.generate_response.assert_called_once_with("Test prompt")
-    mock_response_validator.validate_response.assert_called_once_with("OpenRouter response")
-    mock_response_validator.clean_response.assert_called_once_with("OpenRouter response")
+    mock_response_validator.clean_and_validate.assert_called_once_with("OpenRouter response")
     assert response == "OpenRouter response"
 
 @pytest.mark.asyncio
 async def test_llm_service_factory_validation_failure(mock_ollama_provider, mock_response_validator):
     """Test LLMServiceFactory handles response validation failure."""
-    mock_response_validator.validate_response.return_value = False
+    mock_response_validator.clean_and_validate.side_effect = ValueError("LLM response failed validation.")
     config = {"provider": "ollama", "ollama": {"model": "llama2"}}
     factory = LLMServiceFactory(config, prompt_manager=mock_prompt_manager, response_validator=mock_response_validator)
     
@@ -118,5 +115,24 @@ async def test_llm_service_factory_validation_failure(mock_ollama_provider, mock
         await factory.generate_response("Test prompt")
     
     mock_ollama_provider.generate_response.assert_called_once_with("Test prompt")
-    mock_response_validator.validate_response.assert_called_once_with("Ollama response")
-    mock_response_validator.clean_response.assert_not_called()
+    mock_response_validator.clean_and_validate.assert_called_once_with("Ollama response")
+
+@pytest.mark.asyncio
+async def test_llm_service_factory_generate_batch(mock_ollama_provider, mock_response_validator):
+    """Test generate_batch validates and cleans every batched response."""
+    mock_ollama_provider.generate_batch = AsyncMock(return_value=["First", "Second"])
+    config = {"provider": "ollama", "ollama": {"model": "llama2"}}
+    factory = LLMServiceFactory(config, prompt_manager=mock_prompt_manager, response_validator=mock_response_validator)
+    
+    responses = await factory.generate_batch(["Prompt 1", "Prompt 2"])
+    
+    mock_ollama_provider.generate_batch.assert_called_once_with(["Prompt 1", "Prompt 2"], None)
+    assert mock_response_validator.clean_and_validate.call_count == 2
+    assert responses == ["First", "Second"]
+
+def test_get_provider_class_imports_lazily():
+    """Test that provider classes are resolved by name on demand."""
+    assert LLMServiceFactory.get_provider_class("ollama") is OllamaProvider
+    assert LLMServiceFactory.get_provider_class("openrouter") is OpenRouterProvider
+    with pytest.raises(ValueError, match="Unknown LLM provider: unknown"):
+        LLMServiceFactory.get_provider_class("unknown")
@@ -0,0 +1,34 @@
+"""
+Tests for application startup and shutdown.
+"""
+import logging
+from logging.handlers import QueueHandler
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_lifespan_removes_its_log_handler():
+    """Test that every startup installs one queue handler and shutdown removes it."""
+    root_logger = logging.getLogger()
+    handlers_before = list(root_logger.handlers)
+
+    for _ in range(2):
+        with TestClient(app):
+            queue_handlers = [handler for handler in root_logger.handlers if isinstance(handler, QueueHandler)]
+            assert queue_handlers == [app.state.log_handler]
+        assert root_logger.handlers == handlers_before
+
+
+def test_status_reports_llm_health():
+    """Test that the status endpoint reports the provider health probe result."""
+    with TestClient(app) as client:
+        provider = client.app.state.llm_factory.provider
+        with patch.object(provider, "health_check", AsyncMock(return_value=True)) as health_check:
+            response = client.get("/api/status")
+
+    assert response.status_code == 200
+    assert response.json()["llm"]["health_status"] == "healthy"
+    health_check.assert_awaited_once()
@@ -0,0 +1,192 @@
+"""
+Unit tests for the MessageRouter.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.agents.message_router import MessageRouter
+from app.agents.interfaces import ConversationContext, Message
+from app.services.base_llm_service import LLMService
+
+def make_agent(agent_id, side_effect=None):
+    """Create a mock agent with an async process_message."""
+    agent = MagicMock()
+    agent.agent_id = agent_id
+    agent.process_message = AsyncMock(side_effect=side_effect)
+    return agent
+
+@pytest.fixture
+def conversation():
+    """Fixture to create a mock Conversation."""
+    mock = MagicMock()
+    mock.id = "conv1"
+    return mock
+
+@pytest.mark.asyncio
+async def test_broadcast_to_agents_runs_concurrently(conversation):
+    """Test that all agents receive the message concurrently."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_process(message):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    agents = [make_agent(f"agent{i}", side_effect=slow_process) for i in range(3)]
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(return_value=agents)
+    router = MessageRouter(conversation_manager)
+
+    await router.broadcast_to_agents(Message(sender="user", content="Hello"), conversation)
+
+    assert peak == 3
+    for agent in agents:
+        agent.process_message.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_broadcast_to_other_agents_skips_sender_and_survives_failures(conversation):
+    """Test that the sender is skipped and one failing agent doesn't stop the others."""
+    sender = make_agent("agent0")
+    failing = make_agent("agent1", side_effect=RuntimeError("boom"))
+    healthy = make_agent("agent2")
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(return_value=[sender, failing, healthy])
+    router = MessageRouter(conversation_manager)
+
+    await router.broadcast_to_other_agents(Message(sender="agent0", content="Hi"), conversation)
+
+    sender.process_message.assert_not_awaited()
+    failing.process_message.assert_awaited_once()
+    healthy.process_message.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_broadcast_respects_max_concurrency(conversation):
+    """Test that no more than max_concurrency agents are processed at once."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_process(message):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    agents = [make_agent(f"agent{i}", side_effect=slow_process) for i in range(5)]
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(return_value=agents)
+    router = MessageRouter(conversation_manager, max_concurrency=2)
+
+    await router.broadcast_to_agents(Message(sender="user", content="Hello"), conversation)
+
+    assert peak == 2
+    for agent in agents:
+        agent.process_message.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_generate_turn_batches_prompts(conversation):
+    """Test that all agents' prompts for a turn go out in one batch call."""
+    llm_service = MagicMock()
+    llm_service.generate_batch = AsyncMock(return_value=["first", "second"])
+    agents = [make_agent("agent0"), make_agent("agent1")]
+    for agent in agents:
+        agent.llm_service = llm_service
+        agent.build_prompt = MagicMock(return_value=f"prompt for {agent.agent_id}")
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(return_value=agents)
+    router = MessageRouter(conversation_manager)
+    context = ConversationContext(conversation_history=[], current_goal="Test goal")
+
+    results = await router.generate_turn(context, conversation)
+
+    llm_service.generate_batch.assert_awaited_once_with(["prompt for agent0", "prompt for agent1"], router._sem)
+    assert results == [(agents[0], "first"), (agents[1], "second")]
+
+@pytest.mark.asyncio
+async def test_generate_turn_bounds_each_request(conversation):
+    """Test that the batch fallback holds the router semaphore per prompt, not per batch."""
+    in_flight = 0
+    peak = 0
+
+    class SlowService(LLMService):
+        async def generate_response(self, prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"reply to {prompt}"
+
+    llm_service = SlowService(config={})
+    agents = [make_agent(f"agent{i}") for i in range(4)]
+    for agent in agents:
+        agent.llm_service = llm_service
+        agent.build_prompt = MagicMock(return_value=agent.agent_id)
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(return_value=agents)
+    router = MessageRouter(conversation_manager, max_concurrency=2)
+    context = ConversationContext(conversation_history=[], current_goal="Test goal")
+
+    results = await router.generate_turn(context, conversation)
+
+    assert peak == 2
+    assert [response for _, response in results] == [f"reply to agent{i}" for i in range(4)]
+
+def test_get_recipients_caches_roster_until_invalidated():
+    """Test that recipient lists are built once per roster and dropped when invalidated."""
+    agents = [make_agent("agent0"), make_agent("agent1"), make_agent("agent2")]
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(return_value=agents)
+    router = MessageRouter(conversation_manager)
+
+    assert router.get_recipients("conv1") == tuple(agents)
+    cached = router._recipients_by_sender["conv1"]
+    assert router.get_recipients("conv1", "agent1") == (agents[0], agents[2])
+    assert router.get_recipients("conv1", "user") == tuple(agents)
+    assert router._recipients_by_sender["conv1"] is cached
+
+    router.invalidate_recipients("conv1")
+    assert "conv1" not in router._recipients_by_sender
+
+def test_get_recipients_follows_roster_changes():
+    """Test that an agent joining or leaving rebuilds the recipient lists."""
+    agents = [make_agent("agent0"), make_agent("agent1")]
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(side_effect=lambda _: agents)
+    router = MessageRouter(conversation_manager)
+
+    assert router.get_recipients("conv1", "agent0") == (agents[1],)
+    agents.append(make_agent("agent2"))
+    assert router.get_recipients("conv1", "agent0") == (agents[1], agents[2])
+    agents.pop(1)
+    assert router.get_recipients("conv1", "agent0") == (agents[1],)
+
+def test_recipient_cache_is_bounded():
+    """Test that the oldest conversation is evicted once the cache is full."""
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(return_value=[make_agent("agent0")])
+    router = MessageRouter(conversation_manager, max_cached_conversations=2)
+
+    for conversation_id in ("conv1", "conv2", "conv3"):
+        router.get_recipients(conversation_id)
+
+    assert list(router._recipients_by_sender) == ["conv2", "conv3"]
+
+@pytest.mark.asyncio
+async def test_route_message_targets(conversation):
+    """Test that user messages reach all agents and agent messages skip the sender."""
+    agents = [make_agent("agent0"), make_agent("agent1")]
+    conversation_manager = MagicMock()
+    conversation_manager.get_agents_in_conversation = MagicMock(return_value=agents)
+    router = MessageRouter(conversation_manager)
+
+    await router.route_message(Message(sender="user", content="Hello"), conversation)
+    assert all(agent.process_message.await_count == 1 for agent in agents)
+
+    await router.route_message(Message(sender="agent0", content="Hi"), conversation)
+    assert agents[0].process_message.await_count == 1
+    assert agents[1].process_message.await_count == 2
@@ -32,3 +32,10 @@ def test_clean_response_no_change():
     cleaned = validator.clean_response("Hello, World!")
     assert cleaned == "Hello, World!"
 
+def test_clean_and_validate():
+    """Test that clean_and_validate strips valid responses and rejects blank ones."""
+    validator = ResponseValidator()
+    assert validator.clean_and_validate("  Hello, World!  \n") == "Hello, World!"
+    for blank in ("", "   \n\t ", None):
+        with pytest.raises(ValueError, match="LLM response failed validation."):
+            validator.clean_and_validate(blank)
@@ -0,0 +1,79 @@
+"""
+Unit tests for API response schemas.
+"""
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from app.models import ConversationStatus, MessageType, SenderType
+from app.schemas import ConversationDetail, ConversationUpdate, MessageCreate, MessageResponse, WebSocketMessage
+
+
+def make_message(conversation_id):
+    """Create an ORM-like message."""
+    return SimpleNamespace(
+        id=uuid.uuid4(), conversation_id=conversation_id, sender_type=SenderType.AGENT,
+        sender_id="project_manager", content="What is the budget?", message_type=MessageType.QUESTION_TO_USER,
+        parent_message_id=None, requires_user_response=True, created_at=datetime(2024, 1, 1, 12, 0),
+        agent_name="Alex PM", is_from_agent=True, is_from_user=False, is_question_for_user=True
+    )
+
+
+def make_conversation():
+    """Create an ORM-like conversation with one message."""
+    conversation_id = uuid.uuid4()
+    return SimpleNamespace(
+        id=conversation_id, goal_description="Design a mobile banking app", status=ConversationStatus.PAUSED,
+        final_summary=None, created_at=datetime(2024, 1, 1, 11, 0), updated_at=datetime(2024, 1, 1, 12, 0),
+        message_count=1, is_waiting_for_user=True, messages=[make_message(conversation_id)]
+    )
+
+
+def test_message_from_orm_fast_matches_validation():
+    """Test that the unvalidated fast path serializes like model_validate."""
+    message = make_message(uuid.uuid4())
+
+    fast = MessageResponse.from_orm_fast(message)
+    validated = MessageResponse.model_validate(message)
+
+    assert fast.model_dump(mode="json") == validated.model_dump(mode="json")
+
+
+def test_conversation_detail_from_orm_fast_matches_validation():
+    """Test that detailed conversations serialize like model_validate, with and without messages."""
+    conversation = make_conversation()
+
+    fast = ConversationDetail.from_orm_fast(conversation)
+    validated = ConversationDetail.model_validate(conversation)
+
+    assert fast.model_dump(mode="json") == validated.model_dump(mode="json")
+    assert ConversationDetail.from_orm_fast(conversation, include_messages=False).messages == []
+
+
+def test_literal_fields_accept_strings_and_enum_members():
+    """Test that enum-backed fields validate to plain strings from either input."""
+    from_strings = MessageCreate(sender_type="user", sender_id="user", content="Hi", message_type="user_response")
+    from_enums = MessageCreate(
+        sender_type=SenderType.USER, sender_id="user", content="Hi", message_type=MessageType.USER_RESPONSE
+    )
+
+    assert from_strings.model_dump() == from_enums.model_dump()
+    assert type(from_enums.sender_type) is str
+    assert ConversationUpdate(status=ConversationStatus.COMPLETED).status == "completed"
+
+    with pytest.raises(ValidationError):
+        ConversationUpdate(status="archived")
+
+
+def test_websocket_message_timestamp_is_epoch_seconds():
+    """Test that WebSocket messages are stamped with a float epoch time."""
+    before = time.time()
+    message = WebSocketMessage(type="ping", conversation_id=uuid.uuid4(), data={})
+
+    assert isinstance(message.timestamp, float)
+    assert before <= message.timestamp <= time.time()
+    assert isinstance(message.model_dump(mode="json")["timestamp"], float)
@@ -0,0 +1,47 @@
+"""
+Unit tests for pre-serialized JSON responses.
+"""
+import json
+
+from unittest.mock import MagicMock
+
+from app.api.static_response import StaticJSON
+
+
+def make_request(headers=None):
+    """Create a mock request with the given headers."""
+    request = MagicMock()
+    request.headers = headers or {}
+    return request
+
+
+def test_response_serves_payload_with_etag():
+    """Test that the payload is served with its ETag and cache headers."""
+    static = StaticJSON({"name": "chat", "count": 2})
+
+    response = static.response(make_request())
+
+    assert response.status_code == 200
+    assert json.loads(response.body) == {"name": "chat", "count": 2}
+    assert response.headers["etag"] == static.etag
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+
+def test_matching_if_none_match_returns_not_modified():
+    """Test that a client holding the current payload gets an empty 304."""
+    static = StaticJSON({"name": "chat"})
+
+    for header in (static.etag, f"W/{static.etag}", f'"stale", {static.etag}', "*"):
+        response = static.response(make_request({"if-none-match": header}))
+        assert response.status_code == 304
+        assert response.body == b""
+
+
+def test_stale_if_none_match_returns_payload():
+    """Test that a client holding an older payload gets the full body."""
+    static = StaticJSON({"name": "chat"}, cache_control="no-cache")
+
+    response = static.response(make_request({"if-none-match": StaticJSON({"name": "old"}).etag}))
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-cache"
@@ -0,0 +1,152 @@
+"""
+Unit tests for the WebSocket connection manager.
+"""
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.api.websockets import ConnectionManager, broadcast_agent_activity, manager as global_manager
+
+
+def make_websocket():
+    """Create a mock WebSocket connection."""
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    return websocket
+
+
+@pytest.mark.asyncio
+async def test_broadcast_sends_same_payload_to_all_connections():
+    """Test that a broadcast is serialized once and reaches every connection."""
+    manager = ConnectionManager()
+    first, second = make_websocket(), make_websocket()
+    await manager.connect(first, "conv-1")
+    await manager.connect(second, "conv-1")
+
+    await manager.broadcast_to_conversation({"type": "new_message", "data": {"content": "Hi"}}, "conv-1")
+
+    first_payload = first.send_text.await_args.args[0]
+    second_payload = second.send_text.await_args.args[0]
+    assert first_payload == second_payload
+    assert '"type":"new_message"' in first_payload
+
+
+@pytest.mark.asyncio
+async def test_broadcast_disconnects_failed_connections():
+    """Test that connections whose send fails are removed."""
+    manager = ConnectionManager()
+    healthy, broken = make_websocket(), make_websocket()
+    await manager.connect(healthy, "conv-1")
+    await manager.connect(broken, "conv-1")
+    broken.send_text.side_effect = RuntimeError("connection closed")
+
+    await manager.broadcast_to_conversation({"type": "status_change"}, "conv-1")
+
+    assert manager.get_connection_count("conv-1") == 1
+    healthy.send_text.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_coalesces_messages_into_batches():
+    """Test that queued messages are flushed together as one batch frame."""
+    manager = ConnectionManager()
+    websocket = make_websocket()
+    await manager.connect(websocket, "conv-1")
+    websocket.send_text.reset_mock()
+
+    for i in range(3):
+        manager.enqueue({"type": "agent_response_chunk", "content": str(i)}, "conv-1")
+    await manager._flush_tasks["conv-1"]
+
+    websocket.send_text.assert_awaited_once()
+    payload = json.loads(websocket.send_text.await_args.args[0])
+    assert payload["type"] == "batch"
+    assert [item["content"] for item in payload["items"]] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_respects_max_batch_size():
+    """Test that large bursts are split into batches of max_batch_size."""
+    manager = ConnectionManager()
+    manager.max_batch_size = 2
+    websocket = make_websocket()
+    await manager.connect(websocket, "conv-1")
+    websocket.send_text.reset_mock()
+
+    for i in range(3):
+        manager.enqueue({"type": "new_message", "content": str(i)}, "conv-1")
+    await manager._flush_tasks["conv-1"]
+
+    payloads = [json.loads(call.args[0]) for call in websocket.send_text.await_args_list]
+    assert payloads[0]["type"] == "batch"
+    assert len(payloads[0]["items"]) == 2
+    assert payloads[1] == {"type": "new_message", "content": "2"}
+    assert "conv-1" not in manager._flush_tasks
+
+
+@pytest.mark.asyncio
+async def test_broadcast_helpers_encode_valid_json():
+    """Test that the templated broadcast helpers produce well-formed messages."""
+    websocket = make_websocket()
+    await global_manager.connect(websocket, "conv-2")
+    websocket.send_text.reset_mock()
+
+    try:
+        await broadcast_agent_activity("conv-2", "agent-\"1\"", "thinking")
+        await global_manager._flush_tasks["conv-2"]
+    finally:
+        global_manager.disconnect(websocket, "conv-2")
+
+    payload = json.loads(websocket.send_text.await_args.args[0])
+    assert payload == {
+        "type": "agent_activity",
+        "conversation_id": "conv-2",
+        "agent_id": "agent-\"1\"",
+        "activity": "thinking"
+    }
+
+
+async def stream(*chunks):
+    """Yield the given chunks as an async stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_stream_response_sends_validated_content_on_complete():
+    """Test that chunks are relayed raw and the complete frame carries the cleaned response."""
+    manager = ConnectionManager()
+    websocket = make_websocket()
+    await manager.connect(websocket, "conv-1")
+    websocket.send_text.reset_mock()
+
+    content = await manager.stream_response("conv-1", "agent-1", stream(" Hel", "lo "), validate=str.strip)
+    await manager._flush_tasks["conv-1"]
+
+    payload = json.loads(websocket.send_text.await_args.args[0])
+    assert content == "Hello"
+    assert [item["type"] for item in payload["items"]] == [
+        "agent_response_chunk", "agent_response_chunk", "agent_response_complete"
+    ]
+    assert payload["items"][-1]["content"] == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_stream_response_reports_invalid_content():
+    """Test that an invalid response ends with a failure frame instead of a complete frame."""
+    manager = ConnectionManager()
+    websocket = make_websocket()
+    await manager.connect(websocket, "conv-1")
+    websocket.send_text.reset_mock()
+
+    def reject(content):
+        raise ValueError("LLM response failed validation.")
+
+    with pytest.raises(ValueError):
+        await manager.stream_response("conv-1", "agent-1", stream("  "), validate=reject)
+    await manager._flush_tasks["conv-1"]
+
+    payload = json.loads(websocket.send_text.await_args.args[0])
+    assert [item["type"] for item in payload["items"]] == ["agent_response_chunk", "agent_response_failed"]